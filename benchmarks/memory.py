@@ -0,0 +1,73 @@
+"""
+Peak memory of `portan.Analytics` built from an in-memory `pd.DataFrame`
+and from a memory-mapped `.npy` price panel of the same size
+
+    python benchmarks/memory.py --rows 100000 --assets 200
+"""
+
+import os
+import time
+import argparse
+import tempfile
+import tracemalloc
+import numpy as np
+import pandas as pd
+from portan import Analytics
+
+
+def measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    portfolio = build()
+    portfolio.sharpe()
+    portfolio.maximum_drawdown()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak, elapsed
+
+
+def main(rows, assets, chunk_size):
+    index = pd.bdate_range("1980-01-01", periods=rows, name="Date")
+    weights = np.full(assets, 1 / assets)
+    path = os.path.join(tempfile.mkdtemp(), "prices.npy")
+
+    array = np.lib.format.open_memmap(path, mode="w+", shape=(rows, assets))
+    rng = np.random.default_rng(0)
+    for start in range(0, rows, 10000):
+        stop = min(start + 10000, rows)
+        array[start:stop] = 1 + rng.normal(0.0003, 0.01, (stop - start, assets))
+    np.cumprod(array, axis=0, out=array)
+    array.flush()
+    del array
+
+    panel_size = rows * assets * 8 / 2**20
+    print(f"Price panel: {rows} x {assets} ({panel_size:.0f} MB)")
+
+    def in_memory():
+        prices = pd.DataFrame(np.load(path), index=index)
+        return Analytics(prices=prices, weights=weights, fetch_info=False)
+
+    def memory_mapped():
+        return Analytics(
+            prices=np.load(path, mmap_mode="r"),
+            index=index,
+            weights=weights,
+            fetch_info=False,
+            chunk_size=chunk_size,
+        )
+
+    for label, build in [("pd.DataFrame", in_memory), ("np.memmap", memory_mapped)]:
+        peak, elapsed = measure(build)
+        print(f"{label:>14}: peak {peak / 2**20:8.1f} MB, {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--assets", type=int, default=200)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    arguments = parser.parse_args()
+
+    main(arguments.rows, arguments.assets, arguments.chunk_size)
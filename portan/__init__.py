@@ -5,7 +5,14 @@ Portfolio analytics and reporting toolset in Python
 """
 
 from portan.analytics import Analytics
-from portan.get_data import GetData
+from portan.batch import BatchAnalytics
+from portan.rendering import render_figures
+from portan.report import Report, tearsheet
+from portan.bootstrap import bootstrap
+from portan.simulation import monte_carlo_var
+from portan.rebalancing import rebalance
+from portan.get_data import GetData, YahooSource, get_info
+from portan.cache import PriceCache
 from portan.interesting_periods import PERIODS
 from portan.portfolios import TICKERS, WEIGHTS
 from portan.utilities import *
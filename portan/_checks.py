@@ -8,9 +8,12 @@ give warnings if neccesary.
 import numpy as np
 import pandas as pd
 import warnings
+import os
 import numbers
 from datetime import datetime
 from portan.get_data import GetData
+from portan.cache import PriceCache
+from portan import _stats
 
 
 def _check_init(
@@ -27,8 +30,15 @@ def _check_init(
     start,
     end,
     interval,
+    cache=None,
+    index=None,
+    chunk_size=None,
+    validate="full",
     **kwargs,
 ):
+    if validate not in ["full", "fast", "none"]:
+        raise ValueError("`validate` should be `full`, `fast` or `none`")
+
     if isinstance(tickers, (pd.DataFrame, pd.Series)):
         tickers = tickers[0].values.tolist()
     elif isinstance(tickers, np.ndarray):
@@ -40,12 +50,11 @@ def _check_init(
             "`tickers` should be of type `list`, `np.ndarray`, `pd.DataFrame`, `pd.Series` or `NoneType`"
         )
 
+    prices = _check_array_prices(prices, index, "prices")
     if not isinstance(prices, (list, np.ndarray, pd.DataFrame, pd.Series, type(None))):
         raise ValueError(
-            "`prices` should be of type `list`, `np.ndarray`, `pd.DataFrame`, `pd.Series` or `NoneType`"
+            "`prices` should be of type `list`, `np.ndarray`, `pyarrow.Table`, `pd.DataFrame`, `pd.Series` or `NoneType`"
         )
-    if isinstance(prices, (list, np.ndarray)):
-        prices = pd.DataFrame(prices)
 
     if isinstance(weights, (pd.DataFrame, pd.Series)):
         weights = weights.to_numpy()
@@ -69,14 +78,13 @@ def _check_init(
             "`benchmark_tickers` should be of type `list`, `np.ndarray`, `pd.DataFrame`, `pd.Series` or `NoneType`"
         )
 
+    benchmark_prices = _check_array_prices(benchmark_prices, index, "benchmark_prices")
     if not isinstance(
         benchmark_prices, (list, np.ndarray, pd.DataFrame, pd.Series, type(None))
     ):
         raise ValueError(
-            "`benchmark_prices` should be of type `list`, `np.ndarray`, `pd.DataFrame`, `pd.Series` or `NoneType`"
+            "`benchmark_prices` should be of type `list`, `np.ndarray`, `pyarrow.Table`, `pd.DataFrame`, `pd.Series` or `NoneType`"
         )
-    if isinstance(benchmark_prices, (list, np.ndarray)):
-        benchmark_prices = pd.DataFrame(benchmark_prices)
 
     if isinstance(benchmark_weights, (pd.DataFrame, pd.Series)):
         benchmark_weights = benchmark_weights.to_numpy()
@@ -108,6 +116,7 @@ def _check_init(
     if weights is None:
         raise ValueError("Portfolio weights are not provided.")
 
+    downloaded_benchmark_prices = None
     if tickers is None and prices is None:
         raise ValueError("Provide either `tickers` or `prices` argument.")
     elif tickers is not None and prices is not None:
@@ -115,7 +124,15 @@ def _check_init(
             "Both `tickers` and `prices` arguments were provided. Provide only one to avoid clashes. If only `prices` is provided, tickers will be inferred from column names"
         )
     elif tickers is not None and prices is None:
-        prices = GetData(tickers, start, end, interval, **kwargs).close
+        if benchmark_tickers is not None and benchmark_prices is None:
+            # Portfolio and benchmark assets are downloaded concurrently in one batch
+            prices, downloaded_benchmark_prices = _download_prices(
+                [tickers, benchmark_tickers], start, end, interval, cache, **kwargs
+            )
+        else:
+            (prices,) = _download_prices(
+                [tickers], start, end, interval, cache, **kwargs
+            )
 
     if prices.shape[1] != weights.shape[0]:
         raise ValueError(
@@ -127,20 +144,7 @@ def _check_init(
             "Your portfolio contains only one asset, check if this is intended"
         )
 
-    if np.any(np.isnan(prices.fillna(method="bfill"))):
-        raise ValueError(
-            "`prices` contains `NaN` values. Use `fill_nan()` from `utilities` module to interpolate these."
-        )
-    if np.any(np.isnan(prices.fillna(method="ffill"))):
-        prices = prices.fillna(method="ffill").dropna()
-        warnings.warn(
-            "Leading rows containing `NaN` values were removed. This is likely due to different assets being listed for different periods of time. Alternatively, you can interpolate those values using `fill_nan()` function or change `start` and `end` arguments if providing `tickers`, or provide a specific `prices` dataframe"
-        )
-
-    if np.any(np.isinf(prices)):
-        raise ValueError(
-            "`prices` contains `inf` values. Use `fill_inf()` from `utilities` module to interpolate these."
-        )
+    prices = _check_price_values(prices, "prices", validate, chunk_size)
 
     if (
         benchmark_tickers is None
@@ -165,9 +169,12 @@ def _check_init(
                 "Both `benchmark_tickers` and `benchmark_prices` arguments were provided. Provide only one to avoid clashes. If only `benchmark_prices` is provided, tickers will be inferred from column names"
             )
         if benchmark_tickers is not None and benchmark_prices is None:
-            benchmark_prices = GetData(
-                benchmark_tickers, start, end, interval, **kwargs
-            ).close
+            if downloaded_benchmark_prices is not None:
+                benchmark_prices = downloaded_benchmark_prices
+            else:
+                benchmark_prices = _download_prices(
+                    [benchmark_tickers], start, end, interval, cache, **kwargs
+                )[0]
 
         if benchmark_weights is None:
             if benchmark_tickers.shape[0] == 1 or benchmark_prices.shape[1] == 1:
@@ -182,20 +189,9 @@ def _check_init(
                 "Number of benchmark asset prices doesn't match the number of benchmark weights provided"
             )
 
-        if np.any(np.isnan(benchmark_prices.fillna(method="bfill"))):
-            raise ValueError(
-                "`benchmark_prices` contains `NaN` values. Use `fill_nan()` from `utilities` module to interpolate these."
-            )
-        if np.any(np.isnan(benchmark_prices.fillna(method="ffill"))):
-            benchmark_prices = benchmark_prices.fillna(method="ffill").dropna()
-            warnings.warn(
-                "Leading rows containing `NaN` values were removed. This is likely due to different assets being listed for different periods of time. Alternatively, you can interpolate those values using `fill_nan()` function or change `start` and `end` arguments if providing `tickers`, or provide a specific `benchmark_prices` dataframe"
-            )
-
-        if np.any(np.isinf(benchmark_prices)):
-            raise ValueError(
-                "`benchmark_prices` contains `inf` values. Use `fill_inf()` from `utilities` module to interpolate these."
-            )
+        benchmark_prices = _check_price_values(
+            benchmark_prices, "benchmark_prices", validate, chunk_size
+        )
 
         if benchmark_prices is not None:
             if prices.shape[0] != benchmark_prices.shape[0]:
@@ -212,6 +208,126 @@ def _check_init(
         return prices, weights, benchmark_prices, benchmark_weights
 
 
+def _check_array_prices(prices, index, name):
+    # Arrays (including `np.memmap`) are wrapped without copying them. Arrow
+    # tables are converted column by column, zero-copy where possible
+    if hasattr(prices, "to_pandas") and not isinstance(
+        prices, (pd.DataFrame, pd.Series)
+    ):
+        prices = prices.to_pandas(split_blocks=True)
+        if index is not None:
+            if len(index) != prices.shape[0]:
+                raise ValueError(f"Length of `index` doesn't match `{name}`")
+            prices.index = pd.Index(index)
+    elif isinstance(prices, (list, np.ndarray)):
+        if index is not None and len(index) != len(prices):
+            raise ValueError(f"Length of `index` doesn't match `{name}`")
+        prices = pd.DataFrame(prices, index=index, copy=False)
+    elif index is not None and isinstance(prices, (pd.DataFrame, pd.Series)):
+        raise ValueError(
+            "`index` should be provided only with `np.ndarray`, `list` or `pyarrow.Table` prices"
+        )
+
+    return prices
+
+
+def _check_price_values(prices, name, validate="full", chunk_size=None):
+    """
+    Checks prices for `NaN` and `inf` values. `validate="full"` scans each asset,
+    `validate="fast"` only sums each chunk (a sum is finite only if all prices
+    are) and scans each asset only if the sum isn't finite, and `validate="none"`
+    skips the check for data that is known to be clean
+    """
+
+    if validate == "none":
+        return prices
+    if validate == "fast" and _finite_prices(prices, chunk_size):
+        return prices
+
+    first_valid, last_valid, infinite = _scan_prices(prices, chunk_size)
+    # `NaN` values without a valid value below them (bfill) or above them (ffill)
+    if np.any(last_valid < prices.shape[0] - 1):
+        raise ValueError(
+            f"`{name}` contains `NaN` values. Use `fill_nan()` from `utilities` module to interpolate these."
+        )
+    if np.any(first_valid > 0):
+        prices = prices.fillna(method="ffill").dropna()
+        warnings.warn(
+            f"Leading rows containing `NaN` values were removed. This is likely due to different assets being listed for different periods of time. Alternatively, you can interpolate those values using `fill_nan()` function or change `start` and `end` arguments if providing `tickers`, or provide a specific `{name}` dataframe"
+        )
+    if infinite:
+        raise ValueError(
+            f"`{name}` contains `inf` values. Use `fill_inf()` from `utilities` module to interpolate these."
+        )
+
+    return prices
+
+
+def _chunks(prices, chunk_size):
+    rows, columns = prices.shape
+    chunk_size = _stats.chunk_rows(columns, chunk_size)
+    for start in range(0, rows, chunk_size):
+        yield start, prices.iloc[start : start + chunk_size].to_numpy()
+
+
+def _finite_prices(prices, chunk_size=None):
+    # Sums don't allocate temporary arrays, unlike `np.isfinite()`. Sums of
+    # finite prices could overflow only beyond 1e300, where the full scan is
+    # used instead
+    for _, values in _chunks(prices, chunk_size):
+        if not np.isfinite(np.add.reduce(values, axis=None, dtype=np.float64)):
+            return False
+
+    return True
+
+
+def _scan_prices(prices, chunk_size=None):
+    """
+    Scans prices chunk by chunk without copying the whole array and returns
+    positions of the first and the last valid (not `NaN`) price of each asset
+    and whether prices contain `inf` values. Chunks with only finite prices
+    are checked in one sweep
+    """
+
+    rows, columns = prices.shape
+    first_valid = np.full(columns, rows)
+    last_valid = np.full(columns, -1)
+    infinite = False
+    for start, values in _chunks(prices, chunk_size):
+        finite = np.isfinite(values)
+        if finite.all():
+            first_valid = np.where(first_valid == rows, start, first_valid)
+            last_valid[:] = start + values.shape[0] - 1
+            continue
+
+        valid = ~np.isnan(values)
+        infinite = infinite or not np.array_equal(finite, valid)
+        found = valid.any(axis=0)
+        first_valid = np.where(
+            (first_valid == rows) & found, start + valid.argmax(axis=0), first_valid
+        )
+        last_valid = np.where(
+            found, start + values.shape[0] - 1 - valid[::-1].argmax(axis=0), last_valid
+        )
+
+    return first_valid, last_valid, infinite
+
+
+def _download_prices(groups, start, end, interval, cache, **kwargs):
+    union = list(dict.fromkeys(ticker for group in groups for ticker in group))
+    data = GetData(union, start, end, interval, cache, **kwargs)
+    if data.failed:
+        raise ValueError(
+            f"Prices of {list(data.failed.keys())} couldn't be downloaded. Reasons: {data.failed}"
+        )
+
+    close = data.close
+    if isinstance(close, pd.Series):
+        close = close.to_frame(union[0])
+
+    return [close[group].dropna(how="all") for group in groups]
+
+
 def _whether_to_set(
     slf_benchmark_prices,
     benchmark_tickers=None,
@@ -283,6 +399,8 @@ def _check_benchmark(
     start,
     end,
     interval,
+    cache=None,
+    **kwargs,
 ):
     if isinstance(benchmark_tickers, (pd.DataFrame, pd.Series)):
         benchmark_tickers = benchmark_tickers[0].values.tolist()
@@ -295,14 +413,13 @@ def _check_benchmark(
             "`benchmark_tickers` should be of type `list`, `np.ndarray`, `pd.DataFrame`, `pd.Series` or `NoneType`"
         )
 
+    benchmark_prices = _check_array_prices(benchmark_prices, None, "benchmark_prices")
     if not isinstance(
         benchmark_prices, (list, np.ndarray, pd.DataFrame, pd.Series, type(None))
     ):
         raise ValueError(
-            "`benchmark_prices` should be of type `list`, `np.ndarray`, `pd.DataFrame`, `pd.Series` or `NoneType`"
+            "`benchmark_prices` should be of type `list`, `np.ndarray`, `pyarrow.Table`, `pd.DataFrame`, `pd.Series` or `NoneType`"
         )
-    if isinstance(benchmark_prices, (list, np.ndarray)):
-        benchmark_prices = pd.DataFrame(benchmark_prices)
 
     if isinstance(benchmark_weights, (pd.DataFrame, pd.Series)):
         benchmark_weights = benchmark_weights.to_numpy()
@@ -332,7 +449,9 @@ def _check_benchmark(
                 "Both `benchmark_tickers` and `benchmark_prices` arguments were provided. Provide only one to avoid clashes. If only `benchmark_prices` is provided, tickers will be inferred from column names"
             )
         if benchmark_tickers is not None and benchmark_prices is None:
-            benchmark_prices = GetData(benchmark_tickers, start, end, interval).close
+            benchmark_prices = _download_prices(
+                [benchmark_tickers], start, end, interval, cache, **kwargs
+            )[0]
         if benchmark_weights is None:
             if benchmark_tickers.shape[0] == 1 or benchmark_prices.shape[1] == 1:
                 benchmark_weights = np.array([1])
@@ -345,20 +464,7 @@ def _check_benchmark(
                 "Number of benchmark asset prices doesn't match the number of benchmark weights provided"
             )
 
-        if np.any(np.isnan(benchmark_prices.fillna(method="bfill"))):
-            raise ValueError(
-                "`benchmark_prices` contains `NaN` values. Use `fill_nan()` from `utilities` module to interpolate these."
-            )
-        if np.any(np.isnan(benchmark_prices.fillna(method="ffill"))):
-            benchmark_prices = benchmark_prices.fillna(method="ffill").dropna()
-            warnings.warn(
-                "Leading rows containing `NaN` values were removed. This is likely due to different assets being listed for different periods of time. Alternatively, you can interpolate those values using `fill_nan()` function or change `start` and `end` arguments if providing `tickers`, or provide a specific `benchmark_prices` dataframe"
-            )
-
-        if np.any(np.isinf(benchmark_prices)):
-            raise ValueError(
-                "`benchmark_prices` contains `inf` values. Use `fill_inf()` from `utilities` module to interpolate these."
-            )
+        benchmark_prices = _check_price_values(benchmark_prices, "benchmark_prices")
 
         if benchmark_prices is not None:
             if prices.shape[0] != benchmark_prices.shape[0]:
@@ -379,16 +485,36 @@ def _check_benchmark(
 def _check_rate_arguments(
     annual_mar=None, annual_rfr=None, annual=None, compounding=None
 ):
-    if not isinstance(annual_mar, (numbers.Real, type(None))):
-        raise ValueError("`annual_mar` should be a real number")
-    if not isinstance(annual_rfr, (numbers.Real, type(None))):
-        raise ValueError("`annual_rfr` should be a real number")
+    if not isinstance(annual_mar, (numbers.Real, pd.Series, type(None))):
+        raise ValueError("`annual_mar` should be a real number or `pd.Series`")
+    if not isinstance(annual_rfr, (numbers.Real, pd.Series, type(None))):
+        raise ValueError("`annual_rfr` should be a real number or `pd.Series`")
     if not isinstance(annual, (bool, type(None))):
         raise ValueError("`annual` should be of type `bool`")
     if not isinstance(compounding, (bool, type(None))):
         raise ValueError("`compounding` should be of type `bool`")
 
 
+def _check_rate_series(rates, index):
+    if not rates.index.is_monotonic_increasing:
+        raise ValueError("Rate series should be sorted by its index")
+    try:
+        aligned = rates.reindex(index, method="ffill")
+    except (TypeError, ValueError):
+        raise ValueError(
+            "Rate series should be indexed like `returns` (e.g. by dates with the same timezone)"
+        )
+    aligned = aligned.to_numpy(dtype=float)
+    if np.any(np.isnan(aligned)):
+        raise ValueError(
+            "Rate series should have a value at or before the first observation of `returns`"
+        )
+    if np.any(~np.isfinite(aligned)) or np.any(aligned <= -1):
+        raise ValueError("Rate series should contain finite rates above -1")
+
+    return aligned
+
+
 def _check_plot_arguments(show, save):
     if not isinstance(show, bool):
         raise ValueError("`show` should be of type `bool`")
@@ -403,10 +529,6 @@ def _check_omega_multiple_returns(returns):
         )
     if isinstance(returns, (list, np.ndarray)):
         returns = pd.DataFrame(returns)
-    if returns.shape[1] == 1:
-        warnings.warn(
-            "Returns are provided for only one portfolio. Only one curve will be plotted."
-        )
     if np.any(np.isnan(returns)):
         raise ValueError(
             "`returns` contains `NaN` values. Use `fill_nan()` from `utilities` module to interpolate these."
@@ -415,6 +537,27 @@ def _check_omega_multiple_returns(returns):
     return returns
 
 
+def _check_omega_curves(curves):
+    if curves.shape[1] == 1:
+        warnings.warn(
+            "Returns are provided for only one portfolio. Only one curve will be plotted."
+        )
+
+
+def _check_rate_grid(name, values):
+    values = np.atleast_1d(np.asarray(values))
+    if values.ndim != 1 or values.shape[0] == 0:
+        raise ValueError(f"`{name}` should be a real number or a 1-D array of them")
+    if not np.issubdtype(values.dtype, np.number) or np.issubdtype(
+        values.dtype, np.complexfloating
+    ):
+        raise ValueError(f"`{name}` should be a real number or a 1-D array of them")
+    if not np.all(np.isfinite(values)):
+        raise ValueError(f"`{name}` shouldn't contain `NaN` or `inf` values")
+
+    return values.astype(float)
+
+
 def _check_array_lengths(array_one, array_two):
     if len(array_one) != len(array_two):
         warnings.warn(
@@ -422,6 +565,24 @@ def _check_array_lengths(array_one, array_two):
         )
 
 
+def _check_model_portfolios(tickers, weights):
+    if not isinstance(tickers, dict) or not isinstance(weights, dict):
+        raise ValueError(
+            "`tickers` and `weights` should be of type `dict`, keyed on portfolio names"
+        )
+    if list(tickers.keys()) != list(weights.keys()):
+        raise ValueError("`tickers` and `weights` should have the same portfolio names")
+    if len(tickers) == 0:
+        raise ValueError("`tickers` should contain at least one portfolio")
+    for name in tickers.keys():
+        if len(tickers[name]) != len(weights[name]):
+            raise ValueError(
+                f"Number of tickers of `{name}` doesn't match the number of its weights"
+            )
+        if not all(isinstance(weight, numbers.Real) for weight in weights[name]):
+            raise ValueError(f"Weights of `{name}` should be real numbers")
+
+
 def _check_periods(periods, state):
     if not isinstance(periods, int):
         raise ValueError("`periods` should be of type `int`")
@@ -435,6 +596,41 @@ def _check_periods(periods, state):
     return periods
 
 
+def _check_stress_periods(periods, index):
+    if not isinstance(periods, dict):
+        raise ValueError("`periods` should be of type `dict` of (start, end) tuples")
+    if not isinstance(index, pd.DatetimeIndex):
+        raise ValueError("Stress testing requires returns indexed by dates")
+    names = list(periods.keys())
+    try:
+        boundaries = pd.DatetimeIndex(
+            [date for name in names for date in periods[name]]
+        )
+    except (TypeError, ValueError):
+        raise ValueError("`periods` should be of type `dict` of (start, end) tuples")
+    if boundaries.shape[0] != 2 * len(names):
+        raise ValueError("`periods` should be of type `dict` of (start, end) tuples")
+    if index.tz is not None and boundaries.tz is None:
+        boundaries = boundaries.tz_localize(index.tz)
+    elif index.tz is None and boundaries.tz is not None:
+        boundaries = boundaries.tz_convert(None)
+
+    # Periods include their start and exclude their end. All boundaries are
+    # located with a single binary search over the sorted index
+    positions = index.searchsorted(boundaries, side="left")
+    starts, ends = positions[0::2], positions[1::2]
+    if np.any(boundaries[0::2] > boundaries[1::2]):
+        raise ValueError("Start of every period should precede its end")
+    # Periods that don't overlap the data are left out
+    covered = ends > starts
+
+    return (
+        [name for name, keep in zip(names, covered) if keep],
+        starts[covered],
+        ends[covered],
+    )
+
+
 def _check_mar_bounds(annual_mar_lower_bound, annual_mar_upper_bound):
     if not isinstance(annual_mar_lower_bound, (numbers.Real)):
         raise ValueError("`annual_mar_lower_bound` should be a real number")
@@ -446,6 +642,42 @@ def _check_mar_bounds(annual_mar_lower_bound, annual_mar_upper_bound):
         )
 
 
+def _check_sweep_arguments(
+    metrics, annual_rfr, annual_mar, moment, annual, compounding, processes=1
+):
+    if metrics is None:
+        metrics = _stats.SWEEP_METRICS
+    if isinstance(metrics, str):
+        metrics = [metrics]
+    if not isinstance(metrics, (list, tuple)):
+        raise ValueError("`metrics` should be of type `list` or `tuple`")
+    for metric in metrics:
+        if metric not in _stats.SWEEP_METRICS:
+            raise ValueError(
+                f"`{metric}` can't be swept. Available metrics are: {_stats.SWEEP_METRICS}"
+            )
+    _check_rate_arguments(annual=annual, compounding=compounding)
+
+    grids = [
+        _check_rate_grid("annual_rfr", annual_rfr),
+        _check_rate_grid("annual_mar", annual_mar),
+    ]
+
+    moment = np.atleast_1d(np.asarray(moment))
+    if (
+        moment.ndim != 1
+        or moment.shape[0] == 0
+        or not np.issubdtype(moment.dtype, np.integer)
+    ):
+        raise ValueError("`moment` should be an `int` or a 1-D array of them")
+    if np.any(moment < 1):
+        raise ValueError("`moment` should be positive")
+    if not isinstance(processes, int) or processes < 1:
+        raise ValueError("`processes` should be a positive `int`")
+
+    return list(metrics), grids[0], grids[1], moment.astype(np.int64)
+
+
 def _check_sharpe(adjusted, probabilistic):
     if adjusted and probabilistic:
         raise ValueError(
@@ -475,7 +707,7 @@ def _check_nonnegints(**kwargs):
             raise ValueError(f"`{name}` should be positive")
 
 
-def _check_get_data(tickers, start, end, interval):
+def _check_tickers(tickers):
     if not isinstance(tickers, list):
         if isinstance(tickers, np.ndarray):
             tickers = tickers.tolist()
@@ -486,6 +718,12 @@ def _check_get_data(tickers, start, end, interval):
                 "`tickers` should be of type `list`, `np.ndarray`, `pd.Series` or `pd.DataFrame`"
             )
 
+    return tickers
+
+
+def _check_get_data(tickers, start, end, interval):
+    tickers = _check_tickers(tickers)
+
     if not isinstance(start, (str, datetime, pd.Timestamp)):
         raise ValueError(
             "`start` should be of type `str`, `datetime` or `pd.Timestamp`"
@@ -498,3 +736,320 @@ def _check_get_data(tickers, start, end, interval):
         raise ValueError("`interval` should be of type `str`")
 
     return tickers
+
+
+def _check_cache(cache):
+    if isinstance(cache, str):
+        cache = PriceCache(cache)
+    elif not isinstance(cache, (PriceCache, type(None))):
+        raise ValueError(
+            "`cache` should be of type `portan.PriceCache`, `str` or `NoneType`"
+        )
+
+    return cache
+
+
+def _check_batch_weights(weights, names):
+    if isinstance(weights, (pd.DataFrame, pd.Series)):
+        if names is None and isinstance(weights, pd.DataFrame):
+            names = weights.index.tolist()
+        weights = weights.to_numpy()
+    elif isinstance(weights, list):
+        weights = np.array(weights)
+    elif isinstance(weights, np.ndarray):
+        pass
+    else:
+        raise ValueError(
+            "`weights` should be of type `list`, `np.ndarray`, `pd.DataFrame` or `pd.Series`"
+        )
+
+    if weights.ndim == 1:
+        weights = weights.reshape(1, -1)
+    if weights.ndim != 2:
+        raise ValueError("`weights` should be a 2-D matrix (portfolios x assets)")
+    if np.any(~np.isfinite(weights)):
+        raise ValueError("`weights` contains `NaN` or `inf` values")
+
+    if names is None:
+        names = [f"Portfolio {i}" for i in range(weights.shape[0])]
+    elif len(names) != weights.shape[0]:
+        raise ValueError(
+            "Number of portfolio names doesn't match the number of weights rows provided"
+        )
+
+    return weights.astype(float), list(names)
+
+
+def _check_window(window, observations):
+    if not isinstance(window, int):
+        raise ValueError("`window` should be of type `int`")
+    if window < 2:
+        raise ValueError("`window` should be at least 2")
+    if window > observations:
+        raise ValueError(
+            f"`window` is larger than the number of returns observations ({observations})"
+        )
+
+
+def _check_append(prices, slf_prices, benchmark_prices, slf_benchmark_prices):
+    if isinstance(prices, pd.Series):
+        prices = prices.to_frame().T
+    if isinstance(prices, (list, np.ndarray)):
+        prices = pd.DataFrame(np.atleast_2d(prices), columns=slf_prices.columns)
+    if not isinstance(prices, pd.DataFrame):
+        raise ValueError(
+            "`prices` should be of type `list`, `np.ndarray`, `pd.DataFrame` or `pd.Series`"
+        )
+    if prices.columns.tolist() != slf_prices.columns.tolist():
+        raise ValueError("`prices` columns should match the portfolio assets")
+    if prices.shape[0] == 0:
+        raise ValueError("`prices` doesn't contain any rows")
+    if isinstance(prices.index, pd.RangeIndex) and not isinstance(
+        slf_prices.index, pd.RangeIndex
+    ):
+        raise ValueError("`prices` should be indexed by dates")
+    if isinstance(slf_prices.index, pd.RangeIndex):
+        prices.index = pd.RangeIndex(
+            slf_prices.index[-1] + 1, slf_prices.index[-1] + 1 + prices.shape[0]
+        )
+    if (
+        not prices.index.is_monotonic_increasing
+        or prices.index[0] <= slf_prices.index[-1]
+    ):
+        raise ValueError(
+            "`prices` should be sorted and start after the last available observation"
+        )
+    if np.any(~np.isfinite(prices.to_numpy(dtype=float))):
+        raise ValueError(
+            "`prices` contains `NaN` or `inf` values. Use `fill_nan()` or `fill_inf()` from `utilities` module to interpolate these."
+        )
+
+    if slf_benchmark_prices is None:
+        if benchmark_prices is not None:
+            raise ValueError(
+                "Benchmark isn't set, so `benchmark_prices` cannot be appended"
+            )
+        return prices, benchmark_prices
+
+    if benchmark_prices is None:
+        raise ValueError(
+            "Benchmark is set, so `benchmark_prices` for the new rows should be provided"
+        )
+    if isinstance(benchmark_prices, pd.Series):
+        benchmark_prices = benchmark_prices.to_frame().T
+    if isinstance(benchmark_prices, (list, np.ndarray)):
+        benchmark_prices = pd.DataFrame(
+            np.atleast_2d(benchmark_prices),
+            index=prices.index,
+            columns=slf_benchmark_prices.columns,
+        )
+    if not isinstance(benchmark_prices, pd.DataFrame):
+        raise ValueError(
+            "`benchmark_prices` should be of type `list`, `np.ndarray`, `pd.DataFrame` or `pd.Series`"
+        )
+    if benchmark_prices.columns.tolist() != slf_benchmark_prices.columns.tolist():
+        raise ValueError("`benchmark_prices` columns should match the benchmark assets")
+    if isinstance(slf_prices.index, pd.RangeIndex):
+        benchmark_prices.index = prices.index
+    if not benchmark_prices.index.equals(prices.index):
+        raise ValueError("`prices` and `benchmark_prices` should have the same index")
+    if np.any(~np.isfinite(benchmark_prices.to_numpy(dtype=float))):
+        raise ValueError(
+            "`benchmark_prices` contains `NaN` or `inf` values. Use `fill_nan()` or `fill_inf()` from `utilities` module to interpolate these."
+        )
+
+    return prices, benchmark_prices
+
+
+def _check_bootstrap_arguments(
+    resamples,
+    method,
+    available_methods,
+    block_size,
+    observations,
+    ci,
+    batch_size,
+    processes,
+):
+    _check_posints(resamples=resamples)
+    if method not in available_methods:
+        raise ValueError(f"`method` should be one of {available_methods}")
+    if block_size is None:
+        block_size = max(1, round(observations ** (1 / 3)))
+    _check_posints(block_size=block_size)
+    if block_size > observations:
+        raise ValueError(
+            "`block_size` shouldn't be greater than the number of observations"
+        )
+    if not isinstance(ci, numbers.Real) or not 0 < ci < 1:
+        raise ValueError("`ci` should be a real number between 0 and 1")
+    if batch_size is not None:
+        _check_posints(batch_size=batch_size)
+    _check_posints(processes=processes)
+
+    return block_size
+
+
+def _check_simulation_arguments(
+    ci,
+    horizon,
+    simulations,
+    method,
+    available_methods,
+    decay,
+    chunk_size,
+    processes,
+):
+    ci = np.atleast_1d(np.asarray(ci))
+    if (
+        ci.ndim != 1
+        or ci.shape[0] == 0
+        or not np.issubdtype(ci.dtype, np.floating)
+        or np.any(~((ci > 0) & (ci < 1)))
+    ):
+        raise ValueError("`ci` should be a number between 0 and 1, or a list of them")
+    horizon = np.atleast_1d(np.asarray(horizon))
+    if (
+        horizon.ndim != 1
+        or horizon.shape[0] == 0
+        or not np.issubdtype(horizon.dtype, np.integer)
+        or np.any(horizon < 1)
+    ):
+        raise ValueError("`horizon` should be a positive `int`, or a list of them")
+    _check_posints(simulations=simulations)
+    if method not in available_methods:
+        raise ValueError(f"`method` should be one of {available_methods}")
+    if not isinstance(decay, numbers.Real) or not 0 < decay < 1:
+        raise ValueError("`decay` should be a real number between 0 and 1")
+    if chunk_size is not None:
+        _check_posints(chunk_size=chunk_size)
+    _check_posints(processes=processes)
+
+    return ci.astype(float), np.unique(horizon).tolist()
+
+
+def _check_rebalancing(rebalancing, threshold, weights, available_schedules, index):
+    if isinstance(rebalancing, str):
+        if rebalancing not in available_schedules:
+            raise ValueError(
+                f"`rebalancing` should be one of {list(available_schedules.keys())}, a positive `int` or `None`"
+            )
+        if not isinstance(index, pd.DatetimeIndex):
+            raise ValueError(
+                "Calendar `rebalancing` schedules require prices indexed by dates"
+            )
+    elif rebalancing is not None and (
+        isinstance(rebalancing, bool)
+        or not isinstance(rebalancing, int)
+        or rebalancing < 1
+    ):
+        raise ValueError(
+            f"`rebalancing` should be one of {list(available_schedules.keys())}, a positive `int` or `None`"
+        )
+    if threshold is not None and (
+        not isinstance(threshold, numbers.Real) or not 0 < threshold < 1
+    ):
+        raise ValueError("`threshold` should be a real number between 0 and 1")
+    if (rebalancing is not None or threshold is not None) and not np.isclose(
+        np.sum(weights), 1
+    ):
+        raise ValueError("`weights` of a rebalanced portfolio should sum to 1")
+
+
+def _check_transaction_costs(bps, spreads, fees, assets, rebalanced):
+    if not rebalanced:
+        raise ValueError(
+            "Transaction costs require `rebalancing` or `threshold` to be set. `rebalancing=1` rebalances every observation"
+        )
+    bps = np.asarray(bps, dtype=float)
+    fees = np.asarray(fees, dtype=float)
+    if bps.ndim > 1 or fees.ndim > 1:
+        raise ValueError("`bps` and `fees` should be numbers or 1-D arrays of them")
+    spreads = np.zeros(assets) if spreads is None else np.asarray(spreads, dtype=float)
+    if spreads.ndim not in [1, 2] or spreads.shape[-1] != assets:
+        raise ValueError(
+            "`spreads` should have one value per asset, or one row of them per cost assumption"
+        )
+    try:
+        assumptions = np.broadcast_shapes(
+            bps.reshape(-1).shape,
+            spreads.reshape(-1, assets)[:, 0].shape,
+            fees.reshape(-1).shape,
+        )
+    except ValueError:
+        raise ValueError(
+            "`bps`, `spreads` and `fees` should have the same number of cost assumptions"
+        )
+    single = bps.ndim == 0 and spreads.ndim == 1 and fees.ndim == 0
+    rates = np.broadcast_to(
+        (bps.reshape(-1, 1) + spreads.reshape(-1, assets)) / 10000,
+        assumptions + (assets,),
+    )
+    fees = np.broadcast_to(fees.reshape(-1), assumptions)
+    if np.any(~np.isfinite(rates)) or np.any(rates < 0):
+        raise ValueError("`bps` and `spreads` should be non-negative")
+    if np.any(~np.isfinite(fees)) or np.any(fees < 0):
+        raise ValueError("`fees` should be non-negative")
+
+    return rates, fees, single
+
+
+def _check_render_arguments(portfolios, plots, available_plots, file_format, processes):
+    if not isinstance(portfolios, (list, tuple)):
+        raise ValueError("`portfolios` should be of type `list` or `tuple`")
+    if len(portfolios) == 0:
+        raise ValueError("`portfolios` should contain at least one portfolio")
+    names = [portfolio.name for portfolio in portfolios]
+    if len(set(names)) != len(names):
+        raise ValueError(
+            "Portfolio names should be unique, otherwise rendered figures overwrite each other"
+        )
+    if plots is None:
+        plots = available_plots
+    if not isinstance(plots, (list, tuple)):
+        raise ValueError("`plots` should be of type `list` or `tuple`")
+    for plot in plots:
+        if plot not in available_plots:
+            raise ValueError(f"`{plot}` is not an available plot")
+    if not isinstance(file_format, str):
+        raise ValueError("`file_format` should be of type `str`")
+    if not isinstance(processes, int) or processes < 1:
+        raise ValueError("`processes` should be a positive `int`")
+
+    return list(plots)
+
+
+def _check_report_arguments(analytics, plots, available_plots, threads):
+    if not hasattr(analytics, "summary_return_moments"):
+        raise ValueError("`analytics` should be of type `portan.Analytics`")
+    if plots is None:
+        plots = available_plots
+    if not isinstance(plots, (list, tuple)):
+        raise ValueError("`plots` should be of type `list` or `tuple`")
+    for plot in plots:
+        if plot not in available_plots:
+            raise ValueError(f"`{plot}` is not an available plot")
+    if threads is not None and (not isinstance(threads, int) or threads < 1):
+        raise ValueError("`threads` should be a positive `int`")
+
+    return list(plots)
+
+
+def _check_report_format(path, file_format):
+    if file_format is None:
+        file_format = os.path.splitext(str(path))[1][1:].lower()
+    if file_format not in ["html", "pdf"]:
+        raise ValueError("Report `file_format` should be `html` or `pdf`")
+
+    return file_format
+
+
+def _check_dtype(dtype):
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        raise ValueError("`dtype` should be `float64` or `float32`")
+    if dtype not in [np.float64, np.float32]:
+        raise ValueError("`dtype` should be `float64` or `float32`")
+
+    return dtype
@@ -0,0 +1,166 @@
+"""
+`_io.py` module contains functions that write and read DataFrames in
+the export formats supported by the package: `.csv`, Parquet and Feather
+(Arrow) and compressed NumPy `.npz`
+"""
+
+import os
+import csv
+import itertools
+import importlib.util
+import numpy as np
+import pandas as pd
+from portan._lazy import LazyModule
+
+pa = LazyModule("pyarrow")
+pq = LazyModule("pyarrow.parquet")
+ipc = LazyModule("pyarrow.ipc")
+
+FILE_FORMATS = ["csv", "parquet", "feather", "npz"]
+
+
+def file_format(path, file_format=None):
+    if file_format is None:
+        file_format = os.path.splitext(str(path))[1][1:].lower()
+    if file_format not in FILE_FORMATS:
+        raise ValueError(
+            f"`file_format` should be one of {FILE_FORMATS}, or inferable from the `path` extension"
+        )
+    if (
+        file_format in ["parquet", "feather"]
+        and importlib.util.find_spec("pyarrow") is None
+    ):
+        raise ValueError(f"`{file_format}` format requires `pyarrow` to be installed")
+
+    return file_format
+
+
+def _chunks(frame, chunk_size):
+    chunk_size = frame.shape[0] if chunk_size is None else chunk_size
+    for start in range(0, max(frame.shape[0], 1), max(chunk_size, 1)):
+        yield frame.iloc[start : start + chunk_size]
+
+
+def write(frame, path, file_format, chunk_size=None):
+    """
+    Writes a DataFrame. Parquet and Feather files are written `chunk_size`
+    rows at a time, so that only one chunk is converted to Arrow at once
+    """
+
+    if file_format == "csv":
+        frame.to_csv(path, chunksize=chunk_size)
+    elif file_format == "npz":
+        _write_npz(frame, path)
+    else:
+        chunks = _chunks(frame, chunk_size)
+        table = pa.Table.from_pandas(next(chunks), preserve_index=True)
+        if file_format == "parquet":
+            writer = pq.ParquetWriter(path, table.schema)
+        else:
+            writer = ipc.new_file(
+                path, table.schema, options=ipc.IpcWriteOptions(compression="lz4")
+            )
+        with writer:
+            writer.write_table(table)
+            for chunk in chunks:
+                writer.write_table(
+                    pa.Table.from_pandas(chunk, preserve_index=True).cast(table.schema)
+                )
+
+
+def _csv_header(path):
+    """
+    Rows of the header of a `.csv` file. Column levels of a `pd.MultiIndex`
+    are written as leading rows with no numeric values, so wide format data
+    (attribute and ticker levels) has a header of two rows
+    """
+
+    with open(path, newline="") as file:
+        rows = list(itertools.islice(csv.reader(file), 16))
+
+    header = 1
+    for row in rows[1:]:
+        if not any(row[1:]) or any(_is_number(value) for value in row[1:]):
+            break
+        header += 1
+
+    return list(range(header)) if header > 1 else 0
+
+
+def _is_number(value):
+    try:
+        float(value)
+    except ValueError:
+        return False
+
+    return value != ""
+
+
+def read(path, file_format):
+    if file_format == "csv":
+        frame = pd.read_csv(
+            path, header=_csv_header(path), index_col=0, parse_dates=True
+        )
+        if frame.index.dtype == object:
+            # Timestamps with mixed UTC offsets (e.g. across daylight saving
+            # time) aren't parsed by `parse_dates` and are converted to UTC
+            try:
+                frame.index = pd.to_datetime(frame.index, utc=True)
+            except (ValueError, TypeError):
+                pass
+    elif file_format == "npz":
+        frame = _read_npz(path)
+    elif file_format == "parquet":
+        frame = pq.read_table(path).to_pandas()
+    else:
+        with ipc.open_file(pa.memory_map(str(path))) as reader:
+            frame = reader.read_all().to_pandas()
+
+    return frame
+
+
+def _write_npz(frame, path):
+    if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in frame.dtypes):
+        raise ValueError("`npz` format supports only numeric data")
+
+    index = frame.index
+    if isinstance(index, pd.DatetimeIndex):
+        timezone = "" if index.tz is None else str(index.tz)
+        index = index.to_numpy(dtype="datetime64[ns]")
+    else:
+        timezone = None
+        index = index.to_numpy(dtype=str) if index.dtype == object else index.to_numpy()
+
+    # Written through a file object, so that `.npz` isn't appended to `path`
+    with open(path, "wb") as file:
+        np.savez_compressed(
+            file,
+            values=frame.to_numpy(),
+            index=index,
+            index_name=str(frame.index.name or ""),
+            timezone="" if timezone is None else timezone,
+            datetime=timezone is not None,
+            columns=np.array(
+                [
+                    frame.columns.get_level_values(i).to_numpy(dtype=str)
+                    for i in range(frame.columns.nlevels)
+                ]
+            ),
+            columns_names=np.array([str(name or "") for name in frame.columns.names]),
+        )
+
+
+def _read_npz(path):
+    with np.load(path) as data:
+        index = pd.Index(data["index"], name=str(data["index_name"]) or None)
+        if data["datetime"]:
+            index = pd.DatetimeIndex(index)
+            if str(data["timezone"]):
+                index = index.tz_localize("UTC").tz_convert(str(data["timezone"]))
+        names = [str(name) or None for name in data["columns_names"]]
+        if len(names) == 1:
+            columns = pd.Index(data["columns"][0], name=names[0])
+        else:
+            columns = pd.MultiIndex.from_arrays(list(data["columns"]), names=names)
+
+        return pd.DataFrame(data["values"], index=index, columns=columns)
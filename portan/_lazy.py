@@ -0,0 +1,36 @@
+"""
+`_lazy.py` module contains `LazyModule` proxy that defers importing
+heavy optional dependencies until they are first used
+"""
+
+
+import importlib
+
+
+class LazyModule:
+    """
+    Stands in for a module and imports it on the first attribute access, so that
+    `import portan` doesn't pay the import time of plotting, statistics and
+    downloading libraries that a workload may never use
+    """
+
+    def __init__(self, name) -> None:
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+
+        return self._module
+
+    def __getattr__(self, attribute):
+        if attribute.startswith("__") and attribute.endswith("__"):
+            raise AttributeError(attribute)
+
+        return getattr(self._load(), attribute)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+
+        return f"<lazy module '{self._name}' ({state})>"
@@ -0,0 +1,711 @@
+"""
+`_stats.py` module contains vectorized statistics kernels shared by the
+analytics classes. Kernels operate column-wise on 2-D `np.ndarray` objects
+of shape (observations, portfolios), so that many portfolios are evaluated
+in a single pass.
+"""
+
+import math
+import numpy as np
+import pandas as pd
+
+# Number of converted rate series kept per object
+RATES_CACHE_SIZE = 8
+
+
+def rate_conversion(annual_rate, frequency):
+    return (annual_rate + 1) ** (1 / frequency) - 1
+
+
+def series_key(series):
+    # Hash of the index and values of a series, so that a series modified in
+    # place isn't matched with the conversion of its previous values
+    return hash(pd.util.hash_pandas_object(series).to_numpy().tobytes())
+
+
+def cache_put(cache, key, value, size=RATES_CACHE_SIZE):
+    # Inserts into a dict that keeps only the `size` most recent entries
+    while len(cache) >= size:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+    return value
+
+
+def geometric_mean(returns, frequency):
+    return np.prod(1 + returns, axis=0) ** (frequency / returns.shape[0]) - 1
+
+
+def central_moments(returns):
+    mean = returns.mean(axis=0)
+    deviations = returns - mean
+    squared = deviations**2
+    m2 = squared.mean(axis=0)
+    m3 = (squared * deviations).mean(axis=0)
+    m4 = (squared**2).mean(axis=0)
+
+    return mean, m2, m3, m4
+
+
+def skewness(m2, m3):
+    # Biased estimator, same as `scipy.stats.skew`
+    return m3 / m2**1.5
+
+
+def kurtosis(m2, m4):
+    # Biased excess kurtosis, same as `scipy.stats.kurtosis`
+    return m4 / m2**2 - 3
+
+
+def lpm(returns, threshold, moment):
+    return np.mean(np.maximum(threshold - returns, 0) ** moment, axis=0)
+
+
+def hpm(returns, threshold, moment):
+    return np.mean(np.maximum(returns - threshold, 0) ** moment, axis=0)
+
+
+def wealth(returns):
+    # Cumulative returns with the initial unit of wealth prepended
+    return np.vstack([np.ones((1, returns.shape[1])), np.cumprod(1 + returns, axis=0)])
+
+
+def drawdowns(levels):
+    return levels / np.maximum.accumulate(levels, axis=0) - 1
+
+
+def ulcer(aum):
+    return np.sqrt(np.sum((100 * drawdowns(aum)) ** 2, axis=0) / aum.shape[0])
+
+
+def capm(returns, benchmark_returns, rfr=0.0):
+    # Ordinary least squares of every portfolio on every benchmark from centered
+    # sums of squares and cross-products. Excess returns only shift the means, so
+    # the risk-free rate enters through alpha alone.
+    return capm_parameters(comoments(returns, benchmark_returns), rfr)
+
+
+def capm_parameters(comoments, rfr=0.0):
+    observations, mean, benchmark_mean, syy, sxx, sxy = comoments
+    sxx = sxx[:, np.newaxis]
+    syy = syy[np.newaxis, :]
+
+    beta = sxy / sxx
+    alpha = (mean - rfr) - beta * (benchmark_mean - rfr)[:, np.newaxis]
+    r_squared = sxy**2 / (sxx * syy)
+    residual_variance = np.maximum(syy - beta * sxy, 0) / observations
+
+    return alpha, beta, r_squared, residual_variance
+
+
+def moments(returns):
+    # Number of observations, mean and sums of the 2nd, 3rd and 4th powers of
+    # deviations from the mean, the state that `merge_moments` updates
+    returns = _columns(returns)
+    mean = returns.mean(axis=0)
+    deviations = returns - mean
+    squared = deviations**2
+
+    return (
+        returns.shape[0],
+        mean,
+        squared.sum(axis=0),
+        (squared * deviations).sum(axis=0),
+        (squared**2).sum(axis=0),
+    )
+
+
+def merge_moments(first, second):
+    # Pairwise update of the central moment sums (Pebay, 2008)
+    n_a, mean_a, m2_a, m3_a, m4_a = first
+    n_b, mean_b, m2_b, m3_b, m4_b = second
+    n = n_a + n_b
+    delta = mean_b - mean_a
+
+    mean = mean_a + delta * n_b / n
+    m2 = m2_a + m2_b + delta**2 * n_a * n_b / n
+    m3 = (
+        m3_a
+        + m3_b
+        + delta**3 * n_a * n_b * (n_a - n_b) / n**2
+        + 3 * delta * (n_a * m2_b - n_b * m2_a) / n
+    )
+    m4 = (
+        m4_a
+        + m4_b
+        + delta**4 * n_a * n_b * (n_a**2 - n_a * n_b + n_b**2) / n**3
+        + 6 * delta**2 * (n_a**2 * m2_b + n_b**2 * m2_a) / n**2
+        + 4 * delta * (n_a * m3_b - n_b * m3_a) / n
+    )
+
+    return n, mean, m2, m3, m4
+
+
+def moment_statistics(moments):
+    # Mean, volatility (ddof=1), biased skewness and biased excess kurtosis
+    n, mean, m2, m3, m4 = moments
+
+    return (
+        mean,
+        np.sqrt(m2 / (n - 1)),
+        skewness(m2 / n, m3 / n),
+        kurtosis(m2 / n, m4 / n),
+    )
+
+
+def comoments(returns, benchmark_returns):
+    returns = _columns(returns)
+    benchmark_returns = _columns(benchmark_returns)
+
+    mean = returns.mean(axis=0)
+    benchmark_mean = benchmark_returns.mean(axis=0)
+    centered = returns - mean
+    benchmark_centered = benchmark_returns - benchmark_mean
+
+    return (
+        returns.shape[0],
+        mean,
+        benchmark_mean,
+        np.sum(centered**2, axis=0),
+        np.sum(benchmark_centered**2, axis=0),
+        benchmark_centered.T @ centered,
+    )
+
+
+def merge_comoments(first, second):
+    n_a, mean_a, benchmark_mean_a, syy_a, sxx_a, sxy_a = first
+    n_b, mean_b, benchmark_mean_b, syy_b, sxx_b, sxy_b = second
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    benchmark_delta = benchmark_mean_b - benchmark_mean_a
+    weight = n_a * n_b / n
+
+    return (
+        n,
+        mean_a + delta * n_b / n,
+        benchmark_mean_a + benchmark_delta * n_b / n,
+        syy_a + syy_b + delta**2 * weight,
+        sxx_a + sxx_b + benchmark_delta**2 * weight,
+        sxy_a + sxy_b + np.outer(benchmark_delta, delta) * weight,
+    )
+
+
+def _columns(array):
+    array = np.asarray(array, dtype=float)
+    if array.ndim == 1:
+        array = array[:, np.newaxis]
+
+    return array
+
+
+def rolling_sum(array, window):
+    # Window sums as differences of one cumulative sum, so every step costs O(1).
+    # Leading observations without a full window are `NaN`.
+    array = _columns(array)
+    cumulative = np.vstack([np.zeros((1, array.shape[1])), np.cumsum(array, axis=0)])
+    sums = np.full(array.shape, np.nan)
+    sums[window - 1 :] = cumulative[window:] - cumulative[:-window]
+
+    return sums
+
+
+def rolling_moments(returns, window, ddof=1):
+    # Returns are centered on their full-sample mean first, which keeps the
+    # difference of sums numerically stable without changing the variance
+    returns = _columns(returns)
+    center = returns.mean(axis=0)
+    centered = returns - center
+    s1 = rolling_sum(centered, window)
+    s2 = rolling_sum(centered**2, window)
+
+    mean = s1 / window + center
+    variance = np.maximum(s2 - s1**2 / window, 0) / (window - ddof)
+
+    return mean, variance
+
+
+def rolling_geometric_mean(returns, window, frequency):
+    return np.exp(rolling_sum(np.log1p(returns), window) * frequency / window) - 1
+
+
+def rolling_capm(returns, benchmark_returns, window, rfr=0.0):
+    returns = _columns(returns)
+    benchmark_returns = _columns(benchmark_returns)
+    mean, variance = rolling_moments(returns, window, ddof=0)
+    benchmark_mean, benchmark_variance = rolling_moments(
+        benchmark_returns, window, ddof=0
+    )
+    centered = returns - returns.mean(axis=0)
+    benchmark_centered = benchmark_returns - benchmark_returns.mean(axis=0)
+    cross = rolling_sum(centered * benchmark_centered, window) / window
+    covariance = cross - (mean - returns.mean(axis=0)) * (
+        benchmark_mean - benchmark_returns.mean(axis=0)
+    )
+
+    beta = covariance / benchmark_variance
+    alpha = (mean - rfr) - beta * (benchmark_mean - rfr)
+
+    return alpha, beta
+
+
+def omega_curve(returns, thresholds):
+    # Each series is sorted once. For a threshold `t` with `k` observations at or
+    # below it, gains and losses follow from the prefix sum of the sorted series:
+    # losses = t * k - prefix[k], gains = (prefix[n] - prefix[k]) - t * (n - k)
+    returns = _columns(returns)
+    thresholds = np.asarray(thresholds, dtype=float)
+    observations = returns.shape[0]
+    ordered = np.sort(returns, axis=0)
+    prefix = np.vstack([np.zeros((1, returns.shape[1])), np.cumsum(ordered, axis=0)])
+
+    curve = np.empty((thresholds.shape[0], returns.shape[1]))
+    for i in range(returns.shape[1]):
+        k = np.searchsorted(ordered[:, i], thresholds, side="right")
+        losses = thresholds * k - prefix[k, i]
+        gains = prefix[-1, i] - prefix[k, i] - thresholds * (observations - k)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            curve[:, i] = gains / losses
+
+    return curve
+
+
+def drawdown_episodes(levels):
+    # Splits a single levels series into drawdown episodes in one linear pass.
+    # An episode starts when the series falls below its running peak and ends at
+    # the first observation back at (or above) the peak. Unrecovered episodes
+    # have recovery position -1.
+    levels = np.asarray(levels, dtype=float).ravel()
+    drawdown = drawdowns(levels)
+    underwater = np.concatenate([[False], drawdown < 0, [False]])
+    changes = np.flatnonzero(np.diff(underwater.astype(np.int8)))
+    starts, ends = changes[::2], changes[1::2]
+
+    troughs = np.empty(starts.shape[0], dtype=np.int64)
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        troughs[i] = start + np.argmin(drawdown[start:end])
+    recoveries = np.where(ends < levels.shape[0], ends, -1)
+
+    return starts - 1, troughs, recoveries, drawdown[troughs]
+
+
+# Default number of array elements processed at once by chunked kernels (8 MB of float64)
+CHUNK_ELEMENTS = 2**20
+
+
+def chunk_rows(columns, chunk_size=None):
+    if chunk_size is not None:
+        return chunk_size
+
+    return max(1, CHUNK_ELEMENTS // max(columns, 1))
+
+
+def forward_fill(values, previous=None):
+    # Fills `NaN` values with the last valid value above them, carrying over the
+    # last filled row of the previous chunk. Chunks without `NaN` aren't copied
+    if not np.isnan(values).any():
+        return values
+
+    if previous is None:
+        previous = np.full(values.shape[1], np.nan)
+    stacked = np.vstack([previous, values])
+    rows = np.where(np.isnan(stacked), 0, np.arange(stacked.shape[0])[:, np.newaxis])
+    np.maximum.accumulate(rows, axis=0, out=rows)
+
+    return np.take_along_axis(stacked, rows, axis=0)[1:]
+
+
+def simple_returns(values, previous=None):
+    # Percentage changes of a chunk of prices. The first row of the first chunk
+    # (`previous=None`) has no return and is skipped
+    if previous is None:
+        return values[1:] / values[:-1] - 1
+
+    return values / np.vstack([previous, values[:-1]]) - 1
+
+
+def partial_moments(returns, thresholds, moments):
+    # Lower and higher partial moments of every series at many thresholds and
+    # moments. Each series is sorted once and centered on its mean `c`; with `k`
+    # observations at or below a threshold `t` and `u = t - c`, the binomial
+    # expansions of (u - (r - c))^m and ((r - c) - u)^m turn both moments into
+    # weighted prefix sums of the powers of the centered series:
+    # lpm = sum_j C(m, j) u^(m - j) (-1)^j S_j[k] / n
+    # hpm = sum_j C(m, j) (-u)^(m - j) (S_j[n] - S_j[k]) / n
+    returns = _columns(returns)
+    thresholds = np.asarray(thresholds, dtype=float).ravel()
+    moments = np.asarray(moments, dtype=np.int64).ravel()
+    observations, columns = returns.shape
+    ordered = np.sort(returns, axis=0)
+    center = returns.mean(axis=0)
+    centered = ordered - center
+
+    powers = np.arange(moments.max() + 1)[:, np.newaxis, np.newaxis]
+    prefix = np.zeros((powers.shape[0], observations + 1, columns))
+    np.cumsum(centered[np.newaxis] ** powers, axis=1, out=prefix[:, 1:])
+
+    below = np.empty((thresholds.shape[0], columns), dtype=np.int64)
+    for i in range(columns):
+        below[:, i] = np.searchsorted(ordered[:, i], thresholds, side="right")
+    lower_sums = np.take_along_axis(prefix, below[np.newaxis], axis=1)
+    higher_sums = prefix[:, -1:] - lower_sums
+    distance = thresholds[:, np.newaxis] - center
+
+    lower = np.empty((thresholds.shape[0], moments.shape[0], columns))
+    higher = np.empty((thresholds.shape[0], moments.shape[0], columns))
+    for i, moment in enumerate(moments):
+        j = np.arange(moment + 1)[:, np.newaxis, np.newaxis]
+        binomial = np.array([math.comb(moment, int(p)) for p in j.ravel()])[
+            :, np.newaxis, np.newaxis
+        ]
+        lower[:, i] = np.sum(
+            binomial
+            * distance ** (moment - j)
+            * (-1.0) ** j
+            * lower_sums[: moment + 1],
+            axis=0,
+        )
+        higher[:, i] = np.sum(
+            binomial * (-distance) ** (moment - j) * higher_sums[: moment + 1], axis=0
+        )
+
+    # Rounding can leave tiny negative values where the moment is (close to) zero
+    return (
+        np.maximum(lower, 0) / observations,
+        np.maximum(higher, 0) / observations,
+        below,
+    )
+
+
+SWEEP_METRICS = [
+    "excess_mar",
+    "sharpe",
+    "sortino",
+    "kappa",
+    "omega_ratio",
+    "omega_sharpe_ratio",
+    "upside_frequency",
+    "downside_frequency",
+    "lpm",
+    "hpm",
+    "upside_potential",
+    "upside_risk",
+    "upside_variance",
+    "downside_potential",
+    "downside_risk",
+    "downside_variance",
+    "volatility_skewness",
+]
+
+
+def sweep(returns, metrics, rfr, mar, thresholds, moments, mean_return, volatility):
+    # Metric grids of shape (rfr, mar, moments, portfolios). `rfr` and `mar` are
+    # on the basis of `mean_return` (annual or data frequency), `thresholds` are
+    # the MARs converted to the data frequency that partial moments are taken at.
+    # Moments 1 and 2 are always computed, as most MAR metrics are built on them
+    returns = _columns(returns)
+    rfr = np.asarray(rfr, dtype=float)[:, np.newaxis, np.newaxis, np.newaxis]
+    mar = np.asarray(mar, dtype=float)[np.newaxis, :, np.newaxis, np.newaxis]
+    moments = np.asarray(moments, dtype=np.int64)
+    all_moments = np.union1d(moments, [1, 2])
+    lower, higher, below = partial_moments(returns, thresholds, all_moments)
+    position = np.searchsorted(all_moments, moments)
+    first, second = np.searchsorted(all_moments, [1, 2])
+
+    def grid(values):
+        # (mar, portfolios) or (mar, moments, portfolios) values on the full grid
+        if values.ndim == 2:
+            values = values[:, np.newaxis]
+        return values[np.newaxis]
+
+    lpm1, lpm2 = grid(lower[:, first]), grid(lower[:, second])
+    hpm1, hpm2 = grid(higher[:, first]), grid(higher[:, second])
+    observations = returns.shape[0]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        formulas = {
+            "excess_mar": lambda: mean_return - mar,
+            "sharpe": lambda: (mean_return - rfr) / volatility,
+            "sortino": lambda: (mean_return - rfr) / np.sqrt(lpm2),
+            "kappa": lambda: (mean_return - mar)
+            / grid(lower[:, position]) ** (1 / moments[:, np.newaxis]),
+            "omega_ratio": lambda: hpm1 / lpm1,
+            "omega_sharpe_ratio": lambda: (hpm1 - lpm1) / lpm1,
+            "upside_frequency": lambda: grid((observations - below) / observations),
+            "downside_frequency": lambda: grid(below / observations),
+            "lpm": lambda: grid(lower[:, position]),
+            "hpm": lambda: grid(higher[:, position]),
+            "upside_potential": lambda: hpm1,
+            "upside_risk": lambda: np.sqrt(hpm2),
+            "upside_variance": lambda: hpm2,
+            "downside_potential": lambda: lpm1,
+            "downside_risk": lambda: np.sqrt(lpm2),
+            "downside_variance": lambda: lpm2,
+            "volatility_skewness": lambda: hpm2 / lpm2,
+        }
+        shape = (rfr.shape[0], mar.shape[1], moments.shape[0], returns.shape[1])
+
+        return {
+            metric: np.broadcast_to(formulas[metric](), shape) for metric in metrics
+        }
+
+
+def paired_capm(returns, benchmark_returns, rfr=0.0):
+    # CAPM of every portfolio on its own benchmark column, without the
+    # (benchmarks x portfolios) cross-products of `capm`
+    returns = _columns(returns)
+    benchmark_returns = _columns(benchmark_returns)
+    mean = returns.mean(axis=0)
+    benchmark_mean = benchmark_returns.mean(axis=0)
+    centered = returns - mean
+    benchmark_centered = benchmark_returns - benchmark_mean
+    syy = np.sum(centered**2, axis=0)
+    sxx = np.sum(benchmark_centered**2, axis=0)
+    sxy = np.sum(benchmark_centered * centered, axis=0)
+
+    beta = sxy / sxx
+    alpha = (mean - rfr) - beta * (benchmark_mean - rfr)
+    r_squared = sxy**2 / (sxx * syy)
+    residual_variance = np.maximum(syy - beta * sxy, 0) / returns.shape[0]
+
+    return alpha, beta, r_squared, residual_variance
+
+
+def bootstrap_indices(observations, resamples, method, block_size, rng):
+    # Resample indices of shape (resamples, observations). Blocks wrap around
+    # the end of the series, so that every observation is equally likely.
+    # Stationary bootstrap (Politis and Romano, 1994) starts a new block at each
+    # position with probability 1 / `block_size`, so block lengths are geometric
+    if method == "iid":
+        return rng.integers(0, observations, (resamples, observations))
+
+    if method == "block":
+        blocks = -(-observations // block_size)
+        starts = rng.integers(0, observations, (resamples, blocks, 1))
+        indices = (starts + np.arange(block_size)).reshape(resamples, -1)
+
+        return indices[:, :observations] % observations
+
+    positions = np.arange(observations)
+    new_block = rng.random((resamples, observations)) < 1 / block_size
+    new_block[:, 0] = True
+    block_start = np.maximum.accumulate(np.where(new_block, positions, 0), axis=1)
+    starts = rng.integers(0, observations, (resamples, observations))
+
+    return (
+        np.take_along_axis(starts, block_start, axis=1) + positions - block_start
+    ) % observations
+
+
+def normal_model(returns):
+    # Mean and a square root of the covariance matrix of (assets) returns. The
+    # eigendecomposition also handles singular matrices (e.g. duplicate assets)
+    returns = _columns(returns)
+    eigenvalues, eigenvectors = np.linalg.eigh(np.atleast_2d(np.cov(returns.T)))
+
+    return returns.mean(axis=0), eigenvectors * np.sqrt(np.maximum(eigenvalues, 0))
+
+
+def filtered_model(returns, decay=0.94):
+    # Filtered historical simulation (Barone-Adesi et al., 1999). Returns are
+    # devolatilized with exponentially weighted (RiskMetrics) variances, and the
+    # standardized residuals are rescaled by the variance forecast when drawn
+    returns = _columns(returns)
+    mean = returns.mean(axis=0)
+    deviations = returns - mean
+    variance = np.empty(returns.shape)
+    variance[0] = deviations.var(axis=0)
+    for t in range(1, returns.shape[0]):
+        variance[t] = decay * variance[t - 1] + (1 - decay) * deviations[t - 1] ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        residuals = np.nan_to_num(deviations / np.sqrt(variance))
+    forecast = decay * variance[-1] + (1 - decay) * deviations[-1] ** 2
+
+    return mean, residuals, forecast
+
+
+def simulate_returns(model, weights, horizons, simulations, rng, decay=0.94):
+    # Cumulative portfolio returns at each of the (ascending) `horizons`, with
+    # shape (horizons, simulations, portfolios). Paths are built one step at a
+    # time, so only (simulations, assets) draws are in memory at once. Portfolio
+    # returns are assets returns aggregated through `weights` (assets, portfolios)
+    method, mean, *parameters = model
+    wealth = np.ones((simulations, weights.shape[1]))
+    cumulative = np.empty((len(horizons), simulations, weights.shape[1]))
+    if method == "filtered_historical":
+        residuals, variance = parameters
+        variance = np.broadcast_to(variance, (simulations, mean.shape[0]))
+
+    stored = 0
+    for step in range(1, horizons[-1] + 1):
+        if method == "normal":
+            draws = (
+                mean
+                + rng.standard_normal((simulations, mean.shape[0])) @ parameters[0].T
+            )
+        else:
+            deviations = (
+                np.sqrt(variance)
+                * residuals[rng.integers(0, residuals.shape[0], simulations)]
+            )
+            variance = decay * variance + (1 - decay) * deviations**2
+            draws = mean + deviations
+        wealth *= 1 + draws @ weights
+        if step == horizons[stored]:
+            cumulative[stored] = wealth - 1
+            stored += 1
+
+    return cumulative
+
+
+def value_at_risk(values, ci):
+    # VaR (quantiles) and CVaR (mean of values at or below VaR) of simulated
+    # values along the second axis, with shapes (ci, *values without axis 1)
+    var = np.quantile(values, 1 - np.asarray(ci), axis=1)
+    cvar = np.empty(var.shape)
+    for i in range(var.shape[0]):
+        tail = values <= var[i][:, np.newaxis]
+        cvar[i] = np.sum(values, axis=1, where=tail) / tail.sum(axis=1)
+
+    return var, cvar
+
+
+def _prefix(array):
+    # Cumulative sums with a leading row of zeros, so that the sum of rows
+    # [start, end) is `prefix[end] - prefix[start]`
+    return np.vstack([np.zeros((1, array.shape[1])), np.cumsum(array, axis=0)])
+
+
+def period_statistics(returns, starts, ends, benchmark_returns=None):
+    # Statistics of returns rows [start, end) of every period. Returns, moments
+    # and capture ratios are differences of cumulative sums and products, so
+    # they cost O(observations + periods). Drawdowns need the running peak
+    # within each period, so they cost the length of the period.
+    # Returns are centered on their full-sample mean, which keeps the
+    # difference of sums numerically stable without changing the variance
+    returns = _columns(returns)
+    starts = np.asarray(starts)
+    ends = np.asarray(ends)
+    observations = (ends - starts)[:, np.newaxis]
+    levels = wealth(returns)
+    centered = returns - returns.mean(axis=0)
+    s1 = _prefix(centered)
+    s2 = _prefix(centered**2)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sum1 = s1[ends] - s1[starts]
+        statistics = {
+            "observations": observations,
+            "return": levels[ends] / levels[starts] - 1,
+            "volatility": np.sqrt(
+                np.maximum(s2[ends] - s2[starts] - sum1**2 / observations, 0)
+                / (observations - 1)
+            ),
+        }
+        maximum_drawdown = np.full((starts.shape[0], returns.shape[1]), np.nan)
+        for i, (start, end) in enumerate(zip(starts, ends)):
+            if end > start:
+                maximum_drawdown[i] = -drawdowns(levels[start : end + 1]).min(axis=0)
+        statistics["maximum_drawdown"] = maximum_drawdown
+
+        if benchmark_returns is not None:
+            benchmark_returns = _columns(benchmark_returns)
+            benchmark_levels = wealth(benchmark_returns)
+            up = benchmark_returns > 0
+            up_returns = _prefix(np.where(up, returns, 0))
+            up_benchmark = _prefix(np.where(up, benchmark_returns, 0))
+            down_returns = _prefix(np.where(up, 0, returns))
+            down_benchmark = _prefix(np.where(up, 0, benchmark_returns))
+            statistics["benchmark_return"] = (
+                benchmark_levels[ends] / benchmark_levels[starts] - 1
+            )
+            statistics["up_capture"] = (up_returns[ends] - up_returns[starts]) / (
+                up_benchmark[ends] - up_benchmark[starts]
+            )
+            statistics["down_capture"] = (down_returns[ends] - down_returns[starts]) / (
+                down_benchmark[ends] - down_benchmark[starts]
+            )
+
+    shape = (starts.shape[0], returns.shape[1])
+
+    return {key: np.broadcast_to(value, shape) for key, value in statistics.items()}
+
+
+def rebalancing_starts(prices, weights, holdings, candidates, threshold=None):
+    # Rows at which holdings are reset to the target weights. Without a threshold
+    # every candidate row is a rebalance. With one, weights drift is evaluated on
+    # blocks of candidate rows at once, doubling the block while no row exceeds
+    # the threshold, so the loop runs about once per rebalance instead of once
+    # per observation
+    if threshold is None:
+        return candidates
+
+    starts = []
+    position, block = 0, 16
+    while position < candidates.shape[0]:
+        rows = candidates[position : position + block]
+        values = prices[rows] * holdings
+        totals = values.sum(axis=1)
+        drift = np.abs(values / totals[:, np.newaxis] - weights).max(axis=1)
+        exceeded = np.flatnonzero(drift > threshold)
+        if exceeded.shape[0] == 0:
+            position += block
+            block *= 2
+            continue
+        row = rows[exceeded[0]]
+        starts.append(row)
+        holdings = weights * totals[exceeded[0]] / prices[row]
+        position += exceeded[0] + 1
+        block = 16
+
+    return np.array(starts, dtype=int)
+
+
+def rebalance(prices, weights, holdings, starts, chunk_size=None):
+    # Holdings, AUM and turnover of a portfolio that starts with `holdings` units
+    # and is rebalanced to `weights` at the close of rows `starts`. Holdings are
+    # constant between rebalances, so AUM at the rebalances is a cumulative
+    # product of the growth of each segment and AUM within a segment is prices
+    # times its holdings. Returns units (one row per segment, the first being
+    # `holdings`), AUM of every row and trades (changes in weights) of every
+    # rebalance
+    rows = prices.shape[0]
+    if starts.shape[0] > 0:
+        growth = (prices[starts[1:]] / prices[starts[:-1]]) @ weights
+        aum_starts = (prices[starts[0]] @ holdings) * np.concatenate(
+            [[1.0], np.cumprod(growth)]
+        )
+        units = weights * aum_starts[:, np.newaxis] / prices[starts]
+        units = np.vstack([holdings, units])
+        trades = weights - units[:-1] * prices[starts] / aum_starts[:, np.newaxis]
+    else:
+        units = holdings[np.newaxis]
+        trades = np.empty((0, prices.shape[1]))
+
+    segments = np.searchsorted(starts, np.arange(rows), side="right")
+    chunk_size = chunk_rows(prices.shape[1], chunk_size)
+    aum = np.empty(rows)
+    for start in range(0, rows, chunk_size):
+        end = start + chunk_size
+        aum[start:end] = np.einsum(
+            "ij,ij->i", prices[start:end], units[segments[start:end]]
+        )
+
+    return units, aum, trades
+
+
+def transaction_costs(trades, aum, rates, fees):
+    # Costs of rebalancing trades (changes in weights, one row per rebalance) with
+    # gross AUM `aum` under many cost assumptions at once: proportional `rates`
+    # (assumptions x assets) of the traded value and fixed `fees` per traded asset.
+    # Costs reduce AUM at each rebalance, so net AUM is gross AUM times a factor
+    # f_k = f_{k-1} * (1 - p_k) - b_k. It is a linear recurrence, so it is solved
+    # with a cumulative product and sum instead of a loop over rebalances.
+    # Returns the factors and costs (in units of AUM) of every rebalance
+    traded = np.abs(trades)
+    proportional = traded @ rates.T
+    fixed = np.count_nonzero(traded, axis=1)[:, np.newaxis] * fees / aum[:, np.newaxis]
+    growth = np.cumprod(1 - proportional, axis=0)
+    factors = growth * (1 - np.cumsum(fixed / growth, axis=0))
+    previous = np.vstack([np.ones((1, rates.shape[0])), factors[:-1]])
+
+    return factors, (previous - factors) * aum[:, np.newaxis]
@@ -5,23 +5,60 @@ for analyzing portfolio performance
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-import seaborn as sns
-from scipy import stats
-from sklearn import covariance
-from sklearn.linear_model import LinearRegression
-from statsmodels.stats.diagnostic import lilliefors
-from statsmodels.tsa import stattools
 from itertools import repeat
 from datetime import datetime
+import functools
+import os
+import inspect
 import warnings
-from portan import _checks
+from portan import _checks, _stats
+from portan._lazy import LazyModule
+from portan.get_data import get_info
+from portan.interesting_periods import PERIODS, STRESS_COLUMNS
+from portan.rebalancing import SCHEDULES, _simulate
+
+# Heavy dependencies are imported when first used
+plt = LazyModule("matplotlib.pyplot")
+mpatches = LazyModule("matplotlib.patches")
+sns = LazyModule("seaborn")
+stats = LazyModule("scipy.stats")
+covariance = LazyModule("sklearn.covariance")
+diagnostic = LazyModule("statsmodels.stats.diagnostic")
+stattools = LazyModule("statsmodels.tsa.stattools")
+
+
+STYLE = os.path.join(os.path.dirname(__file__), "portan_style.mplstyle")
+CURRENT_DATE = str(datetime.now())[0:10]
 
 
-STYLE = "./portan/portan_style.mplstyle"
-CURRENT_DATE = str(datetime.now())[0:10]
+def _memoize(method):
+    """
+    Memoizes the result of an `Analytics` method per object. Results are keyed on the
+    method, its (bound) arguments and the benchmark, and are discarded when the benchmark
+    is (re)set. Calls with unhashable arguments aren't memoized
+    """
+
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        key = (
+            method.__name__,
+            self._benchmark_version,
+            tuple(arguments.arguments.items())[1:],
+        )
+        try:
+            return self._memo[key]
+        except KeyError:
+            result = method(self, *args, **kwargs)
+            self._memo[key] = result
+            return result
+        except TypeError:
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class Analytics:
@@ -34,13 +71,16 @@ class Analytics:
         - `assets_returns` - Assets returns
         - `tickers` - Assets tickers
         - `weights` - Assets weights
-        - `assets_info` - Information about assets
-        - `assets_names` - Assets names
+        - `assets_info` - Information about assets (downloaded on first access)
+        - `assets_names` - Assets names (downloaded on first access)
         - `name` - Name of the portfolio
         - `initial_aum` - Initial Assets Under Management (AUM)
         - `frequency` - Data frequency, number of data observations in a year. Used for annualization.
         - `allocation_funds` - Allocation of funds into each asset
         - `allocation_assets` - Number of each asset in the portfolio
+        - `rebalancing` - Rebalancing schedule
+        - `threshold` - Weights drift threshold that triggers rebalancing
+        - `turnover` - Turnover of each rebalance (sum of absolute changes in weights)
         - `state` - State of the each asset and whole portfolio time-series
         - `returns` - Portfolio returns time-series
         - `cumulative_returns` - Cumulative portfolio returns time-series
@@ -63,6 +103,7 @@ class Analytics:
         - `benchmark_mean` - Mean benchmark return
         - `benchmark_arithmetic_mean` - Annualized arithmetic (not compounded) mean benchmark return
         - `benchmark_geometric_mean` - Annualized geometric (compounded) mean benchmark return
+        - `cache` - On-disk cache of downloaded prices
     """
 
     def __init__(
@@ -80,6 +121,15 @@ class Analytics:
         start="1970-01-02",
         end=CURRENT_DATE,
         interval="1d",
+        cache=None,
+        download_kwargs={},
+        fetch_info=True,
+        index=None,
+        chunk_size=None,
+        dtype="float64",
+        validate="full",
+        rebalancing=None,
+        threshold=None,
     ) -> None:
         """
         Initiates `portan.Analytics` object
@@ -110,7 +160,35 @@ class Analytics:
         :type end: str (YYYY-MM-DD) or `datetime.datetime()` or `pd.Timestamp`, optional
         :param interval: Data interval used for downloading assets prices data if `tickers` and/or `benchmark_tickers` arguments are provided, and `prices` and/or `benchmark_prices` arguments `None`. Valid intervals are: '1m', '2m', '5m', '15m', '30m', '60m', '90m', '1h', '1d', '5d', '1wk', '1mo', '3mo', defaults to "1d"
         :type interval: str, optional
-        """
+        :param cache: On-disk cache of downloaded prices shared by all downloads of the object, including the benchmark (re)set later. A path can be passed to use a `portan.PriceCache` stored in that directory, defaults to None (no caching)
+        :type cache: `portan.PriceCache` or str, optional
+        :param download_kwargs: Keyword arguments for `portan.GetData` used for downloading prices if `tickers` and/or `benchmark_tickers` arguments are provided (e.g. `source`, `workers`, `retries`), defaults to {}
+        :type download_kwargs: dict, optional
+        :param fetch_info: Whether to download `assets_info` and `assets_names` from `yfinance`. They are downloaded (concurrently for all assets) only when first accessed. If `False`, tickers are used instead and the object never accesses the network for them, defaults to True
+        :type fetch_info: bool, optional
+        :param index: Dates of the observations when `prices` (and `benchmark_prices`) are given as an array, e.g. `np.memmap` or `pyarrow.Table`. Arrays are used without being copied, defaults to None (`RangeIndex`)
+        :type index: pd.DatetimeIndex, np.ndarray or list, optional
+        :param chunk_size: Number of rows of `prices` processed at once when validating prices and calculating returns and AUM, which bounds memory use for large price panels. `state` and `assets_returns` are only calculated when first accessed, defaults to None (chunks of about 8 MB)
+        :type chunk_size: int, optional
+        :param dtype: Floating point type of assets prices, assets returns and `state`, `"float64"` or `"float32"`. `"float32"` halves their memory use, while portfolio returns, AUM, sums, products and moments are still accumulated in `float64`. Prices are then rounded to a relative error of at most 2**-24 (about 6e-8), so portfolio returns (with non-negative weights) are off by at most 2**-23 * (1 + r) (about 1.2e-7 for small returns r) and statistics derived from them by errors of the same order, defaults to "float64"
+        :type dtype: str or np.dtype, optional
+        :param validate: How `prices` and `benchmark_prices` are checked for `NaN` and `inf` values. `"full"` checks each asset, removing leading rows with `NaN` values (e.g. assets listed later) and raising errors for other `NaN` and `inf` values. `"fast"` checks all prices at once and falls back to `"full"` only if they aren't all finite. `"none"` skips the check, for data that is known to be clean, defaults to "full"
+        :type validate: str, optional
+        :param rebalancing: Rebalancing schedule, one of `"weekly"`, `"monthly"`, `"quarterly"` and `"annually"` (first observation of each period) or a number of observations between rebalances. If `rebalancing` or `threshold` is set, holdings are simulated with `portan.rebalancing` and `returns`, `state` and `turnover` all follow them. Otherwise `returns` keep constant `weights` every observation while `state` holds `allocation_assets`, defaults to None
+        :type rebalancing: str or int, optional
+        :param threshold: Largest absolute difference between the drifted and target weight of any asset that doesn't trigger a rebalance. Checked every observation, or only on the `rebalancing` schedule if it is set, defaults to None
+        :type threshold: float, optional
+        """
+
+        self.dtype = _checks._check_dtype(dtype)
+        if chunk_size is not None:
+            _checks._check_posints(chunk_size=chunk_size)
+        self.cache = _checks._check_cache(cache)
+        self.download_kwargs = download_kwargs
+        self._memo = dict()
+        self._rates = dict()
+        self._accumulators = dict()
+        self._benchmark_version = 0
 
         prices, weights, benchmark_prices, benchmark_weights = _checks._check_init(
             tickers,
@@ -126,25 +204,22 @@ class Analytics:
             start,
             end,
             interval,
+            self.cache,
+            index=index,
+            chunk_size=chunk_size,
+            validate=validate,
+            **self.download_kwargs,
         )
 
-        self.prices = prices
-        self.assets_returns = self.prices.pct_change().drop(self.prices.index[0])
+        self.prices = prices.astype(self.dtype, copy=False)
+        self._assets_returns = None
+        self._state = None
         self.tickers = self.prices.columns.tolist()
         self.weights = pd.Series(weights, index=self.tickers)
-        self.assets_info = np.empty(len(self.tickers), dtype=object)
-        self.assets_names = np.empty(len(self.tickers), dtype="<U64")
-        for i, ticker in enumerate(self.tickers):
-            try:
-                self.assets_info[i] = yf.Ticker(ticker).info
-                self.assets_names[i] = self.assets_info[i]["longName"]
-            except Exception:
-                self.assets_info[i] = ticker
-                self.assets_names[i] = ticker
-                warnings.warn(
-                    f"Couldn't obtain `assets_info` and `assets_names` from `yfinance` for ticker `{ticker}`, so value `{ticker}` is assigned to those values for that assset. Use `_set_info_names()` to set `assets_info` and `assets_names` properties as desired"
-                )
-        self.assets_names = self.assets_names.tolist()
+        _checks._check_booleans(fetch_info=fetch_info)
+        self.fetch_info = fetch_info
+        self._assets_info = None
+        self._assets_names = None
         self.name = name
         self.initial_aum = initial_aum
         self.frequency = frequency
@@ -157,25 +232,20 @@ class Analytics:
             np.divide(self.allocation_funds, self.prices.iloc[0].T), index=self.tickers
         )
 
-        self.state = pd.DataFrame(
-            np.multiply(self.prices, self.allocation_assets),
-            index=self.prices.index,
-            columns=self.tickers,
+        _checks._check_rebalancing(
+            rebalancing, threshold, self.weights, SCHEDULES, self.prices.index
+        )
+        self.rebalancing = rebalancing
+        self.threshold = threshold
+        if rebalancing is None and threshold is None:
+            self._units = None
+            self.turnover = None
+            returns, aum = self._portfolio_series(chunk_size)
+        else:
+            returns, aum = self._rebalanced_series(chunk_size)
+        self.returns = pd.DataFrame(
+            returns, index=self.prices.index[1:], columns=[self.name]
         )
-        self.state[self.name] = self.state.sum(axis=1)
-
-        if len(weights) == 1:
-            self.returns = pd.DataFrame(
-                np.dot(self.assets_returns.to_numpy(), self.weights[0]),
-                index=self.assets_returns.index,
-                columns=[self.name],
-            )
-        elif len(weights) > 1:
-            self.returns = pd.DataFrame(
-                np.dot(self.assets_returns.to_numpy(), self.weights),
-                index=self.assets_returns.index,
-                columns=[self.name],
-            )
 
         self.cumulative_returns = (self.returns + 1).cumprod()
 
@@ -188,13 +258,15 @@ class Analytics:
         self.volatility = self.returns.std()[0]
         self.annual_volatility = self.volatility * np.sqrt(self.frequency)
 
-        self.skewness = stats.skew(self.returns)[0]
-        self.kurtosis = stats.kurtosis(self.returns)[0]
+        _, m2, m3, m4 = _stats.central_moments(self.returns.to_numpy())
+        self.skewness = _stats.skewness(m2, m3)[0]
+        self.kurtosis = _stats.kurtosis(m2, m4)[0]
 
-        self.min_aum = self.state[self.name].min()
-        self.max_aum = self.state[self.name].max()
-        self.mean_aum = self.state[self.name].mean()
-        self.final_aum = self.state.iloc[-1, -1]
+        self._aum = pd.Series(aum, index=self.prices.index, name=self.name)
+        self.min_aum = aum.min()
+        self.max_aum = aum.max()
+        self.mean_aum = aum.mean()
+        self.final_aum = aum[-1]
 
         if benchmark_prices is None and benchmark_weights is None:
             self.benchmark_prices = benchmark_prices
@@ -245,6 +317,111 @@ class Analytics:
                 - 1
             )[0]
 
+    def _portfolio_series(self, chunk_size=None):
+        # Portfolio returns and AUM are calculated chunk by chunk, so that only one
+        # chunk of assets returns is in memory at once. Prices backed by a single
+        # array (e.g. `np.memmap`) aren't copied. `NaN` prices are forward filled
+        # for returns and skipped for AUM, the same as `pct_change()` and `sum()`
+        rows, columns = self.prices.shape
+        chunk_size = _stats.chunk_rows(columns, chunk_size)
+        weights = self.weights.to_numpy()
+        allocation = self.allocation_assets.to_numpy()
+
+        returns = np.empty(rows - 1)
+        aum = np.empty(rows)
+        previous = None
+        for start in range(0, rows, chunk_size):
+            # Chunks are converted to `float64`, whatever the `dtype` of prices
+            values = self.prices.iloc[start : start + chunk_size].to_numpy(dtype=float)
+            missing = np.isnan(values)
+            if missing.any():
+                aum[start : start + values.shape[0]] = (
+                    np.where(missing, 0, values) @ allocation
+                )
+            else:
+                aum[start : start + values.shape[0]] = values @ allocation
+            values = _stats.forward_fill(values, previous)
+            offset = start - 1 if previous is not None else start
+            chunk_returns = _stats.simple_returns(values, previous) @ weights
+            returns[offset : offset + chunk_returns.shape[0]] = chunk_returns
+            previous = values[-1]
+
+        return returns, aum
+
+    def _rebalanced_series(self, chunk_size=None):
+        # Holdings of each segment between rebalances are kept, so that `state`
+        # and `append` don't need to simulate the portfolio again
+        prices = _stats.forward_fill(self.prices.to_numpy(dtype=float))
+        self._units, self._starts, aum, self._trades = _simulate(
+            prices,
+            self.prices.index,
+            self.weights.to_numpy(),
+            self.allocation_assets.to_numpy(),
+            self.rebalancing,
+            self.threshold,
+            chunk_size=chunk_size,
+        )
+        self.turnover = pd.Series(
+            np.abs(self._trades).sum(axis=1),
+            index=self.prices.index[self._starts],
+            name=self.name,
+        )
+
+        return aum[1:] / aum[:-1] - 1, aum
+
+    def _units_state(self, prices, starts, units):
+        segments = np.searchsorted(starts, np.arange(prices.shape[0]), side="right")
+
+        return prices * units[segments]
+
+    @property
+    def assets_returns(self):
+        """
+        Gives access to the assets returns. They are calculated on first access
+
+        :return: Assets returns
+        :rtype: pd.DataFrame
+        """
+
+        if self._assets_returns is None:
+            self._assets_returns = self.prices.pct_change().drop(self.prices.index[0])
+
+        return self._assets_returns
+
+    @property
+    def state(self):
+        """
+        Gives access to the state of each asset and the whole portfolio. It is
+        calculated on first access
+
+        :return: State of each asset and the whole portfolio
+        :rtype: pd.DataFrame
+        """
+
+        if self._state is None and self._units is not None:
+            self._state = pd.DataFrame(
+                self._units_state(
+                    _stats.forward_fill(self.prices.to_numpy(dtype=float)),
+                    self._starts,
+                    self._units,
+                ).astype(self.dtype),
+                index=self.prices.index,
+                columns=self.tickers,
+            )
+            self._state[self.name] = self._aum.to_numpy()
+        elif self._state is None:
+            self._state = pd.DataFrame(
+                np.multiply(self.prices, self.allocation_assets.astype(self.dtype)),
+                index=self.prices.index,
+                columns=self.tickers,
+            )
+            # Accumulated in `float64` whatever the `dtype`
+            self._state[self.name] = np.nansum(
+                self._state.to_numpy(dtype=np.float64), axis=1
+            )
+
+        return self._state
+
     def _set_benchmark(
         self,
         benchmark_tickers=None,
@@ -264,8 +441,14 @@ class Analytics:
             start,
             end,
             interval,
+            self.cache,
+            **self.download_kwargs,
         )
 
+        self._memo.clear()
+        self._accumulators.clear()
+        self._benchmark_version += 1
+
         self.benchmark_prices = benchmark_prices
         self.benchmark_weights = pd.Series(
             benchmark_weights, index=self.benchmark_prices.columns
@@ -304,13 +487,322 @@ class Analytics:
             - 1
         )[0]
 
+    def _accumulator(self, name):
+        # Running statistics that `append` updates with new observations instead of
+        # recalculating them. They are calculated from the full data when first needed
+        if name not in self._accumulators:
+            if name == "moments":
+                value = _stats.moments(self.returns.to_numpy())
+            elif name == "peak":
+                value = max(1.0, self.cumulative_returns.iloc[:, 0].max())
+            elif name == "comoments":
+                value = _stats.comoments(
+                    self.returns.to_numpy(), self.benchmark_returns.to_numpy()
+                )
+            elif name == "benchmark_growth":
+                value = np.prod(1 + self.benchmark_returns.to_numpy()[:, 0])
+            self._accumulators[name] = value
+
+        return self._accumulators[name]
+
+    def append(self, prices, benchmark_prices=None):
+        """
+        Appends new observations (e.g. the latest bars) to the portfolio. Returns,
+        AUM, moments, drawdowns and benchmark statistics are updated incrementally
+        from running statistics, so the cost of an update depends on the number of
+        new observations rather than on the length of the whole history
+
+        :param prices: New assets prices with the same columns as `prices`, indexed after its last observation
+        :type prices: pd.DataFrame or pd.Series (one observation)
+        :param benchmark_prices: New benchmark assets prices with the same index as `prices`. Mandatory if the benchmark is set, defaults to None
+        :type benchmark_prices: pd.DataFrame or pd.Series (one observation), optional
+        """
+
+        prices, benchmark_prices = _checks._check_append(
+            prices, self.prices, benchmark_prices, self.benchmark_prices
+        )
+        prices = prices.astype(self.dtype, copy=False)
+
+        moments = self._accumulator("moments")
+        peak = self._accumulator("peak")
+        if self.benchmark_prices is not None:
+            comoments = self._accumulator("comoments")
+            benchmark_growth = self._accumulator("benchmark_growth")
+        drawdowns = self._memo.get(("_drawdowns", self._benchmark_version, ()))
+        observations = self.prices.shape[0]
+
+        assets_returns = (
+            pd.concat([self.prices.iloc[[-1]], prices])
+            .astype(np.float64)
+            .pct_change()
+            .iloc[1:]
+        )
+        if self._units is None:
+            returns = pd.DataFrame(
+                assets_returns.to_numpy() @ self.weights.to_numpy(),
+                index=prices.index,
+                columns=[self.name],
+            )
+            state = pd.DataFrame(
+                prices.to_numpy(dtype=np.float64) * self.allocation_assets.to_numpy(),
+                index=prices.index,
+                columns=self.tickers,
+            )
+            state[self.name] = state.sum(axis=1)
+        else:
+            # The simulation continues from the holdings of the last segment
+            values = _stats.forward_fill(
+                prices.to_numpy(dtype=np.float64),
+                self.prices.iloc[-1].to_numpy(dtype=np.float64),
+            )
+            units, starts, aum, trades = _simulate(
+                values,
+                prices.index,
+                self.weights.to_numpy(),
+                self._units[-1],
+                self.rebalancing,
+                self.threshold,
+                observations=observations,
+                previous=self.prices.index[-1],
+            )
+            returns = pd.DataFrame(
+                aum / np.concatenate([[self._aum.iloc[-1]], aum[:-1]]) - 1,
+                index=prices.index,
+                columns=[self.name],
+            )
+            state = pd.DataFrame(
+                self._units_state(values, starts, units),
+                index=prices.index,
+                columns=self.tickers,
+            )
+            state[self.name] = aum
+            self._units = np.vstack([self._units, units[1:]])
+            self._starts = np.concatenate([self._starts, starts + observations])
+            self._trades = np.vstack([self._trades, trades])
+            self.turnover = pd.concat(
+                [
+                    self.turnover,
+                    pd.Series(
+                        np.abs(trades).sum(axis=1),
+                        index=prices.index[starts],
+                        name=self.name,
+                    ),
+                ]
+            )
+        cumulative_returns = (
+            self.cumulative_returns.iloc[-1, 0] * (1 + returns).cumprod()
+        )
+
+        self.prices = pd.concat([self.prices, prices])
+        if self._assets_returns is not None:
+            self._assets_returns = pd.concat(
+                [self._assets_returns, assets_returns.astype(self.dtype)]
+            )
+        self.returns = pd.concat([self.returns, returns])
+        self.cumulative_returns = pd.concat(
+            [self.cumulative_returns, cumulative_returns]
+        )
+        if self._state is not None:
+            self._state = pd.concat(
+                [self._state, state.astype(dict.fromkeys(self.tickers, self.dtype))]
+            )
+        self._aum = pd.concat([self._aum, state[self.name]])
+
+        moments = _stats.merge_moments(moments, _stats.moments(returns.to_numpy()))
+        mean, volatility, skewness, kurtosis = _stats.moment_statistics(moments)
+        self.mean = mean[0]
+        self.arithmetic_mean = self.mean * self.frequency
+        self.geometric_mean = (
+            self.cumulative_returns.iloc[-1, 0]
+            ** (self.frequency / self.returns.shape[0])
+            - 1
+        )
+        self.volatility = volatility[0]
+        self.annual_volatility = self.volatility * np.sqrt(self.frequency)
+        self.skewness = skewness[0]
+        self.kurtosis = kurtosis[0]
+
+        aum = state[self.name]
+        self.min_aum = min(self.min_aum, aum.min())
+        self.max_aum = max(self.max_aum, aum.max())
+        self.mean_aum = (self.mean_aum * observations + aum.sum()) / (
+            observations + aum.shape[0]
+        )
+        self.final_aum = aum.iloc[-1]
+
+        running_peak = np.maximum.accumulate(
+            np.maximum(cumulative_returns.to_numpy(), peak)
+        )
+        new_accumulators = {"moments": moments, "peak": running_peak[-1, 0]}
+
+        if self.benchmark_prices is not None:
+            benchmark_assets_returns = (
+                pd.concat([self.benchmark_prices.iloc[[-1]], benchmark_prices])
+                .pct_change()
+                .iloc[1:]
+            )
+            benchmark_returns = pd.DataFrame(
+                benchmark_assets_returns.to_numpy() @ self.benchmark_weights.to_numpy(),
+                index=prices.index,
+                columns=[self.benchmark_name],
+            )
+
+            self.benchmark_prices = pd.concat([self.benchmark_prices, benchmark_prices])
+            self.benchmark_assets_returns = pd.concat(
+                [self.benchmark_assets_returns, benchmark_assets_returns]
+            )
+            self.benchmark_returns = pd.concat(
+                [self.benchmark_returns, benchmark_returns]
+            )
+
+            comoments = _stats.merge_comoments(
+                comoments,
+                _stats.comoments(returns.to_numpy(), benchmark_returns.to_numpy()),
+            )
+            benchmark_growth = benchmark_growth * np.prod(
+                1 + benchmark_returns.to_numpy()[:, 0]
+            )
+            self.benchmark_mean = comoments[2][0]
+            self.benchmark_arithmetic_mean = self.benchmark_mean * self.frequency
+            self.benchmark_geometric_mean = (
+                benchmark_growth ** (self.frequency / self.benchmark_returns.shape[0])
+                - 1
+            )
+            new_accumulators["comoments"] = comoments
+            new_accumulators["benchmark_growth"] = benchmark_growth
+
+        self._memo.clear()
+        self._rates.clear()
+        self._accumulators.update(new_accumulators)
+        if drawdowns is not None:
+            self._memo[("_drawdowns", self._benchmark_version, ())] = pd.concat(
+                [
+                    drawdowns,
+                    pd.DataFrame(
+                        cumulative_returns.to_numpy() / running_peak - 1,
+                        index=prices.index,
+                        columns=[self.name],
+                    ),
+                ]
+            )
+
+    @property
+    def assets_info(self):
+        """
+        Gives access to the information about assets. It is downloaded on first access
+
+        :return: Information about assets
+        :rtype: np.ndarray
+        """
+
+        if self._assets_info is None:
+            self._load_info()
+
+        return self._assets_info
+
+    @property
+    def assets_names(self):
+        """
+        Gives access to the assets names. They are downloaded on first access
+
+        :return: Assets names
+        :rtype: list
+        """
+
+        if self._assets_names is None:
+            self._load_info()
+
+        return self._assets_names
+
+    def _load_info(self):
+        if self.fetch_info:
+            info, _ = get_info(
+                self.tickers,
+                self.cache,
+                **{
+                    key: value
+                    for key, value in self.download_kwargs.items()
+                    if key in ["source", "workers"]
+                },
+            )
+        else:
+            info = dict()
+
+        assets_info = np.empty(len(self.tickers), dtype=object)
+        assets_names = np.empty(len(self.tickers), dtype="<U64")
+        for i, ticker in enumerate(self.tickers):
+            try:
+                assets_info[i] = info[ticker]
+                assets_names[i] = assets_info[i]["longName"]
+            except Exception:
+                assets_info[i] = ticker
+                assets_names[i] = ticker
+                if self.fetch_info:
+                    warnings.warn(
+                        f"Couldn't obtain `assets_info` and `assets_names` from `yfinance` for ticker `{ticker}`, so value `{ticker}` is assigned to those values for that assset. Use `_set_info_names()` to set `assets_info` and `assets_names` properties as desired"
+                    )
+        self._assets_info = assets_info
+        self._assets_names = assets_names.tolist()
+
     def _set_info_names(self, assets_info=None, assets_names=None):
         print("(Re)setting `assets_info` and `assets_names` properties")
-        self.assets_info = assets_info
-        self.assets_names = assets_names
+        self._assets_info = assets_info
+        self._assets_names = assets_names
+
+    def _rate_conversion(self, annual_rate, index=None):
+        # Per-period rates. Rate series are aligned to the observations of `returns`
+        # (or `index`) and converted once per series contents, as a column that
+        # broadcasts with returns
+        if not isinstance(annual_rate, pd.Series):
+            return (annual_rate + 1) ** (1 / self.frequency) - 1
+
+        index = self.returns.index if index is None else index
+        key = (_stats.series_key(annual_rate), id(index))
+        if key not in self._rates:
+            rates = _checks._check_rate_series(annual_rate, index)
+            # The reference keeps the id of the cached index from being reused
+            _stats.cache_put(
+                self._rates,
+                key,
+                (index, ((rates + 1) ** (1 / self.frequency) - 1)[:, np.newaxis]),
+            )
+
+        return self._rates[key][1]
 
-    def _rate_conversion(self, annual_rate):
-        return (annual_rate + 1) ** (1 / self.frequency) - 1
+    def _returns_index(self, returns):
+        # Index rate series are aligned to. Arrays of returns are aligned to the
+        # observations of the portfolio returns, so they should be as long
+        if isinstance(returns, (pd.Series, pd.DataFrame)):
+            return returns.index
+        if np.shape(returns)[0] != self.returns.shape[0]:
+            raise ValueError(
+                "Returns given as an array should have as many observations as the portfolio returns when the rate is a `pd.Series`"
+            )
+
+        return self.returns.index
+
+    def _mean_rate(self, annual_rate):
+        # Per-period rate, averaged over the observations of rate series
+        rate = self._rate_conversion(annual_rate)
+
+        return rate.mean() if isinstance(annual_rate, pd.Series) else rate
+
+    def _annual_rate(self, annual_rate):
+        # Annual rate, equivalent to the average per-period rate for rate series
+        if not isinstance(annual_rate, pd.Series):
+            return annual_rate
+
+        return (1 + self._mean_rate(annual_rate)) ** self.frequency - 1
+
+    def _rolling_rate(self, annual_rate, window, annual):
+        # Rate of each rolling window, averaged over the window for rate series
+        if not isinstance(annual_rate, pd.Series):
+            return annual_rate if annual else self._rate_conversion(annual_rate)
+
+        rate = _stats.rolling_sum(self._rate_conversion(annual_rate), window)
+        rate = rate[:, 0] / window
+
+        return (1 + rate) ** self.frequency - 1 if annual else rate
 
     def summary_return_moments(self):
         """
@@ -320,7 +812,7 @@ class Analytics:
         :rtype: pd.Series
         """
 
-        return pd.series(
+        return pd.Series(
             [
                 self.mean,
                 self.arithmetic_mean,
@@ -334,7 +826,7 @@ class Analytics:
                 "Mean Return",
                 "Annualized Non-Compounded Mean Return",
                 "Annualized Compounded Mean Return",
-                "Volatiliry",
+                "Volatility",
                 "Annualized Volatility",
                 "Skewness",
                 "Kurtosis",
@@ -358,8 +850,8 @@ class Analytics:
         """
         Calculates excess mean return above Minimum Accepted Return (MAR)
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
         :type annual: bool, optional
         :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
@@ -371,28 +863,109 @@ class Analytics:
         _checks._check_rate_arguments(annual_mar=annual_mar)
 
         if annual and compounding:
-            excess_return = self.geometric_mean - annual_mar
+            mar = self._annual_rate(annual_mar)
+            excess_return = self.geometric_mean - mar
         if annual and not compounding:
-            excess_return = self.arithmetic_mean - annual_mar
+            mar = self._annual_rate(annual_mar)
+            excess_return = self.arithmetic_mean - mar
         if not annual:
-            mar = self._rate_conversion(annual_mar)
+            mar = self._mean_rate(annual_mar)
             excess_return = self.mean - mar
 
         return excess_return
 
-    def net_return(self, percentage=False):
+    def _cost_factors(self, bps, spreads, fees):
+        # Factors of net-of-costs AUM to gross AUM and cumulative costs of every
+        # observation, with one column per cost assumption
+        rates, fees, single = _checks._check_transaction_costs(
+            bps, spreads, fees, len(self.tickers), self._units is not None
+        )
+        aum = self._aum.to_numpy()
+        factors, costs = _stats.transaction_costs(
+            self._trades, aum[self._starts], rates, fees
+        )
+        segments = np.searchsorted(self._starts, np.arange(aum.shape[0]), side="right")
+        factors = np.vstack([np.ones((1, fees.shape[0])), factors])[segments]
+        costs = np.vstack([np.zeros((1, fees.shape[0])), np.cumsum(costs, axis=0)])
+        if single:
+            columns = [self.name]
+        else:
+            columns = pd.RangeIndex(fees.shape[0], name="Cost Assumption")
+
+        return factors, costs[segments], columns
+
+    def net_returns(self, bps=0, spreads=None, fees=0):
+        """
+        Calculates portfolio returns net of the transaction costs of rebalancing trades
+        (the changes of drifted weights back to `weights`), which are paid out of AUM at
+        each rebalance. Any of `bps`, `spreads` and `fees` can be given for many cost
+        assumptions at once, which are all evaluated in one pass
+
+        :param bps: Proportional cost in basis points of the traded value, defaults to 0
+        :type bps: float or np.ndarray, optional
+        :param spreads: Cost of trading each asset in basis points of its traded value (e.g. half of its bid-ask spread), one row per cost assumption, defaults to None
+        :type spreads: list or np.ndarray, optional
+        :param fees: Fixed fee per traded asset at each rebalance, in units of AUM, defaults to 0
+        :type fees: float or np.ndarray, optional
+        :return: Net-of-costs returns, with one column per cost assumption if arrays of them are given
+        :rtype: pd.DataFrame
+        """
+
+        factors, _, columns = self._cost_factors(bps, spreads, fees)
+        aum = self._aum.to_numpy()[:, np.newaxis] * factors
+
+        return pd.DataFrame(
+            aum[1:] / aum[:-1] - 1, index=self.returns.index, columns=columns
+        )
+
+    def transaction_costs(self, bps=0, spreads=None, fees=0):
+        """
+        Calculates cumulative transaction costs of rebalancing trades paid out of AUM.
+        Any of `bps`, `spreads` and `fees` can be given for many cost assumptions at once
+
+        :param bps: Proportional cost in basis points of the traded value, defaults to 0
+        :type bps: float or np.ndarray, optional
+        :param spreads: Cost of trading each asset in basis points of its traded value (e.g. half of its bid-ask spread), one row per cost assumption, defaults to None
+        :type spreads: list or np.ndarray, optional
+        :param fees: Fixed fee per traded asset at each rebalance, in units of AUM, defaults to 0
+        :type fees: float or np.ndarray, optional
+        :return: Cumulative transaction costs, with one column per cost assumption if arrays of them are given
+        :rtype: pd.DataFrame
+        """
+
+        _, costs, columns = self._cost_factors(bps, spreads, fees)
+
+        return pd.DataFrame(costs, index=self.prices.index, columns=columns)
+
+    def net_return(self, percentage=False, bps=0, spreads=None, fees=0):
         """
-        Calculates net investment return
+        Calculates net investment return. Transaction costs of rebalancing trades are
+        deducted if any of `bps`, `spreads` and `fees` is set (see `net_returns()`)
 
         :param percentage: Whether to calculate in percentage or absolute terms, defaults to False
         :type percentage: bool, optional
-        :return: Net investment return
-        :rtype: float
+        :param bps: Proportional cost in basis points of the traded value, defaults to 0
+        :type bps: float or np.ndarray, optional
+        :param spreads: Cost of trading each asset in basis points of its traded value, defaults to None
+        :type spreads: list or np.ndarray, optional
+        :param fees: Fixed fee per traded asset at each rebalance, in units of AUM, defaults to 0
+        :type fees: float or np.ndarray, optional
+        :return: Net investment return (one per cost assumption if arrays of them are given)
+        :rtype: float or np.ndarray
         """
 
         _checks._check_booleans(percentage=percentage)
 
         final_aum = self.final_aum
+        if (
+            spreads is not None
+            or np.any(np.asarray(bps) != 0)
+            or np.any(np.asarray(fees) != 0)
+        ):
+            factors, _, columns = self._cost_factors(bps, spreads, fees)
+            final_aum = final_aum * factors[-1]
+            if isinstance(columns, list):
+                final_aum = final_aum[0]
 
         if not percentage:
             net_return = final_aum - self.initial_aum
@@ -423,7 +996,7 @@ class Analytics:
         elif test == "kolomogorov-smirnov":
             result = stats.kstest(self.returns, distribution)
         elif test == "lilliefors":
-            result = lilliefors(self.returns)
+            result = diagnostic.lilliefors(self.returns)
         elif test == "shapiro-wilk":
             result = stats.shapiro(self.returns)
         elif test == "jarque-barre":
@@ -498,6 +1071,350 @@ class Analytics:
 
         return mean[0]
 
+    def _rolling_frame(self, values, name=None):
+        return pd.DataFrame(
+            values,
+            index=self.returns.index,
+            columns=[self.name if name is None else name],
+        )
+
+    @_memoize
+    def _rolling_moments(self, window):
+        _checks._check_window(window, self.returns.shape[0])
+
+        returns = self.returns.to_numpy()
+        mean, variance = _stats.rolling_moments(returns, window)
+        geometric_mean = _stats.rolling_geometric_mean(returns, window, self.frequency)
+
+        return mean[:, 0], np.sqrt(variance[:, 0]), geometric_mean[:, 0]
+
+    def _rolling_mean_return(self, window, annual, compounding):
+        mean, _, geometric_mean = self._rolling_moments(window)
+
+        if annual and compounding:
+            return geometric_mean
+        elif annual and not compounding:
+            return mean * self.frequency
+        elif not annual:
+            return mean
+
+    def rolling_mean(self, window=252, annual=True, compounding=True):
+        """
+        Calculates rolling mean return. Each window is updated incrementally, so the
+        whole history is calculated in linear time
+
+        :param window: Number of observations in each window, defaults to 252
+        :type window: int, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Rolling mean return, `NaN` before the first full window
+        :rtype: pd.DataFrame
+        """
+
+        _checks._check_rate_arguments(annual=annual, compounding=compounding)
+
+        return self._rolling_frame(
+            self._rolling_mean_return(window, annual, compounding)
+        )
+
+    def rolling_volatility(self, window=252, annual=True):
+        """
+        Calculates rolling volatility (standard deviation)
+
+        :param window: Number of observations in each window, defaults to 252
+        :type window: int, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :return: Rolling volatility, `NaN` before the first full window
+        :rtype: pd.DataFrame
+        """
+
+        _checks._check_rate_arguments(annual=annual)
+
+        volatility = self._rolling_moments(window)[1]
+        if annual:
+            volatility = volatility * np.sqrt(self.frequency)
+
+        return self._rolling_frame(volatility)
+
+    def rolling_sharpe(
+        self, window=252, annual_rfr=0.03, annual=True, compounding=True
+    ):
+        """
+        Calculates rolling Sharpe ratio
+
+        :param window: Number of observations in each window, defaults to 252
+        :type window: int, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Rolling Sharpe ratio, `NaN` before the first full window
+        :rtype: pd.DataFrame
+        """
+
+        _checks._check_rate_arguments(
+            annual_rfr=annual_rfr, annual=annual, compounding=compounding
+        )
+
+        mean = self._rolling_mean_return(window, annual, compounding)
+        volatility = self._rolling_moments(window)[1]
+
+        rfr = self._rolling_rate(annual_rfr, window, annual)
+        if annual:
+            sharpe_ratio = (mean - rfr) / (volatility * np.sqrt(self.frequency))
+        else:
+            sharpe_ratio = (mean - rfr) / volatility
+
+        return self._rolling_frame(sharpe_ratio)
+
+    def rolling_lpm(self, window=252, annual_mar=0.03, moment=3):
+        """
+        Calculates rolling Lower Partial Moment
+
+        :param window: Number of observations in each window, defaults to 252
+        :type window: int, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :param moment: Moment for calculation, defaults to 3
+        :type moment: int, optional
+        :return: Rolling Lower Partial Moment, `NaN` before the first full window
+        :rtype: pd.DataFrame
+        """
+
+        _checks._check_rate_arguments(annual_mar=annual_mar)
+        _checks._check_posints(moment=moment)
+        _checks._check_window(window, self.returns.shape[0])
+
+        mar = self._rate_conversion(annual_mar)
+        shortfall = np.power(np.maximum(mar - self.returns.to_numpy(), 0), moment)
+
+        return self._rolling_frame(_stats.rolling_sum(shortfall, window) / window)
+
+    def rolling_sortino(
+        self,
+        window=252,
+        annual_mar=0.03,
+        annual_rfr=0.03,
+        annual=True,
+        compounding=True,
+    ):
+        """
+        Calculates rolling Sortino ratio
+
+        :param window: Number of observations in each window, defaults to 252
+        :type window: int, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Rolling Sortino ratio, `NaN` before the first full window
+        :rtype: pd.DataFrame
+        """
+
+        _checks._check_rate_arguments(
+            annual_mar=annual_mar,
+            annual_rfr=annual_rfr,
+            annual=annual,
+            compounding=compounding,
+        )
+
+        mean = self._rolling_mean_return(window, annual, compounding)
+        downside_risk = np.sqrt(
+            self.rolling_lpm(window, annual_mar, 2).to_numpy()[:, 0]
+        )
+        rfr = self._rolling_rate(annual_rfr, window, annual)
+
+        return self._rolling_frame((mean - rfr) / downside_risk)
+
+    @_memoize
+    def _rolling_capm(self, window, annual_rfr):
+        _checks._check_window(window, self.returns.shape[0])
+
+        rfr = self._rate_conversion(annual_rfr)
+        if isinstance(annual_rfr, pd.Series):
+            # Regression of excess returns, as the rate varies within windows
+            alpha, beta = _stats.rolling_capm(
+                self.returns.to_numpy() - rfr,
+                self.benchmark_returns.to_numpy() - rfr,
+                window,
+            )
+        else:
+            alpha, beta = _stats.rolling_capm(
+                self.returns.to_numpy(), self.benchmark_returns.to_numpy(), window, rfr
+            )
+
+        return alpha[:, 0], beta[:, 0]
+
+    def rolling_beta(
+        self,
+        window=252,
+        benchmark={
+            "benchmark_tickers": None,
+            "benchmark_prices": None,
+            "benchmark_weights": None,
+            "benchmark_name": "Benchmark Portfolio",
+            "start": "1970-01-02",
+            "end": CURRENT_DATE,
+            "interval": "1d",
+        },
+    ):
+        """
+        Calculates rolling Capital Asset Pricing Model (CAPM) beta
+
+        :param window: Number of observations in each window, defaults to 252
+        :type window: int, optional
+        :param benchmark: Benchmark details that can be provided to set or reset (i.e. change) benchmark portfolio, defaults to { "benchmark_tickers": None, "benchmark_prices": None, "benchmark_weights": None, "benchmark_name": "Benchmark Portfolio", "start": "1970-01-02", "end": CURRENT_DATE, "interval": "1d", }
+        :type benchmark: dict, optional
+        :return: Rolling CAPM beta, `NaN` before the first full window
+        :rtype: pd.DataFrame
+        """
+
+        set_benchmark = _checks._whether_to_set(
+            slf_benchmark_prices=self.benchmark_prices, **benchmark
+        )
+        if set_benchmark:
+            self._set_benchmark(**benchmark)
+
+        return self._rolling_frame(self._rolling_capm(window, 0)[1])
+
+    def rolling_alpha(
+        self,
+        window=252,
+        annual_rfr=0.03,
+        benchmark={
+            "benchmark_tickers": None,
+            "benchmark_prices": None,
+            "benchmark_weights": None,
+            "benchmark_name": "Benchmark Portfolio",
+            "start": "1970-01-02",
+            "end": CURRENT_DATE,
+            "interval": "1d",
+        },
+    ):
+        """
+        Calculates rolling Capital Asset Pricing Model (CAPM) alpha
+
+        :param window: Number of observations in each window, defaults to 252
+        :type window: int, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param benchmark: Benchmark details that can be provided to set or reset (i.e. change) benchmark portfolio, defaults to { "benchmark_tickers": None, "benchmark_prices": None, "benchmark_weights": None, "benchmark_name": "Benchmark Portfolio", "start": "1970-01-02", "end": CURRENT_DATE, "interval": "1d", }
+        :type benchmark: dict, optional
+        :return: Rolling CAPM alpha, `NaN` before the first full window
+        :rtype: pd.DataFrame
+        """
+
+        _checks._check_rate_arguments(annual_rfr=annual_rfr)
+        set_benchmark = _checks._whether_to_set(
+            slf_benchmark_prices=self.benchmark_prices, **benchmark
+        )
+        if set_benchmark:
+            self._set_benchmark(**benchmark)
+
+        return self._rolling_frame(self._rolling_capm(window, annual_rfr)[0])
+
+    def rolling_tracking_error(
+        self,
+        window=252,
+        annual=True,
+        benchmark={
+            "benchmark_tickers": None,
+            "benchmark_prices": None,
+            "benchmark_weights": None,
+            "benchmark_name": "Benchmark Portfolio",
+            "start": "1970-01-02",
+            "end": CURRENT_DATE,
+            "interval": "1d",
+        },
+    ):
+        """
+        Calculates rolling tracking error
+
+        :param window: Number of observations in each window, defaults to 252
+        :type window: int, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param benchmark: Benchmark details that can be provided to set or reset (i.e. change) benchmark portfolio, defaults to { "benchmark_tickers": None, "benchmark_prices": None, "benchmark_weights": None, "benchmark_name": "Benchmark Portfolio", "start": "1970-01-02", "end": CURRENT_DATE, "interval": "1d", }
+        :type benchmark: dict, optional
+        :return: Rolling tracking error, `NaN` before the first full window
+        :rtype: pd.DataFrame
+        """
+
+        _checks._check_rate_arguments(annual=annual)
+        _checks._check_window(window, self.returns.shape[0])
+        set_benchmark = _checks._whether_to_set(
+            slf_benchmark_prices=self.benchmark_prices, **benchmark
+        )
+        if set_benchmark:
+            self._set_benchmark(**benchmark)
+
+        active_returns = self.returns.to_numpy() - self.benchmark_returns.to_numpy()
+        tracking_error = np.sqrt(
+            _stats.rolling_moments(active_returns, window, ddof=0)[1][:, 0]
+        )
+        if annual:
+            tracking_error = tracking_error * np.sqrt(self.frequency)
+
+        return self._rolling_frame(tracking_error)
+
+    def rolling_information_ratio(
+        self,
+        window=252,
+        annual=True,
+        compounding=True,
+        benchmark={
+            "benchmark_tickers": None,
+            "benchmark_prices": None,
+            "benchmark_weights": None,
+            "benchmark_name": "Benchmark Portfolio",
+            "start": "1970-01-02",
+            "end": CURRENT_DATE,
+            "interval": "1d",
+        },
+    ):
+        """
+        Calculates rolling information ratio
+
+        :param window: Number of observations in each window, defaults to 252
+        :type window: int, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :param benchmark: Benchmark details that can be provided to set or reset (i.e. change) benchmark portfolio, defaults to { "benchmark_tickers": None, "benchmark_prices": None, "benchmark_weights": None, "benchmark_name": "Benchmark Portfolio", "start": "1970-01-02", "end": CURRENT_DATE, "interval": "1d", }
+        :type benchmark: dict, optional
+        :return: Rolling information ratio, `NaN` before the first full window
+        :rtype: pd.DataFrame
+        """
+
+        _checks._check_rate_arguments(annual=annual, compounding=compounding)
+        tracking_error = self.rolling_tracking_error(window, annual, benchmark)
+
+        benchmark_returns = self.benchmark_returns.to_numpy()
+        if annual and compounding:
+            benchmark_mean = _stats.rolling_geometric_mean(
+                benchmark_returns, window, self.frequency
+            )
+        else:
+            benchmark_mean = _stats.rolling_moments(benchmark_returns, window)[0]
+            if annual:
+                benchmark_mean = benchmark_mean * self.frequency
+        excess_return = (
+            self._rolling_mean_return(window, annual, compounding)
+            - benchmark_mean[:, 0]
+        )
+
+        return self._rolling_frame(excess_return / tracking_error.to_numpy()[:, 0])
+
     def plot_aum(
         self, style=STYLE, rcParams_update={}, show=True, save=False, **fig_kw
     ):
@@ -507,7 +1424,8 @@ class Analytics:
         :param style: `matplotlib` style to be used for plots. User can pass
                       built-in `matplotlib` style (e.g. `classic`, `fivethirtyeight`),
                       or a path to a custom style defined in a `.mplstyle` document,
-                      defaults to STYLE (propriatery PortAn style)
+                      defaults to STYLE (propriatery PortAn style). `None` keeps
+                      the style currently in use
         :type style: str, optional
         :param rcParams_update: `matplotlib.rcParams` to modify the style defined by
                                 `style` argument, defaults to {} (no modification)
@@ -520,15 +1438,16 @@ class Analytics:
 
         _checks._check_plot_arguments(show=show, save=save)
 
-        plt.style.use(style)
+        if style is not None:
+            plt.style.use(style)
         plt.rcParams.update(**rcParams_update)
         fig, ax = plt.subplots(**fig_kw)
-        self.state[self.name].plot(ax=ax)
+        self._aum.plot(ax=ax)
         ax.set_xlabel("Date")
         ax.set_ylabel("AUM")
         ax.set_title("Assets Under Management")
         if save:
-            plt.savefig(f"{self.name}_aum")
+            fig.savefig(f"{self.name}_aum")
         if show:
             plt.show()
 
@@ -543,7 +1462,8 @@ class Analytics:
         :param style: `matplotlib` style to be used for plots. User can pass
                       built-in `matplotlib` style (e.g. `classic`, `fivethirtyeight`),
                       or a path to a custom style defined in a `.mplstyle` document,
-                      defaults to STYLE (propriatery PortAn style)
+                      defaults to STYLE (propriatery PortAn style). `None` keeps
+                      the style currently in use
         :type style: str, optional
         :param rcParams_update: `matplotlib.rcParams` to modify the style defined by
                                 `style` argument, defaults to {} (no modification)
@@ -556,7 +1476,8 @@ class Analytics:
 
         _checks._check_plot_arguments(show=show, save=save)
 
-        plt.style.use(style)
+        if style is not None:
+            plt.style.use(style)
         plt.rcParams.update(**rcParams_update)
         fig, ax = plt.subplots(**fig_kw)
         self.returns.plot(ax=ax)
@@ -564,7 +1485,7 @@ class Analytics:
         ax.set_ylabel("Return")
         ax.set_title("Portfolio Returns")
         if save:
-            plt.savefig(f"{self.name}_returns")
+            fig.savefig(f"{self.name}_returns")
         if show:
             plt.show()
 
@@ -579,7 +1500,8 @@ class Analytics:
         :param style: `matplotlib` style to be used for plots. User can pass
                       built-in `matplotlib` style (e.g. `classic`, `fivethirtyeight`),
                       or a path to a custom style defined in a `.mplstyle` document,
-                      defaults to STYLE (propriatery PortAn style)
+                      defaults to STYLE (propriatery PortAn style). `None` keeps
+                      the style currently in use
         :type style: str, optional
         :param rcParams_update: `matplotlib.rcParams` to modify the style defined by
                                 `style` argument, defaults to {} (no modification)
@@ -592,7 +1514,8 @@ class Analytics:
 
         _checks._check_plot_arguments(show=show, save=save)
 
-        plt.style.use(style)
+        if style is not None:
+            plt.style.use(style)
         plt.rcParams.update(**rcParams_update)
         fig, ax = plt.subplots(**fig_kw)
         self.returns.plot.hist(ax=ax, bins=100)
@@ -600,7 +1523,7 @@ class Analytics:
         ax.set_ylabel("Return Frequency")
         ax.set_title("Portfolio Return Distribution")
         if save:
-            plt.savefig(f"{self.name}_return_distribution")
+            fig.savefig(f"{self.name}_return_distribution")
         if show:
             plt.show()
 
@@ -615,7 +1538,8 @@ class Analytics:
         :param style: `matplotlib` style to be used for plots. User can pass
                       built-in `matplotlib` style (e.g. `classic`, `fivethirtyeight`),
                       or a path to a custom style defined in a `.mplstyle` document,
-                      defaults to STYLE (propriatery PortAn style)
+                      defaults to STYLE (propriatery PortAn style). `None` keeps
+                      the style currently in use
         :type style: str, optional
         :param rcParams_update: `matplotlib.rcParams` to modify the style defined by
                                 `style` argument, defaults to {} (no modification)
@@ -628,7 +1552,8 @@ class Analytics:
 
         _checks._check_plot_arguments(show=show, save=save)
 
-        plt.style.use(style)
+        if style is not None:
+            plt.style.use(style)
         plt.rcParams.update(**rcParams_update)
         fig, ax = plt.subplots(**fig_kw)
         self.cumulative_returns.plot(ax=ax)
@@ -636,7 +1561,7 @@ class Analytics:
         ax.set_ylabel("Cumulative Return")
         ax.set_title("Portfolio Cumulative Returns")
         if save:
-            plt.savefig(f"{self.name}_cumulative_returns")
+            fig.savefig(f"{self.name}_cumulative_returns")
         if show:
             plt.show()
 
@@ -651,7 +1576,8 @@ class Analytics:
         :param style: `matplotlib` style to be used for plots. User can pass
                       built-in `matplotlib` style (e.g. `classic`, `fivethirtyeight`),
                       or a path to a custom style defined in a `.mplstyle` document,
-                      defaults to STYLE (propriatery PortAn style)
+                      defaults to STYLE (propriatery PortAn style). `None` keeps
+                      the style currently in use
         :type style: str, optional
         :param rcParams_update: `matplotlib.rcParams` to modify the style defined by
                                 `style` argument, defaults to {} (no modification)
@@ -677,7 +1603,8 @@ class Analytics:
         wp = {"linewidth": 1, "edgecolor": "black"}
         explode = tuple(repeat(0.05, len(allocation.index)))
 
-        plt.style.use(style)
+        if style is not None:
+            plt.style.use(style)
         plt.rcParams.update(**rcParams_update)
         fig, ax = plt.subplots(**fig_kw)
         pie = ax.pie(
@@ -699,7 +1626,7 @@ class Analytics:
         plt.setp(pie[2], size=9, weight="bold")
         ax.set_title(f"{self.name} Holdings")
         if save:
-            plt.savefig(f"{self.name}_holdings")
+            fig.savefig(f"{self.name}_holdings")
         if show:
             plt.show()
 
@@ -714,7 +1641,8 @@ class Analytics:
         :param style: `matplotlib` style to be used for plots. User can pass
                       built-in `matplotlib` style (e.g. `classic`, `fivethirtyeight`),
                       or a path to a custom style defined in a `.mplstyle` document,
-                      defaults to STYLE (propriatery PortAn style)
+                      defaults to STYLE (propriatery PortAn style). `None` keeps
+                      the style currently in use
         :type style: str, optional
         :param rcParams_update: `matplotlib.rcParams` to modify the style defined by
                                 `style` argument, defaults to {} (no modification)
@@ -729,7 +1657,8 @@ class Analytics:
 
         assets_cumulative_returns = (self.assets_returns + 1).cumprod()
 
-        plt.style.use(style)
+        if style is not None:
+            plt.style.use(style)
         plt.rcParams.update(**rcParams_update)
         fig, ax = plt.subplots(**fig_kw)
         assets_cumulative_returns.plot(ax=ax)
@@ -738,7 +1667,7 @@ class Analytics:
         ax.set_title("Assets Cumulative Returns")
         ax.legend(labels=self.assets_names)
         if save:
-            plt.savefig(f"{self.name}_assets_cumulative_returns")
+            fig.savefig(f"{self.name}_assets_cumulative_returns")
         if show:
             plt.show()
 
@@ -765,8 +1694,8 @@ class Analytics:
         """
         Estimates Capital Asset Pricing Model (CAPM) parameters
 
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param benchmark: Benchmark details that can be provided to set or reset (i.e. change) benchmark portfolio, defaults to { "benchmark_tickers": None, "benchmark_prices": None, "benchmark_weights": None, "benchmark_name": "Benchmark Portfolio", "start": "1970-01-02", "end": CURRENT_DATE, "interval": "1d", }
         :type benchmark: dict, optional
         :return: CAPM alpha, beta, epsilon, R-squared
@@ -781,15 +1710,31 @@ class Analytics:
         if set_benchmark:
             self._set_benchmark(**benchmark)
 
+        alpha, beta, epsilon, r_squared = self._capm(annual_rfr)
+
+        return alpha, beta, epsilon.copy(), r_squared
+
+    @_memoize
+    def _capm(self, annual_rfr):
         rfr = self._rate_conversion(annual_rfr)
-        excess_returns = self.returns - rfr
-        excess_benchmark_returns = self.benchmark_returns - rfr
+        returns = self.returns.to_numpy()
+        benchmark_returns = self.benchmark_returns.to_numpy()
 
-        model = LinearRegression().fit(excess_benchmark_returns, excess_returns)
-        alpha = model.intercept_[0]
-        beta = model.coef_[0][0]
-        epsilon = excess_returns.to_numpy() - alpha - beta * excess_benchmark_returns
-        r_squared = model.score(excess_benchmark_returns, excess_returns)
+        if isinstance(annual_rfr, pd.Series):
+            # Regression of excess returns, as the rate varies over time
+            alpha, beta, r_squared, _ = _stats.capm(
+                returns - rfr, benchmark_returns - rfr
+            )
+        else:
+            alpha, beta, r_squared, _ = _stats.capm_parameters(
+                self._accumulator("comoments"), rfr
+            )
+        alpha, beta, r_squared = alpha[0, 0], beta[0, 0], r_squared[0, 0]
+        epsilon = pd.DataFrame(
+            returns - rfr - alpha - beta * (benchmark_returns - rfr),
+            index=self.benchmark_returns.index,
+            columns=self.benchmark_returns.columns,
+        )
 
         return alpha, beta, epsilon, r_squared
 
@@ -814,12 +1759,13 @@ class Analytics:
         """
         Plots Capital Asset Pricing Model (CAPM) model elements
 
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param style: `matplotlib` style to be used for plots. User can pass
                       built-in `matplotlib` style (e.g. `classic`, `fivethirtyeight`),
                       or a path to a custom style defined in a `.mplstyle` document,
-                      defaults to STYLE (propriatery PortAn style)
+                      defaults to STYLE (propriatery PortAn style). `None` keeps
+                      the style currently in use
         :type style: str, optional
         :param rcParams_update: `matplotlib.rcParams` to modify the style defined by
                                 `style` argument, defaults to {} (no modification)
@@ -840,7 +1786,8 @@ class Analytics:
         excess_returns = self.returns - rfr
         excess_benchmark_returns = self.benchmark_returns - rfr
 
-        plt.style.use(style)
+        if style is not None:
+            plt.style.use(style)
         plt.rcParams.update(**rcParams_update)
         fig, ax = plt.subplots(**fig_kw)
         ax.scatter(excess_benchmark_returns, excess_returns, color="C1")
@@ -862,7 +1809,7 @@ class Analytics:
         ax.set_ylabel("Portfolio Excess Return")
         ax.set_title("Portfolio Excess Returns Against Benchmark (CAPM)")
         if save:
-            plt.savefig(f"{self.name}_capm")
+            fig.savefig(f"{self.name}_capm")
         if show:
             plt.show()
 
@@ -880,8 +1827,8 @@ class Analytics:
         """
         Calculates Sharpe ratio
 
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
         :type annual: bool, optional
         :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
@@ -902,11 +1849,13 @@ class Analytics:
         _checks._check_sharpe(adjusted=adjusted, probabilistic=probabilistic)
 
         if annual and compounding:
-            sharpe_ratio = (self.geometric_mean - annual_rfr) / self.annual_volatility
+            rfr = self._annual_rate(annual_rfr)
+            sharpe_ratio = (self.geometric_mean - rfr) / self.annual_volatility
         elif annual and not compounding:
-            sharpe_ratio = (self.arithmetic_mean - annual_rfr) / self.annual_volatility
+            rfr = self._annual_rate(annual_rfr)
+            sharpe_ratio = (self.arithmetic_mean - rfr) / self.annual_volatility
         elif not annual:
-            rfr = self._rate_conversion(annual_rfr)
+            rfr = self._mean_rate(annual_rfr)
             sharpe_ratio = (self.mean - rfr) / self.volatility
 
         if adjusted:
@@ -950,8 +1899,8 @@ class Analytics:
         """
         Expected excess portfolio return estimated by Capital Asset Pricing Model (CAPM)
 
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
         :type annual: bool, optional
         :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
@@ -965,11 +1914,13 @@ class Analytics:
         capm = self.capm(annual_rfr, benchmark)
 
         if annual and compounding:
-            mean = annual_rfr + capm[1] * (self.benchmark_geometric_mean - annual_rfr)
+            rfr = self._annual_rate(annual_rfr)
+            mean = rfr + capm[1] * (self.benchmark_geometric_mean - rfr)
         elif annual and not compounding:
-            mean = annual_rfr + capm[1] * (self.benchmark_arithmetic_mean - annual_rfr)
+            rfr = self._annual_rate(annual_rfr)
+            mean = rfr + capm[1] * (self.benchmark_arithmetic_mean - rfr)
         elif not annual:
-            rfr = self._rate_conversion(annual_rfr)
+            rfr = self._mean_rate(annual_rfr)
             mean = rfr + capm[1] * (self.benchmark_mean - rfr)
 
         return mean
@@ -1093,8 +2044,8 @@ class Analytics:
         """
         Calculates volatility skewness
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :return: Volatility skewness
         :rtype: float
         """
@@ -1114,8 +2065,8 @@ class Analytics:
         """
         Calculates omega excess return
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
         :type annual: bool, optional
         :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
@@ -1166,10 +2117,10 @@ class Analytics:
         """
         Calculates Sortino ratio
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
         :type annual: bool, optional
         :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
@@ -1188,11 +2139,13 @@ class Analytics:
         downside_risk = self.downside_risk(annual_mar)
 
         if annual and compounding:
-            sortino_ratio = (self.geometric_mean - annual_rfr) / downside_risk
+            rfr = self._annual_rate(annual_rfr)
+            sortino_ratio = (self.geometric_mean - rfr) / downside_risk
         elif annual and not compounding:
-            sortino_ratio = (self.arithmetic_mean - annual_rfr) / downside_risk
+            rfr = self._annual_rate(annual_rfr)
+            sortino_ratio = (self.arithmetic_mean - rfr) / downside_risk
         elif not annual:
-            rfr = self._rate_conversion(annual_rfr)
+            rfr = self._mean_rate(annual_rfr)
             sortino_ratio = (self.mean - rfr) / downside_risk
 
         return sortino_ratio
@@ -1215,8 +2168,8 @@ class Analytics:
         """
         Calculates Jensen alpha
 
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
         :type annual: bool, optional
         :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
@@ -1234,19 +2187,21 @@ class Analytics:
         capm = self.capm(annual_rfr, benchmark)
 
         if annual and compounding:
+            rfr = self._annual_rate(annual_rfr)
             jensen_alpha = (
                 self.geometric_mean
-                - annual_rfr
-                - capm[1] * (self.benchmark_geometric_mean - annual_rfr)
+                - rfr
+                - capm[1] * (self.benchmark_geometric_mean - rfr)
             )
         elif annual and not compounding:
+            rfr = self._annual_rate(annual_rfr)
             jensen_alpha = (
                 self.arithmetic_mean
-                - annual_rfr
-                - capm[1] * (self.benchmark_arithmetic_mean - annual_rfr)
+                - rfr
+                - capm[1] * (self.benchmark_arithmetic_mean - rfr)
             )
         elif not annual:
-            rfr = self._rate_conversion(annual_rfr)
+            rfr = self._mean_rate(annual_rfr)
             jensen_alpha = self.mean - rfr - capm[1] * (self.benchmark_mean - rfr)
 
         return jensen_alpha
@@ -1269,8 +2224,8 @@ class Analytics:
         """
         Calculates Treynor ratio
 
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
         :type annual: bool, optional
         :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
@@ -1288,21 +2243,24 @@ class Analytics:
         capm = self.capm(annual_rfr, benchmark)
 
         if annual and compounding:
-            treynor_ratio = (self.geometric_mean - annual_rfr) / capm[1]
+            rfr = self._annual_rate(annual_rfr)
+            treynor_ratio = (self.geometric_mean - rfr) / capm[1]
         elif annual and not compounding:
-            treynor_ratio = (self.arithmetic_mean - annual_rfr) / capm[1]
+            rfr = self._annual_rate(annual_rfr)
+            treynor_ratio = (self.arithmetic_mean - rfr) / capm[1]
         elif not annual:
-            rfr = self._rate_conversion(annual_rfr)
+            rfr = self._mean_rate(annual_rfr)
             treynor_ratio = (self.mean - rfr) / capm[1]
 
         return treynor_ratio
 
+    @_memoize
     def hpm(self, annual_mar=0.03, moment=3):
         """
         Calculates Higher Partial Moment
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :param moment: Moment for calculation, defaults to 3
         :type moment: int, optional
         :return: Higher Partial Moment
@@ -1321,12 +2279,13 @@ class Analytics:
 
         return higher_partial_moment[0]
 
+    @_memoize
     def lpm(self, annual_mar=0.03, moment=3):
         """
         Calculates Lower Partial Moment
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :param moment: Moment for calculation, defaults to 3
         :type moment: int, optional
         :return: Lower Partial Moment
@@ -1349,8 +2308,8 @@ class Analytics:
         """
         Calculates Kappa
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :param moment: Moment for calculation, defaults to 3
         :type moment: int, optional
         :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
@@ -1369,19 +2328,21 @@ class Analytics:
         lower_partial_moment = self.lpm(annual_mar, moment)
 
         if annual and compounding:
+            mar = self._annual_rate(annual_mar)
             kappa_ratio = (
                 100
-                * (self.geometric_mean - annual_mar)
+                * (self.geometric_mean - mar)
                 / np.power(lower_partial_moment, (1 / moment))
             )
         elif annual and not compounding:
+            mar = self._annual_rate(annual_mar)
             kappa_ratio = (
                 100
-                * (self.arithmetic_mean - annual_mar)
+                * (self.arithmetic_mean - mar)
                 / np.power(lower_partial_moment, (1 / moment))
             )
         elif not annual:
-            mar = self._rate_conversion(annual_mar)
+            mar = self._mean_rate(annual_mar)
             kappa_ratio = (self.mean - mar) / np.power(
                 lower_partial_moment, (1 / moment)
             )
@@ -1413,8 +2374,8 @@ class Analytics:
         :type periods: int, optional
         :param inverse: Whether to invert (i.e. make positive) maximum drawdown, defaults to True
         :type inverse: bool, optional
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
         :type annual: bool, optional
         :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
@@ -1430,11 +2391,13 @@ class Analytics:
         maximum_drawdown = self.maximum_drawdown(periods=periods, inverse=inverse)
 
         if annual and compounding:
-            calmar_ratio = (self.geometric_mean - annual_rfr) / maximum_drawdown
+            rfr = self._annual_rate(annual_rfr)
+            calmar_ratio = (self.geometric_mean - rfr) / maximum_drawdown
         elif annual and not compounding:
-            calmar_ratio = (self.arithmetic_mean - annual_rfr) / maximum_drawdown
+            rfr = self._annual_rate(annual_rfr)
+            calmar_ratio = (self.arithmetic_mean - rfr) / maximum_drawdown
         elif not annual:
-            rfr = self._rate_conversion(annual_rfr)
+            rfr = self._mean_rate(annual_rfr)
             calmar_ratio = (self.mean - rfr) / maximum_drawdown
 
         return calmar_ratio
@@ -1448,12 +2411,13 @@ class Analytics:
         annual=True,
         compounding=True,
         original=True,
+        episodes=False,
     ):
         """
         Calculates Sterling ratio
 
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param annual_excess: Annual return above average largest drawdown, defaults to 0.1
         :type annual_excess: float, optional
         :param largest: Number of largest drawdowns taken into consideration for the calculation, defaults to 0
@@ -1466,6 +2430,8 @@ class Analytics:
         :type compounding: bool, optional
         :param original: Whether to calculate the original version of Sterling ratio or Sterling-Calmar ratio, defaults to True
         :type original: bool, optional
+        :param episodes: Whether to average the drawdowns of distinct episodes (see `drawdown_episodes()`) instead of drawdowns at each time-point, defaults to False
+        :type episodes: bool, optional
         :return: Sterling ratio
         :rtype: float
         """
@@ -1474,7 +2440,9 @@ class Analytics:
             annual_rfr=annual_rfr, annual=annual, compounding=compounding
         )
 
-        average_drawdown = self.average_drawdown(largest=largest, inverse=inverse)
+        average_drawdown = self.average_drawdown(
+            largest=largest, inverse=inverse, episodes=episodes
+        )
 
         if original:
             if annual and compounding:
@@ -1491,11 +2459,13 @@ class Analytics:
 
         else:
             if annual and compounding:
-                sterling_ratio = (self.geometric_mean - annual_rfr) / average_drawdown
+                rfr = self._annual_rate(annual_rfr)
+                sterling_ratio = (self.geometric_mean - rfr) / average_drawdown
             elif annual and not compounding:
-                sterling_ratio = (self.arithmetic_mean - annual_rfr) / average_drawdown
+                rfr = self._annual_rate(annual_rfr)
+                sterling_ratio = (self.arithmetic_mean - rfr) / average_drawdown
             elif not annual:
-                rfr = self._rate_conversion(annual_rfr)
+                rfr = self._mean_rate(annual_rfr)
                 sterling_ratio = (self.mean - rfr) / average_drawdown
 
         return sterling_ratio
@@ -1508,10 +2478,8 @@ class Analytics:
         :rtype: float
         """
 
-        ss_drawdowns = (
-            (100 * (self.state[self.name] / self.state[self.name].cummax() - 1)) ** 2
-        ).sum()
-        ulcer_index = np.sqrt(ss_drawdowns / self.state.shape[0])
+        ss_drawdowns = ((100 * (self._aum / self._aum.cummax() - 1)) ** 2).sum()
+        ulcer_index = np.sqrt(ss_drawdowns / self._aum.shape[0])
 
         return ulcer_index
 
@@ -1524,8 +2492,8 @@ class Analytics:
         """
         Calculates Martin ratio
 
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
         :type annual: bool, optional
         :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
@@ -1541,11 +2509,13 @@ class Analytics:
         ulcer_index = self.ulcer()
 
         if annual and compounding:
-            martin_ratio = (self.geometric_mean - annual_rfr) / ulcer_index
+            rfr = self._annual_rate(annual_rfr)
+            martin_ratio = (self.geometric_mean - rfr) / ulcer_index
         elif annual and not compounding:
-            martin_ratio = (self.arithmetic_mean - annual_rfr) / ulcer_index
+            rfr = self._annual_rate(annual_rfr)
+            martin_ratio = (self.arithmetic_mean - rfr) / ulcer_index
         elif not annual:
-            rfr = self._rate_conversion(annual_rfr)
+            rfr = self._mean_rate(annual_rfr)
             martin_ratio = (self.mean - rfr) / ulcer_index
 
         return martin_ratio
@@ -1611,7 +2581,8 @@ class Analytics:
         :param style: `matplotlib` style to be used for plots. User can pass
                       built-in `matplotlib` style (e.g. `classic`, `fivethirtyeight`),
                       or a path to a custom style defined in a `.mplstyle` document,
-                      defaults to STYLE (propriatery PortAn style)
+                      defaults to STYLE (propriatery PortAn style). `None` keeps
+                      the style currently in use
         :type style: str, optional
         :param rcParams_update: `matplotlib.rcParams` to modify the style defined by
                                 `style` argument, defaults to {} (no modification)
@@ -1632,7 +2603,8 @@ class Analytics:
 
         cutoff = (np.abs(x - var)).argmin()
 
-        plt.style.use(style)
+        if style is not None:
+            plt.style.use(style)
         plt.rcParams.update(**rcParams_update)
         fig, ax = plt.subplots(**fig_kw)
         ax.plot(
@@ -1653,7 +2625,7 @@ class Analytics:
         ax.set_ylabel("Density of Return")
         ax.set_title("Parametric VaR Plot")
         if save:
-            plt.savefig(f"{self.name}_parametric_var")
+            fig.savefig(f"{self.name}_parametric_var")
         if show:
             plt.show()
 
@@ -1685,7 +2657,8 @@ class Analytics:
         :param style: `matplotlib` style to be used for plots. User can pass
                       built-in `matplotlib` style (e.g. `classic`, `fivethirtyeight`),
                       or a path to a custom style defined in a `.mplstyle` document,
-                      defaults to STYLE (propriatery PortAn style)
+                      defaults to STYLE (propriatery PortAn style). `None` keeps
+                      the style currently in use
         :type style: str, optional
         :param rcParams_update: `matplotlib.rcParams` to modify the style defined by
                                 `style` argument, defaults to {} (no modification)
@@ -1706,7 +2679,8 @@ class Analytics:
             number_of_bins,
         )[:, 0]
 
-        plt.style.use(style)
+        if style is not None:
+            plt.style.use(style)
         plt.rcParams.update(**rcParams_update)
         fig, ax = plt.subplots(**fig_kw)
         ax.hist(
@@ -1720,7 +2694,7 @@ class Analytics:
         ax.set_ylabel("Frequency of Return")
         ax.set_title("Historical VaR Plot")
         if save:
-            plt.savefig(f"{self.name}_historical_var")
+            fig.savefig(f"{self.name}_historical_var")
         if show:
             plt.show()
 
@@ -1747,7 +2721,8 @@ class Analytics:
         :param style: `matplotlib` style to be used for plots. User can pass
                       built-in `matplotlib` style (e.g. `classic`, `fivethirtyeight`),
                       or a path to a custom style defined in a `.mplstyle` document,
-                      defaults to STYLE (propriatery PortAn style)
+                      defaults to STYLE (propriatery PortAn style). `None` keeps
+                      the style currently in use
         :type style: str, optional
         :param rcParams_update: `matplotlib.rcParams` to modify the style defined by
                                 `style` argument, defaults to {} (no modification)
@@ -1762,13 +2737,14 @@ class Analytics:
 
         matrix = self.correlation()
 
-        plt.style.use(style)
+        if style is not None:
+            plt.style.use(style)
         plt.rcParams.update(**rcParams_update)
         fig, ax = plt.subplots(**fig_kw)
         sns.heatmap(matrix, vmin=-1, vmax=1, center=0, annot=True, ax=ax)
         ax.set_title("Correlation Matrix")
         if save:
-            plt.savefig(f"{self.name}_correlation")
+            fig.savefig(f"{self.name}_correlation")
         if show:
             plt.show()
 
@@ -1869,7 +2845,8 @@ class Analytics:
         :param style: `matplotlib` style to be used for plots. User can pass
                       built-in `matplotlib` style (e.g. `classic`, `fivethirtyeight`),
                       or a path to a custom style defined in a `.mplstyle` document,
-                      defaults to STYLE (propriatery PortAn style)
+                      defaults to STYLE (propriatery PortAn style). `None` keeps
+                      the style currently in use
         :type style: str, optional
         :param rcParams_update: `matplotlib.rcParams` to modify the style defined by
                                 `style` argument, defaults to {} (no modification)
@@ -1887,13 +2864,14 @@ class Analytics:
 
         matrix = self.covariance(method, annual, **cov_kwargs)
 
-        plt.style.use(style)
+        if style is not None:
+            plt.style.use(style)
         plt.rcParams.update(**rcParams_update)
         fig, ax = plt.subplots(**fig_kw)
         sns.heatmap(matrix, vmin=0, center=0, annot=True, ax=ax)
         ax.set_title("Covariance Matrix")
         if save:
-            plt.savefig(f"{self.name}_covariance")
+            fig.savefig(f"{self.name}_covariance")
         if show:
             plt.show()
 
@@ -1905,8 +2883,8 @@ class Analytics:
 
         :param returns: Array with portfolio returns for which the omega ratio is to be calculated (if different from the object portfolio), defaults to None
         :type returns: np.ndarray, optional
-        :param annual_mar: Annual Minimum Acceptable Return (MAR)., defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Acceptable Return (MAR), or its time-series (aligned to the observations of the portfolio if `returns` is an array), defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :return: Omega ratio of the portfolio
         :rtype: float
         """
@@ -1916,7 +2894,12 @@ class Analytics:
 
         _checks._check_rate_arguments(annual_mar=annual_mar)
 
-        mar = self._rate_conversion(annual_mar)
+        if isinstance(annual_mar, pd.Series):
+            mar = self._rate_conversion(annual_mar, self._returns_index(returns))
+            if np.ndim(returns) == 1:
+                mar = mar[:, 0]
+        else:
+            mar = self._rate_conversion(annual_mar)
         excess_returns = returns - mar
         winning = excess_returns[excess_returns > 0].sum()
         losing = -(excess_returns[excess_returns <= 0].sum())
@@ -1932,8 +2915,8 @@ class Analytics:
         """
         Calculates Omega-Sharpe ratio
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :return: Omega-Sharpe ratio
         :rtype: float
         """
@@ -1949,6 +2932,52 @@ class Analytics:
 
         return omega_sharpe_ratio
 
+    def omega_curve(
+        self,
+        returns=None,
+        annual_mar=None,
+        annual_mar_lower_bound=0,
+        annual_mar_upper_bound=0.1,
+    ):
+        """
+        Calculates Omega values across different Minimum Acceptable Returns (MAR)
+        for single or multiple portfolios. Each returns series is sorted only once,
+        and the whole MAR grid is evaluated with its prefix sums
+
+        :param returns: Array with portfolio returns for which the omega ratio is to be calculated (if different from the object portfolio), defaults to None
+        :type returns: np.ndarray or pd.DataFrame, optional
+        :param annual_mar: Grid of annual MAR values, defaults to None (evenly spaced between `annual_mar_lower_bound` and `annual_mar_upper_bound`)
+        :type annual_mar: float, list or np.ndarray, optional
+        :param annual_mar_lower_bound: Lower bound for MAR that will be taken to calculate the values for curves, defaults to 0
+        :type annual_mar_lower_bound: float, optional
+        :param annual_mar_upper_bound: Upper bound for MAR that will be taken to calculate the values for curves, defaults to 0.1
+        :type annual_mar_upper_bound: float, optional
+        :return: Omega values with one row per MAR value and one column per portfolio
+        :rtype: pd.DataFrame
+        """
+
+        if returns is None:
+            returns = self.returns
+
+        returns = _checks._check_omega_multiple_returns(returns=returns)
+        if annual_mar is None:
+            _checks._check_mar_bounds(
+                annual_mar_lower_bound=annual_mar_lower_bound,
+                annual_mar_upper_bound=annual_mar_upper_bound,
+            )
+            annual_mar = np.linspace(
+                annual_mar_lower_bound,
+                annual_mar_upper_bound,
+                round(100 * (annual_mar_upper_bound - annual_mar_lower_bound)),
+            )
+        annual_mar = _checks._check_rate_grid("annual_mar", annual_mar)
+
+        curve = _stats.omega_curve(
+            returns.to_numpy(), self._rate_conversion(annual_mar)
+        )
+
+        return pd.DataFrame(curve, index=annual_mar, columns=returns.columns)
+
     def plot_omega_curve(
         self,
         returns=None,
@@ -1973,7 +3002,8 @@ class Analytics:
         :param style: `matplotlib` style to be used for plots. User can pass
                       built-in `matplotlib` style (e.g. `classic`, `fivethirtyeight`),
                       or a path to a custom style defined in a `.mplstyle` document,
-                      defaults to STYLE (propriatery PortAn style)
+                      defaults to STYLE (propriatery PortAn style). `None` keeps
+                      the style currently in use
         :type style: str, optional
         :param rcParams_update: `matplotlib.rcParams` to modify the style defined by
                                 `style` argument, defaults to {} (no modification)
@@ -1984,31 +3014,20 @@ class Analytics:
         :type save: bool, optional
         """
 
-        if returns is None:
-            returns = self.returns
-
-        _checks._check_omega_multiple_returns(returns=returns)
         _checks._check_plot_arguments(show=show, save=save)
-        _checks._check_mar_bounds(
-            annual_mar_lower_bound=annual_mar_lower_bound,
-            annual_mar_upper_bound=annual_mar_upper_bound,
-        )
 
-        mar_array = np.linspace(
-            annual_mar_lower_bound,
-            annual_mar_upper_bound,
-            round(100 * (annual_mar_upper_bound - annual_mar_lower_bound)),
+        all_values = np.round(
+            self.omega_curve(
+                returns,
+                annual_mar_lower_bound=annual_mar_lower_bound,
+                annual_mar_upper_bound=annual_mar_upper_bound,
+            ),
+            5,
         )
-        all_values = pd.DataFrame(index=mar_array, columns=returns.columns)
+        _checks._check_omega_curves(all_values)
 
-        for portfolio in returns.columns:
-            omega_values = list()
-            for mar in mar_array:
-                value = np.round(self.omega_ratio(returns[portfolio], mar), 5)
-                omega_values.append(value)
-            all_values[portfolio] = omega_values
-
-        plt.style.use(style)
+        if style is not None:
+            plt.style.use(style)
         plt.rcParams.update(**rcParams_update)
         fig, ax = plt.subplots(**fig_kw)
         all_values.plot(ax=ax)
@@ -2016,12 +3035,88 @@ class Analytics:
         ax.set_ylabel("Omega Ratio")
         ax.set_title("Omega Curves")
         if save:
-            plt.savefig("omega_curves")
+            fig.savefig("omega_curves")
         if show:
             plt.show()
 
         return fig
 
+    def sweep(
+        self,
+        metrics=None,
+        annual_rfr=0.03,
+        annual_mar=0.03,
+        moment=3,
+        annual=True,
+        compounding=True,
+    ):
+        """
+        Calculates statistics and ratios across grids of Risk-free Rates (RFR),
+        Minimum Accepted Returns (MAR) and moments at once. Returns are sorted
+        only once and partial moments at all MAR values are evaluated with
+        prefix sums of the sorted returns, instead of a pass over the returns
+        per metric and per grid point. Values are the same as the ones of the
+        methods with the same names
+
+        :param metrics: Names of the methods to be swept, defaults to None (all of `excess_mar`, `sharpe`, `sortino`,
+                        `kappa`, `omega_ratio`, `omega_sharpe_ratio`, `upside_frequency`, `downside_frequency`, `lpm`,
+                        `hpm`, `upside_potential`, `upside_risk`, `upside_variance`, `downside_potential`,
+                        `downside_risk`, `downside_variance` and `volatility_skewness`)
+        :type metrics: list, optional
+        :param annual_rfr: Annual Risk-free Rate(s) (RFR), defaults to 0.03
+        :type annual_rfr: float or np.ndarray, optional
+        :param annual_mar: Annual Minimum Accepted Return(s) (MAR), defaults to 0.03
+        :type annual_mar: float or np.ndarray, optional
+        :param moment: Moment(s) for `kappa`, `lpm` and `hpm`, defaults to 3
+        :type moment: int or np.ndarray, optional
+        :param annual: Whether to calculate the statistics on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Table with one row per (`annual_rfr`, `annual_mar`, `moment`) grid point and one column per metric
+        :rtype: pd.DataFrame
+        """
+
+        metrics, annual_rfr, annual_mar, moment = _checks._check_sweep_arguments(
+            metrics=metrics,
+            annual_rfr=annual_rfr,
+            annual_mar=annual_mar,
+            moment=moment,
+            annual=annual,
+            compounding=compounding,
+        )
+
+        if annual and compounding:
+            mean_return = self.geometric_mean
+        elif annual and not compounding:
+            mean_return = self.arithmetic_mean
+        elif not annual:
+            mean_return = self.mean
+        volatility = self.annual_volatility if annual else self.volatility
+        rfr = annual_rfr if annual else self._rate_conversion(annual_rfr)
+        mar = annual_mar if annual else self._rate_conversion(annual_mar)
+
+        grids = _stats.sweep(
+            self.returns.to_numpy(dtype=float),
+            metrics,
+            rfr,
+            mar,
+            self._rate_conversion(annual_mar),
+            moment,
+            np.array([mean_return]),
+            np.array([volatility]),
+        )
+        if annual and "kappa" in grids:
+            grids["kappa"] = 100 * grids["kappa"]
+
+        return pd.DataFrame(
+            {metric: grid.ravel() for metric, grid in grids.items()},
+            index=pd.MultiIndex.from_product(
+                [annual_rfr, annual_mar, moment],
+                names=["annual_rfr", "annual_mar", "moment"],
+            ),
+        )
+
     def herfindahl_index(self):
         """
         Calculates Herfindahl Index
@@ -2056,8 +3151,8 @@ class Analytics:
         """
         Calculates Appraisal ratio
 
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
         :type annual: bool, optional
         :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
@@ -2104,13 +3199,14 @@ class Analytics:
         annual=True,
         compounding=True,
         modified=False,
+        episodes=False,
         **sorted_drawdowns_kwargs,
     ):
         """
         Calculates Burke ratio
 
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param largest: Number of largest drawdowns taken into consideration for the calculation, defaults to 0
         :type largest: int, optional
         :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
@@ -2119,6 +3215,9 @@ class Analytics:
         :type compounding: bool, optional
         :param modified: Whether to calculate modified Burke ratio, defaults to False
         :type modified: bool, optional
+        :param episodes: Whether to use the drawdowns of distinct episodes (see `drawdown_episodes()`) instead of drawdowns at each time-point, defaults to False
+        :type episodes: bool, optional
+        :param sorted_drawdowns_kwargs: Keyword arguments passed to `sorted_drawdowns()` (drawdowns at each time-point only)
         :return: Burke ratio
         :rtype: float
         """
@@ -2126,25 +3225,33 @@ class Analytics:
         _checks._check_rate_arguments(
             annual_rfr=annual_rfr, annual=annual, compounding=compounding
         )
-        _checks._check_booleans(modified=modified)
+        _checks._check_nonnegints(largest=largest)
+        _checks._check_booleans(modified=modified, episodes=episodes)
+        if episodes and sorted_drawdowns_kwargs:
+            raise ValueError(
+                "`sorted_drawdowns_kwargs` can't be used with `episodes=True`"
+            )
 
-        drawdowns = self.sorted_drawdowns(largest=largest, **sorted_drawdowns_kwargs)
+        if sorted_drawdowns_kwargs:
+            drawdowns = self.sorted_drawdowns(
+                largest, **sorted_drawdowns_kwargs
+            ).to_numpy()[:, 0]
+        else:
+            drawdowns = self._largest_drawdowns(largest, episodes)
         if annual and compounding:
-            burke_ratio = (self.geometric_mean - annual_rfr) / np.sqrt(
-                np.sum(drawdowns**2)
-            )
+            rfr = self._annual_rate(annual_rfr)
+            burke_ratio = (self.geometric_mean - rfr) / np.sqrt(np.sum(drawdowns**2))
         elif annual and not compounding:
-            burke_ratio = (self.arithmetic_mean - annual_rfr) / np.sqrt(
-                np.sum(drawdowns**2)
-            )
+            rfr = self._annual_rate(annual_rfr)
+            burke_ratio = (self.arithmetic_mean - rfr) / np.sqrt(np.sum(drawdowns**2))
         elif not annual:
-            rfr = self._rate_conversion(annual_rfr)
+            rfr = self._mean_rate(annual_rfr)
             burke_ratio = (self.mean - rfr) / np.sqrt(np.sum(drawdowns**2))
 
         if modified:
             burke_ratio = burke_ratio * np.sqrt(self.returns.shape[0])
 
-        return burke_ratio[0]
+        return burke_ratio
 
     def hurst_index(self):
         """
@@ -2208,8 +3315,8 @@ class Analytics:
         """
         Calculates Kelly criterion
 
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :return: Kelly criterion
         :rtype: float
         """
@@ -2243,8 +3350,8 @@ class Analytics:
         """
         Calculates Modigliani-Modigliani measure
 
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
         :type annual: bool, optional
         :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
@@ -2277,17 +3384,19 @@ class Analytics:
         )
 
         if annual and compounding:
+            rfr = self._annual_rate(annual_rfr)
             modigliani_measure = (
                 sharpe_ratio * np.std(self.benchmark_returns) * np.sqrt(self.frequency)
-                + annual_rfr
+                + rfr
             )
         elif annual and not compounding:
+            rfr = self._annual_rate(annual_rfr)
             modigliani_measure = (
                 sharpe_ratio * np.std(self.benchmark_returns) * np.sqrt(self.frequency)
-                + annual_rfr
+                + rfr
             )
         elif not annual:
-            rfr = self._rate_conversion(annual_rfr)
+            rfr = self._mean_rate(annual_rfr)
             modigliani_measure = sharpe_ratio * np.std(self.benchmark_returns) + rfr
 
         return modigliani_measure[0]
@@ -2341,8 +3450,8 @@ class Analytics:
         """
         Calculates Diversification measure
 
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
         :type annual: bool, optional
         :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
@@ -2361,15 +3470,17 @@ class Analytics:
         capm = self.capm(annual_rfr, benchmark)
 
         if annual and compounding:
+            rfr = self._annual_rate(annual_rfr)
             diversification = (fama_beta - capm[1]) * (
-                self.benchmark_geometric_mean - annual_rfr
+                self.benchmark_geometric_mean - rfr
             )
         elif annual and not compounding:
+            rfr = self._annual_rate(annual_rfr)
             diversification = (fama_beta - capm[1]) * (
-                self.benchmark_arithmetic_mean - annual_rfr
+                self.benchmark_arithmetic_mean - rfr
             )
         elif not annual:
-            rfr = self._rate_conversion(annual_rfr)
+            rfr = self._mean_rate(annual_rfr)
             diversification = (fama_beta - capm[1]) * (self.benchmark_mean - rfr)
 
         return diversification
@@ -2378,8 +3489,8 @@ class Analytics:
         """
         Calculates Net Selectivity
 
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
         :type annual: bool, optional
         :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
@@ -2399,8 +3510,8 @@ class Analytics:
         """
         Calculates Upside frequency
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :return: Upside frequency
         :rtype: float
         """
@@ -2418,8 +3529,8 @@ class Analytics:
         """
         Calculates Downside frequency
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :return: Downside frequency
         :rtype: float
         """
@@ -2437,8 +3548,8 @@ class Analytics:
         """
         Creates a table with upside and downside frequency
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :return: Table with frequencies
         :rtype: pd.Series
         """
@@ -2747,18 +3858,67 @@ class Analytics:
         :rtype: np.ndarray
         """
 
-        cumulative_concatenated = pd.concat(
-            [
-                pd.DataFrame([1], columns=[self.name]),
-                self.cumulative_returns,
-            ]
-        ).rename(index={0: self.prices.index[0]})
-        cummax = cumulative_concatenated.cummax()
+        return self._drawdowns().copy()
 
-        drawdowns = cumulative_concatenated / cummax - 1
+    @_memoize
+    def _drawdowns(self):
+        levels = np.concatenate([[1.0], self.cumulative_returns.to_numpy()[:, 0]])
+        drawdowns = pd.DataFrame(
+            _stats.drawdowns(levels),
+            index=self.prices.index[:1].append(self.cumulative_returns.index),
+            columns=[self.name],
+        )
 
         return drawdowns
 
+    @_memoize
+    def _drawdown_episodes(self):
+        drawdowns = self._drawdowns()
+        dates = drawdowns.index
+        peaks, troughs, recoveries, depths = _stats.drawdown_episodes(
+            drawdowns.to_numpy()[:, 0] + 1
+        )
+        recovered = recoveries >= 0
+        ends = np.where(recovered, recoveries, dates.shape[0] - 1)
+
+        episodes = pd.DataFrame(
+            {
+                "Peak": dates[peaks],
+                "Trough": dates[troughs],
+                "Recovery": pd.Series(dates[recoveries]).where(recovered).to_numpy(),
+                "Drawdown": depths,
+                "Duration": ends - peaks,
+                "Recovery Time": np.where(recovered, ends - troughs, np.nan),
+            }
+        )
+
+        return episodes
+
+    def drawdown_episodes(self, largest=0):
+        """
+        Finds distinct drawdown episodes. An episode starts at a peak of cumulative
+        returns and lasts until the portfolio recovers to that peak. Episodes are
+        detected in a single pass and stored on the object, and the largest ones
+        are found by partial selection rather than by sorting all episodes
+
+        :param largest: Number of largest episodes returned, defaults to 0 (all episodes)
+        :type largest: int, optional
+        :return: Episodes with peak, trough and recovery (`NaT` if not recovered) time-points, drawdown at the trough, duration and time to recover (in number of observations), sorted from the largest drawdown
+        :rtype: pd.DataFrame
+        """
+
+        _checks._check_nonnegints(largest=largest)
+
+        episodes = self._drawdown_episodes()
+        depths = episodes["Drawdown"].to_numpy()
+        if 0 < largest < depths.shape[0]:
+            selected = np.argpartition(depths, largest - 1)[:largest]
+        else:
+            selected = np.arange(depths.shape[0])
+        selected = selected[np.argsort(depths[selected], kind="stable")]
+
+        return episodes.iloc[selected].reset_index(drop=True)
+
     def maximum_drawdown(self, periods=0, inverse=True):
         """
         Calculates Maximum drawdown
@@ -2771,19 +3931,31 @@ class Analytics:
         :rtype: float
         """
 
-        _checks._check_periods(periods=periods, state=self.state)
+        periods = _checks._check_periods(periods=periods, state=self.prices)
         _checks._check_booleans(inverse=inverse)
 
-        drawdowns = self.drawdowns()
+        if periods == 0:
+            depths = self._drawdown_episodes()["Drawdown"]
+            mdd = depths.min() if depths.shape[0] > 0 else 0.0
+        else:
+            mdd = self._drawdowns()[-periods:].min()[0]
 
         if inverse:
-            mdd = -drawdowns[-periods:].min()[0]
-        else:
-            mdd = drawdowns[-periods:].min()[0]
+            mdd = -mdd
 
         return mdd
 
-    def average_drawdown(self, largest=0, inverse=True):
+    def _largest_drawdowns(self, largest, episodes):
+        if episodes:
+            return self.drawdown_episodes(largest)["Drawdown"].to_numpy()
+
+        drawdowns = self._drawdowns().to_numpy()[:, 0]
+        if 0 < largest < drawdowns.shape[0]:
+            drawdowns = np.partition(drawdowns, largest - 1)[:largest]
+
+        return drawdowns
+
+    def average_drawdown(self, largest=0, inverse=True, episodes=False):
         """
         Calculates Average drawdown
 
@@ -2791,20 +3963,20 @@ class Analytics:
         :type largest: int, optional
         :param inverse: Whether to invert (i.e. make positive) average drawdown, defaults to True
         :type inverse: bool, optional
+        :param episodes: Whether to average the drawdowns of distinct episodes (see `drawdown_episodes()`) instead of drawdowns at each time-point, defaults to False
+        :type episodes: bool, optional
         :return: Average drawdown
         :rtype: float
         """
 
         _checks._check_nonnegints(largest=largest)
-        _checks._check_booleans(inverse=inverse)
+        _checks._check_booleans(inverse=inverse, episodes=episodes)
 
-        drawdowns = self.drawdowns()
-        drawdowns = drawdowns.sort_values(by=self.name, ascending=False)[-largest:]
+        drawdowns = self._largest_drawdowns(largest, episodes)
+        add = drawdowns.mean() if drawdowns.shape[0] > 0 else 0.0
 
         if inverse:
-            add = -drawdowns.mean()[0]
-        else:
-            add = drawdowns.mean()[0]
+            add = -add
 
         return add
 
@@ -2820,10 +3992,14 @@ class Analytics:
 
         _checks._check_nonnegints(largest=largest)
 
-        drawdowns = self.drawdowns()
+        drawdowns = self._drawdowns()
+        if 0 < largest < drawdowns.shape[0]:
+            # Only the largest drawdowns are selected (in linear time) and sorted
+            selected = np.argpartition(drawdowns.to_numpy()[:, 0], largest - 1)
+            drawdowns = drawdowns.iloc[selected[:largest]]
         sorted_drawdowns = drawdowns.sort_values(
             by=self.name, ascending=False, **sorted_drawdowns_kwargs
-        )[-largest:]
+        )
 
         return sorted_drawdowns
 
@@ -2836,7 +4012,8 @@ class Analytics:
         :param style: `matplotlib` style to be used for plots. User can pass
                       built-in `matplotlib` style (e.g. `classic`, `fivethirtyeight`),
                       or a path to a custom style defined in a `.mplstyle` document,
-                      defaults to STYLE (propriatery PortAn style)
+                      defaults to STYLE (propriatery PortAn style). `None` keeps
+                      the style currently in use
         :type style: str, optional
         :param rcParams_update: `matplotlib.rcParams` to modify the style defined by
                                 `style` argument, defaults to {} (no modification)
@@ -2849,9 +4026,10 @@ class Analytics:
 
         _checks._check_plot_arguments(show=show, save=save)
 
-        drawdowns = self.drawdowns()
+        drawdowns = self._drawdowns()
 
-        plt.style.use(style)
+        if style is not None:
+            plt.style.use(style)
         plt.rcParams.update(**rcParams_update)
         fig, ax = plt.subplots(**fig_kw)
         drawdowns.plot(ax=ax)
@@ -2859,7 +4037,7 @@ class Analytics:
         ax.set_ylabel("Drawdown")
         ax.set_title("Portfolio Drawdowns")
         if save:
-            plt.savefig(f"{self.name}_drawdowns")
+            fig.savefig(f"{self.name}_drawdowns")
         if show:
             plt.show()
 
@@ -2876,13 +4054,14 @@ class Analytics:
         compounding=True,
         modified=False,
         original=True,
+        episodes=False,
         **sorted_drawdowns_kwargs,
     ):
         """
         Creates a table with drawdowns ratios
 
-        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
-        :type annual_rfr: float, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
         :param annual_excess: Annual return above average largest drawdown, defaults to 0.1
         :type annual_excess: float, optional
         :param largest: Number of largest drawdowns taken into consideration for the calculation, defaults to 0
@@ -2899,12 +4078,21 @@ class Analytics:
         :type modified: bool, optional
         :param original: Whether to calculate the original version of Sterling ratio or Sterling-Calmar ratio, defaults to True
         :type original: bool, optional
+        :param episodes: Whether to use the drawdowns of distinct episodes (see `drawdown_episodes()`) for Sterling and Burke ratios instead of drawdowns at each time-point, defaults to False
+        :type episodes: bool, optional
         :return: Table with drawdowns ratios
         :rtype: pd.Series
         """
 
         sterling = self.sterling(
-            annual_rfr, annual_excess, largest, inverse, annual, compounding, original
+            annual_rfr,
+            annual_excess,
+            largest,
+            inverse,
+            annual,
+            compounding,
+            original,
+            episodes,
         )
         calmar = self.calmar(periods, inverse, annual_rfr, annual, compounding)
         burke = self.burke(
@@ -2913,6 +4101,7 @@ class Analytics:
             annual,
             compounding,
             modified,
+            episodes,
             **sorted_drawdowns_kwargs,
         )
         ulcer = self.ulcer()
@@ -2935,8 +4124,8 @@ class Analytics:
         """
         Calculates Upside risk (also referred to as Upside semideviation)
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :return: Upside risk
         :rtype: float
         """
@@ -2949,8 +4138,8 @@ class Analytics:
         """
         Calculates Upside potential
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :return: Upside potential
         :rtype: float
         """
@@ -2963,8 +4152,8 @@ class Analytics:
         """
         Calculates Upside variance
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :return: Upside variance
         :rtype: float
         """
@@ -2977,8 +4166,8 @@ class Analytics:
         """
         Calculates Downside risk (also referred to as Downside semideviation)
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :return: Downside risk
         :rtype: float
         """
@@ -2991,8 +4180,8 @@ class Analytics:
         """
         Calculates Downside potential
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :return: Downside potential
         :rtype: float
         """
@@ -3005,8 +4194,8 @@ class Analytics:
         """
         Calculates Downside variance
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :return: Downside variance
         :rtype: float
         """
@@ -3021,8 +4210,8 @@ class Analytics:
         """
         Creates a table with downside risk analytics
 
-        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
-        :type annual_mar: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
         :param periods: Number of periods taken into consideration for maximum drawdown calculation, defaults to 0
         :type periods: int, optional
         :param inverse: Whether to invert (i.e. make positive) maximum drawdown, defaults to True
@@ -3045,7 +4234,11 @@ class Analytics:
         summary = pd.Series(
             [downside_risk, mdd, parametric_var, historical_var],
             index=[
-                f"Downside risk (Annual MAR={annual_mar*100}%)",
+                (
+                    f"Downside risk (Annual MAR={annual_mar*100}%)"
+                    if not isinstance(annual_mar, pd.Series)
+                    else "Downside risk (Annual MAR series)"
+                ),
                 "Maximum Drawdown",
                 f"Parametric VaR (CI={ci*100}%)",
                 f"Historical VaR (CI={ci*100}%)",
@@ -3054,6 +4247,36 @@ class Analytics:
 
         return summary
 
+    def stress_test(self, periods=PERIODS):
+        """
+        Calculates portfolio statistics over stress periods. Boundaries of all
+        periods are located in the returns index at once, and statistics of all
+        periods are calculated from cumulative sums and products of returns.
+        Periods include their start date and exclude their end date, and periods
+        without any returns in the data are left out
+
+        :param periods: Stress periods as `{name: (start, end)}`, defaults to PERIODS (`portan.PERIODS`)
+        :type periods: dict, optional
+        :return: Table with one row per period, with the number of observations, return, volatility
+                 and maximum drawdown of the portfolio, and benchmark return and capture ratios if the
+                 benchmark is set
+        :rtype: pd.DataFrame
+        """
+
+        names, starts, ends = _checks._check_stress_periods(periods, self.returns.index)
+        benchmark_returns = self.benchmark_returns
+        if benchmark_returns is not None:
+            benchmark_returns = benchmark_returns.to_numpy(dtype=float)
+
+        statistics = _stats.period_statistics(
+            self.returns.to_numpy(dtype=float), starts, ends, benchmark_returns
+        )
+
+        return pd.DataFrame(
+            {STRESS_COLUMNS[key]: value[:, 0] for key, value in statistics.items()},
+            index=pd.Index(names, name="Period"),
+        )
+
     def sectors(self):
 
         sector = np.empty(len(self.tickers), dtype="<U64")
@@ -0,0 +1,1673 @@
+"""
+`batch.py` module contains `portan.BatchAnalytics` class
+for analyzing many portfolios of the same assets at once
+"""
+
+import numpy as np
+import pandas as pd
+from datetime import datetime
+import inspect
+from concurrent.futures import ProcessPoolExecutor
+from portan import _checks, _stats
+from portan._lazy import LazyModule
+from portan.interesting_periods import PERIODS, STRESS_COLUMNS
+
+stats = LazyModule("scipy.stats")
+
+CURRENT_DATE = str(datetime.now())[0:10]
+
+METRICS = {
+    "mean": "Mean Return",
+    "arithmetic_mean": "Annualized Non-Compounded Mean Return",
+    "geometric_mean": "Annualized Compounded Mean Return",
+    "volatility": "Volatility",
+    "annual_volatility": "Annualized Volatility",
+    "skewness": "Skewness",
+    "kurtosis": "Kurtosis",
+    "min_aum": "Minimum AUM",
+    "max_aum": "Maximum AUM",
+    "mean_aum": "Mean AUM",
+    "final_aum": "Final AUM",
+    "net_return": "Net Return",
+    "excess_mar": "Excess Return above MAR",
+    "sharpe": "Sharpe Ratio",
+    "sortino": "Sortino Ratio",
+    "kappa": "Kappa",
+    "omega_ratio": "Omega Ratio",
+    "omega_sharpe_ratio": "Omega-Sharpe Ratio",
+    "volatility_skewness": "Volatility Skewness",
+    "gain_loss": "Gain-loss Ratio",
+    "upside_potential": "Upside Potential",
+    "upside_risk": "Upside Risk",
+    "downside_potential": "Downside Potential",
+    "downside_risk": "Downside Risk",
+    "upside_frequency": "Upside Frequency",
+    "downside_frequency": "Downside Frequency",
+    "maximum_drawdown": "Maximum Drawdown",
+    "average_drawdown": "Average Drawdown",
+    "calmar": "Calmar Ratio",
+    "sterling": "Sterling Ratio",
+    "burke": "Burke Ratio",
+    "ulcer": "Ulcer Index",
+    "martin": "Martin Ratio",
+    "parametric_var": "Parametric VaR",
+    "historical_var": "Historical VaR",
+    "hurst_index": "Hurst Index",
+    "bernardo_ledoit": "Bernardo and Ledoit Ratio",
+    "skewness_kurtosis_ratio": "Skewness-Kurtosis Ratio",
+    "d": "D Ratio",
+    "kelly_criterion": "Kelly Criterion",
+    "excess_benchmark": "Excess Return above Benchmark",
+    "tracking_error": "Tracking Error",
+    "information_ratio": "Information Ratio",
+    "capm_return": "CAPM Return",
+    "jensen_alpha": "Jensen Alpha",
+    "treynor": "Treynor Ratio",
+    "appraisal": "Appraisal Ratio",
+    "fama_beta": "Fama Beta",
+    "diversification": "Diversification",
+    "net_selectivity": "Net Selectivity",
+    "modigliani": "Modigliani-Modigliani Measure",
+    "up_capture": "Up-market Capture",
+    "down_capture": "Down-market Capture",
+    "up_number": "Up-market Number",
+    "down_number": "Down-market Number",
+    "up_percentage": "Up-market Percentage",
+    "down_percentage": "Down-market Percentage",
+}
+
+BENCHMARK_METRICS = [
+    "excess_benchmark",
+    "tracking_error",
+    "information_ratio",
+    "capm_return",
+    "jensen_alpha",
+    "treynor",
+    "appraisal",
+    "fama_beta",
+    "diversification",
+    "net_selectivity",
+    "modigliani",
+    "up_capture",
+    "down_capture",
+    "up_number",
+    "down_number",
+    "up_percentage",
+    "down_percentage",
+]
+
+
+class BatchAnalytics:
+    """
+    `portan.BatchAnalytics` object evaluates many portfolios of the same assets at once.
+    Portfolios are defined by the rows of a weights matrix (portfolios x assets), and all
+    of their statistics are calculated in a single vectorized pass over the prices.
+    Statistics and ratios are `np.ndarray` objects with one value per portfolio, with
+    the same definitions as the corresponding `portan.Analytics` ones
+
+    - Properties
+
+        - `prices` - Assets prices
+        - `assets_returns` - Assets returns
+        - `tickers` - Assets tickers
+        - `weights` - Assets weights of each portfolio
+        - `names` - Names of the portfolios
+        - `initial_aum` - Initial Assets Under Management (AUM)
+        - `frequency` - Data frequency, number of data observations in a year. Used for annualization.
+        - `aum` - AUM time-series of each portfolio
+        - `returns` - Portfolios returns time-series
+        - `cumulative_returns` - Cumulative portfolios returns time-series
+        - `mean` - Mean portfolios returns
+        - `arithmetic_mean` - Annualized arithmetic (not compounded) mean returns
+        - `geometric_mean` - Annualized geometric (compounded) mean returns
+        - `volatility` - Portfolios volatilities (standard deviations)
+        - `annual_volatility` - Annualized portfolios volatilities (standard deviations)
+        - `skewness` - Returns distributions skewness
+        - `kurtosis` - Returns distributions kurtosis
+        - `min_aum` - Minimum AUM during the data period
+        - `max_aum` - Maximum AUM during the data period
+        - `mean_aum` - Average AUM during the data period
+        - `final_aum` - AUM at the last point of the data period
+        - `benchmark_prices` - Benchmark assets prices
+        - `benchmark_weights` - Benchmark assets weights
+        - `benchmark_name` - Benchmark name
+        - `benchmark_returns` - Benchmark returns time-series
+        - `benchmark_mean` - Mean benchmark return
+        - `benchmark_arithmetic_mean` - Annualized arithmetic (not compounded) mean benchmark return
+        - `benchmark_geometric_mean` - Annualized geometric (compounded) mean benchmark return
+    """
+
+    def __init__(
+        self,
+        tickers=None,
+        prices=None,
+        weights=None,
+        benchmark_tickers=None,
+        benchmark_prices=None,
+        benchmark_weights=None,
+        names=None,
+        benchmark_name="Benchmark Portfolio",
+        initial_aum=10000,
+        frequency=252,
+        start="1970-01-02",
+        end=CURRENT_DATE,
+        interval="1d",
+        cache=None,
+        download_kwargs={},
+    ) -> None:
+        """
+        Initiates `portan.BatchAnalytics` object. Prices are downloaded and validated
+        only once for all portfolios
+
+        :param tickers: Assets tickers. Used to download assets prices time-series with `yfinance` if `prices=None`, defaults to None
+        :type tickers: list, optional
+        :param prices: Assets prices time-series, defaults to None
+        :type prices: pd.DataFrame, optional
+        :param weights: Assets weights matrix with one row per portfolio and one column per asset. Mandatory argument. Default set to `None` only because of the ordering of arguments, defaults to None
+        :type weights: np.ndarray or pd.DataFrame, optional
+        :param benchmark_tickers: Benchmark assets tickers, defaults to None
+        :type benchmark_tickers: list, optional
+        :param benchmark_prices: Benchmark assets prices time-series, defaults to None
+        :type benchmark_prices: pd.DataFrame, optional
+        :param benchmark_weights: Benchmark assets weights, defaults to None
+        :type benchmark_weights: list or np.ndarray, optional
+        :param names: Portfolios names, defaults to None (index of `weights` if it is a `pd.DataFrame`, "Portfolio 0", "Portfolio 1", ... otherwise)
+        :type names: list, optional
+        :param benchmark_name: Benchmark name, defaults to "Benchmark Portfolio"
+        :type benchmark_name: str, optional
+        :param initial_aum: Initial Assets Under Management (AUM) of each portfolio, defaults to 10000
+        :type initial_aum: int, optional
+        :param frequency: Data frequency, number of data observations in a year, defaults to 252
+        :type frequency: int, optional
+        :param start: Start date used for downloading assets prices data, defaults to "1970-01-02"
+        :type start: str (YYYY-MM-DD) or `datetime.datetime()` or `pd.Timestamp`, optional
+        :param end: End date used for downloading assets prices data, defaults to CURRENT_DATE
+        :type end: str (YYYY-MM-DD) or `datetime.datetime()` or `pd.Timestamp`, optional
+        :param interval: Data interval used for downloading assets prices data, defaults to "1d"
+        :type interval: str, optional
+        :param cache: On-disk cache of downloaded prices, defaults to None (no caching)
+        :type cache: `portan.PriceCache` or str, optional
+        :param download_kwargs: Keyword arguments for `portan.GetData` used for downloading prices, defaults to {}
+        :type download_kwargs: dict, optional
+        """
+
+        weights, names = _checks._check_batch_weights(weights, names)
+        cache = _checks._check_cache(cache)
+
+        # Prices are validated once, with the first portfolio standing in for all of them
+        prices, _, benchmark_prices, benchmark_weights = _checks._check_init(
+            tickers,
+            prices,
+            weights[0],
+            benchmark_tickers,
+            benchmark_prices,
+            benchmark_weights,
+            "Batch",
+            benchmark_name,
+            initial_aum,
+            frequency,
+            start,
+            end,
+            interval,
+            cache,
+            **download_kwargs,
+        )
+
+        self.prices = prices
+        self.tickers = self.prices.columns.tolist()
+        self.weights = pd.DataFrame(weights, index=names, columns=self.tickers)
+        self.assets_returns = self.prices.pct_change().drop(self.prices.index[0])
+
+        prices_array = self.prices.to_numpy(dtype=float)
+        allocation_assets = initial_aum * weights / prices_array[0]
+        aum = prices_array @ allocation_assets.T
+        returns = self.assets_returns.to_numpy() @ weights.T
+
+        if benchmark_prices is not None:
+            benchmark_weights = pd.Series(
+                benchmark_weights, index=benchmark_prices.columns
+            )
+            benchmark_returns = (
+                benchmark_prices.pct_change().drop(benchmark_prices.index[0])
+                @ benchmark_weights
+            )
+        else:
+            benchmark_returns = None
+
+        self.benchmark_prices = benchmark_prices
+        self.benchmark_weights = benchmark_weights
+        self._setup(
+            returns,
+            aum,
+            self.assets_returns.index,
+            names,
+            benchmark_returns,
+            benchmark_name,
+            initial_aum,
+            frequency,
+        )
+
+    @classmethod
+    def from_returns(
+        cls,
+        returns,
+        benchmark_returns=None,
+        names=None,
+        benchmark_name="Benchmark Portfolio",
+        initial_aum=10000,
+        frequency=252,
+    ):
+        """
+        Initiates `portan.BatchAnalytics` object from portfolios returns directly
+        (e.g. simulated or resampled returns). As there are no assets holdings, AUM
+        time-series are calculated by compounding the returns
+
+        :param returns: Portfolios returns with one column per portfolio
+        :type returns: np.ndarray or pd.DataFrame
+        :param benchmark_returns: Benchmark returns, either one series shared by all portfolios or
+                                  one column per portfolio (e.g. resampled along with `returns`), defaults to None
+        :type benchmark_returns: np.ndarray, pd.Series or pd.DataFrame, optional
+        :param names: Portfolios names, defaults to None (columns of `returns` if it is a `pd.DataFrame`, "Portfolio 0", "Portfolio 1", ... otherwise)
+        :type names: list, optional
+        :param benchmark_name: Benchmark name, defaults to "Benchmark Portfolio"
+        :type benchmark_name: str, optional
+        :param initial_aum: Initial Assets Under Management (AUM) of each portfolio, defaults to 10000
+        :type initial_aum: int, optional
+        :param frequency: Data frequency, number of data observations in a year, defaults to 252
+        :type frequency: int, optional
+        :return: Batch analytics object
+        :rtype: `portan.BatchAnalytics`
+        """
+
+        if isinstance(returns, pd.Series):
+            returns = returns.to_frame()
+        if isinstance(returns, pd.DataFrame):
+            if names is None:
+                names = returns.columns.tolist()
+            index = returns.index
+            returns = returns.to_numpy(dtype=float)
+        else:
+            returns = np.asarray(returns, dtype=float)
+            if returns.ndim == 1:
+                returns = returns.reshape(-1, 1)
+            index = pd.RangeIndex(1, returns.shape[0] + 1)
+        _, names = _checks._check_batch_weights(np.ones((returns.shape[1], 1)), names)
+
+        if np.any(~np.isfinite(returns)):
+            raise ValueError("`returns` contains `NaN` or `inf` values")
+        if benchmark_returns is not None:
+            benchmark_returns = np.asarray(benchmark_returns, dtype=float)
+            if benchmark_returns.ndim == 2 and benchmark_returns.shape[1] == 1:
+                benchmark_returns = benchmark_returns.ravel()
+            if benchmark_returns.shape[0] != returns.shape[0]:
+                raise ValueError(
+                    "`returns` and `benchmark_returns` should have the same number of observations"
+                )
+            if benchmark_returns.ndim != 1 and benchmark_returns.shape != returns.shape:
+                raise ValueError(
+                    "`benchmark_returns` should have one column, or one column per portfolio"
+                )
+
+        batch = cls.__new__(cls)
+        batch.prices = None
+        batch.tickers = None
+        batch.weights = None
+        batch.assets_returns = None
+        batch.benchmark_prices = None
+        batch.benchmark_weights = None
+        batch._setup(
+            returns,
+            initial_aum * _stats.wealth(returns),
+            index,
+            names,
+            benchmark_returns,
+            benchmark_name,
+            initial_aum,
+            frequency,
+        )
+
+        return batch
+
+    def _setup(
+        self,
+        returns,
+        aum,
+        index,
+        names,
+        benchmark_returns,
+        benchmark_name,
+        initial_aum,
+        frequency,
+    ):
+        self.names = names
+        self.initial_aum = initial_aum
+        self.frequency = frequency
+        self._drawdowns = None
+        self._capm_memo = dict()
+        self._rates = dict()
+
+        self._returns = returns
+        self.returns = pd.DataFrame(returns, index=index, columns=names)
+        self.cumulative_returns = pd.DataFrame(
+            np.cumprod(1 + returns, axis=0), index=index, columns=names
+        )
+        self.aum = pd.DataFrame(aum, columns=names)
+        if aum.shape[0] == index.shape[0] + 1 and self.prices is not None:
+            self.aum.index = self.prices.index
+
+        observations = returns.shape[0]
+        mean, m2, m3, m4 = _stats.central_moments(returns)
+        self._m2 = m2
+        self.mean = mean
+        self.arithmetic_mean = mean * frequency
+        self.geometric_mean = _stats.geometric_mean(returns, frequency)
+        self.volatility = np.sqrt(m2 * observations / (observations - 1))
+        self.annual_volatility = self.volatility * np.sqrt(frequency)
+        self.skewness = _stats.skewness(m2, m3)
+        self.kurtosis = _stats.kurtosis(m2, m4)
+
+        self.min_aum = aum.min(axis=0)
+        self.max_aum = aum.max(axis=0)
+        self.mean_aum = aum.mean(axis=0)
+        self.final_aum = aum[-1]
+
+        self.benchmark_name = benchmark_name
+        if benchmark_returns is None:
+            self._benchmark_returns = None
+            self.benchmark_returns = None
+            self.benchmark_mean = None
+            self.benchmark_arithmetic_mean = None
+            self.benchmark_geometric_mean = None
+        else:
+            # A benchmark shared by all portfolios, or one benchmark per portfolio
+            # (e.g. benchmark returns resampled along with the portfolio returns)
+            benchmark_returns = np.asarray(benchmark_returns, dtype=float)
+            if benchmark_returns.ndim == 1:
+                columns = [benchmark_name]
+            else:
+                columns = pd.MultiIndex.from_product([[benchmark_name], names])
+            self._benchmark_returns = benchmark_returns
+            self.benchmark_returns = pd.DataFrame(
+                benchmark_returns, index=index, columns=columns
+            )
+            self.benchmark_mean = benchmark_returns.mean(axis=0)
+            self.benchmark_arithmetic_mean = self.benchmark_mean * frequency
+            self.benchmark_geometric_mean = _stats.geometric_mean(
+                benchmark_returns, frequency
+            )
+
+    def _rate_conversion(self, annual_rate):
+        # Rate series are aligned to the observations of `returns` and converted
+        # once per series contents, as a column that broadcasts with returns
+        if not isinstance(annual_rate, pd.Series):
+            return _stats.rate_conversion(annual_rate, self.frequency)
+
+        key = _stats.series_key(annual_rate)
+        if key not in self._rates:
+            rates = _checks._check_rate_series(annual_rate, self.returns.index)
+            _stats.cache_put(
+                self._rates,
+                key,
+                _stats.rate_conversion(rates, self.frequency)[:, np.newaxis],
+            )
+
+        return self._rates[key]
+
+    def _mean_return(self, annual, compounding):
+        if annual and compounding:
+            return self.geometric_mean
+        elif annual and not compounding:
+            return self.arithmetic_mean
+        else:
+            return self.mean
+
+    def _rate(self, annual_rate, annual):
+        # Rate series enter linear statistics through their average per-period rate
+        if isinstance(annual_rate, pd.Series):
+            rate = self._rate_conversion(annual_rate).mean()
+            return (1 + rate) ** self.frequency - 1 if annual else rate
+        elif annual:
+            return annual_rate
+        else:
+            return self._rate_conversion(annual_rate)
+
+    def _benchmark_columns(self):
+        # Benchmark returns broadcastable against `_returns`
+        return self._benchmark_returns.reshape(self._returns.shape[0], -1)
+
+    def _check_benchmark(self):
+        if self._benchmark_returns is None:
+            raise ValueError(
+                "Benchmark isn't set. Provide `benchmark_tickers` or `benchmark_prices` when initiating the object"
+            )
+
+    def summary(self, metrics=None, **kwargs):
+        """
+        Creates a table with the statistics and ratios of all portfolios
+
+        :param metrics: Names of the statistics and ratios (attributes or methods of the object) to be calculated, defaults to None (all, benchmark ones only if the benchmark is set)
+        :type metrics: list, optional
+        :param kwargs: Arguments passed to every method that accepts them (e.g. `annual_rfr`, `annual_mar`)
+        :return: Table with one row per portfolio and one column per statistic
+        :rtype: pd.DataFrame
+        """
+
+        if metrics is None:
+            metrics = [
+                metric
+                for metric in METRICS.keys()
+                if self._benchmark_returns is not None
+                or metric not in BENCHMARK_METRICS
+            ]
+        for metric in metrics:
+            if metric not in METRICS:
+                raise ValueError(
+                    f"`{metric}` isn't available. Available metrics are: {list(METRICS.keys())}"
+                )
+
+        columns = dict()
+        for metric in metrics:
+            value = getattr(self, metric)
+            if callable(value):
+                parameters = inspect.signature(value).parameters
+                value = value(
+                    **{key: arg for key, arg in kwargs.items() if key in parameters}
+                )
+            columns[METRICS[metric]] = np.broadcast_to(value, (len(self.names),))
+
+        return pd.DataFrame(columns, index=self.names)
+
+    def excess_mar(self, annual_mar=0.03, annual=True, compounding=True):
+        """
+        Calculates excess mean returns above Minimum Accepted Return (MAR)
+
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Excess mean returns above MAR
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(
+            annual_mar=annual_mar, annual=annual, compounding=compounding
+        )
+
+        return self._mean_return(annual, compounding) - self._rate(annual_mar, annual)
+
+    def net_return(self, percentage=False):
+        """
+        Calculates net investment returns
+
+        :param percentage: Whether to calculate in percentage or absolute terms, defaults to False
+        :type percentage: bool, optional
+        :return: Net investment returns
+        :rtype: np.ndarray
+        """
+
+        _checks._check_booleans(percentage=percentage)
+
+        net_return = self.final_aum - self.initial_aum
+        if percentage:
+            net_return = net_return / self.initial_aum
+
+        return net_return
+
+    def sharpe(
+        self,
+        annual_rfr=0.03,
+        annual=True,
+        compounding=True,
+        adjusted=False,
+        probabilistic=False,
+        sharpe_benchmark=0.0,
+    ):
+        """
+        Calculates Sharpe ratios
+
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :param adjusted: Whether to calculate adjusted Sharpe ratio, defaults to False
+        :type adjusted: bool, optional
+        :param probabilistic: Whether to calculate probabilistic Sharpe ratio, defaults to False
+        :type probabilistic: bool, optional
+        :param sharpe_benchmark: Benchmark Sharpe ratio for probabilistic Sharpe ratio (if used), defaults to 0.0
+        :type sharpe_benchmark: float, optional
+        :return: Sharpe ratios
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(
+            annual_rfr=annual_rfr, annual=annual, compounding=compounding
+        )
+        _checks._check_sharpe(adjusted=adjusted, probabilistic=probabilistic)
+
+        volatility = self.annual_volatility if annual else self.volatility
+        sharpe_ratio = (
+            self._mean_return(annual, compounding) - self._rate(annual_rfr, annual)
+        ) / volatility
+
+        if adjusted:
+            sharpe_ratio = sharpe_ratio * (
+                1
+                + (self.skewness / 6) * sharpe_ratio
+                - ((self.kurtosis - 3) / 24) * sharpe_ratio**2
+            )
+
+        if probabilistic:
+            sharpe_std = np.sqrt(
+                (
+                    1
+                    + (0.5 * sharpe_ratio**2)
+                    - (self.skewness * sharpe_ratio)
+                    + (((self.kurtosis - 3) / 4) * sharpe_ratio**2)
+                )
+                / (self._returns.shape[0] - 1)
+            )
+            sharpe_ratio = stats.norm.cdf(
+                (sharpe_ratio - sharpe_benchmark) / sharpe_std
+            )
+
+        return sharpe_ratio
+
+    def excess_benchmark(self, annual=True, compounding=True):
+        """
+        Calculates excess mean returns above benchmark mean return
+
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Excess mean returns above benchmark
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(annual=annual, compounding=compounding)
+        self._check_benchmark()
+
+        if annual and compounding:
+            benchmark_mean = self.benchmark_geometric_mean
+        elif annual and not compounding:
+            benchmark_mean = self.benchmark_arithmetic_mean
+        else:
+            benchmark_mean = self.benchmark_mean
+
+        return self._mean_return(annual, compounding) - benchmark_mean
+
+    def tracking_error(self, annual=True):
+        """
+        Calculates tracking errors
+
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :return: Tracking errors
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(annual=annual)
+        self._check_benchmark()
+
+        tracking_error = np.std(self._returns - self._benchmark_columns(), axis=0)
+
+        if annual:
+            return tracking_error * np.sqrt(self.frequency)
+        else:
+            return tracking_error
+
+    def information_ratio(self, annual=True, compounding=True):
+        """
+        Calculates information ratios
+
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Information ratios
+        :rtype: np.ndarray
+        """
+
+        return self.excess_benchmark(annual, compounding) / self.tracking_error(annual)
+
+    def capm(self, annual_rfr=0.03, benchmark_returns=None):
+        """
+        Estimates Capital Asset Pricing Model (CAPM) parameters of all portfolios.
+        If `benchmark_returns` with several benchmarks are provided, every portfolio
+        is regressed on every benchmark at once
+
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param benchmark_returns: Returns of the benchmarks (one column per benchmark) aligned with `returns`, defaults to None (object benchmark)
+        :type benchmark_returns: pd.DataFrame or np.ndarray, optional
+        :return: CAPM alphas, betas and R-squared. Arrays with one value per portfolio for the object benchmark, benchmarks x portfolios tables otherwise
+        :rtype: np.ndarray or pd.DataFrame, np.ndarray or pd.DataFrame, np.ndarray or pd.DataFrame
+        """
+
+        _checks._check_rate_arguments(annual_rfr=annual_rfr)
+
+        if benchmark_returns is None:
+            alpha, beta, r_squared, _ = self._capm(annual_rfr)
+
+            return alpha, beta, r_squared
+
+        if isinstance(benchmark_returns, pd.Series):
+            benchmark_returns = benchmark_returns.to_frame()
+        if isinstance(benchmark_returns, pd.DataFrame):
+            benchmark_names = benchmark_returns.columns
+        else:
+            benchmark_names = None
+        benchmark_returns = np.asarray(benchmark_returns, dtype=float)
+        if benchmark_returns.shape[0] != self._returns.shape[0]:
+            raise ValueError(
+                "`benchmark_returns` should have the same number of observations as `returns`"
+            )
+
+        if isinstance(annual_rfr, pd.Series):
+            # Regression of excess returns, as the rate varies over time
+            rfr = self._rate_conversion(annual_rfr)
+            alpha, beta, r_squared, _ = _stats.capm(
+                self._returns - rfr, _stats._columns(benchmark_returns) - rfr
+            )
+        else:
+            alpha, beta, r_squared, _ = _stats.capm(
+                self._returns, benchmark_returns, self._rate_conversion(annual_rfr)
+            )
+
+        return tuple(
+            pd.DataFrame(parameter, index=benchmark_names, columns=self.names)
+            for parameter in (alpha, beta, r_squared)
+        )
+
+    def _capm(self, annual_rfr):
+        self._check_benchmark()
+        if isinstance(annual_rfr, pd.Series):
+            # Regression of excess returns, as the rate varies over time
+            rfr = self._rate_conversion(annual_rfr)
+            if self._benchmark_returns.ndim == 2:
+                return _stats.paired_capm(
+                    self._returns - rfr, self._benchmark_returns - rfr
+                )
+            return tuple(
+                parameter[0]
+                for parameter in _stats.capm(
+                    self._returns - rfr, self._benchmark_returns - rfr[:, 0]
+                )
+            )
+        if annual_rfr not in self._capm_memo:
+            if self._benchmark_returns.ndim == 2:
+                self._capm_memo[annual_rfr] = _stats.paired_capm(
+                    self._returns,
+                    self._benchmark_returns,
+                    self._rate_conversion(annual_rfr),
+                )
+            else:
+                self._capm_memo[annual_rfr] = tuple(
+                    parameter[0]
+                    for parameter in _stats.capm(
+                        self._returns,
+                        self._benchmark_returns,
+                        self._rate_conversion(annual_rfr),
+                    )
+                )
+
+        return self._capm_memo[annual_rfr]
+
+    def _benchmark_mean_return(self, annual, compounding):
+        if annual and compounding:
+            return self.benchmark_geometric_mean
+        elif annual and not compounding:
+            return self.benchmark_arithmetic_mean
+        else:
+            return self.benchmark_mean
+
+    def capm_return(self, annual_rfr=0.03, annual=True, compounding=True):
+        """
+        Expected excess portfolios returns estimated by Capital Asset Pricing Model (CAPM)
+
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Expected excess portfolios returns estimated by CAPM
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(
+            annual_rfr=annual_rfr, annual=annual, compounding=compounding
+        )
+
+        rfr = self._rate(annual_rfr, annual)
+        beta = self._capm(annual_rfr)[1]
+
+        return rfr + beta * (self._benchmark_mean_return(annual, compounding) - rfr)
+
+    def jensen_alpha(self, annual_rfr=0.03, annual=True, compounding=True):
+        """
+        Calculates Jensen alphas
+
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Jensen alphas
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(
+            annual_rfr=annual_rfr, annual=annual, compounding=compounding
+        )
+
+        rfr = self._rate(annual_rfr, annual)
+        beta = self._capm(annual_rfr)[1]
+
+        return (
+            self._mean_return(annual, compounding)
+            - rfr
+            - beta * (self._benchmark_mean_return(annual, compounding) - rfr)
+        )
+
+    def treynor(self, annual_rfr=0.03, annual=True, compounding=True):
+        """
+        Calculates Treynor ratios
+
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Treynor ratios
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(
+            annual_rfr=annual_rfr, annual=annual, compounding=compounding
+        )
+
+        return (
+            self._mean_return(annual, compounding) - self._rate(annual_rfr, annual)
+        ) / self._capm(annual_rfr)[1]
+
+    def appraisal(self, annual_rfr=0.03, annual=True, compounding=True):
+        """
+        Calculates Appraisal ratios
+
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Appraisal ratios
+        :rtype: np.ndarray
+        """
+
+        specific_risk = np.sqrt(self._capm(annual_rfr)[3])
+        if annual:
+            specific_risk = specific_risk * np.sqrt(self.frequency)
+
+        return self.jensen_alpha(annual_rfr, annual, compounding) / specific_risk
+
+    def fama_beta(self):
+        """
+        Calculates Fama betas
+
+        :return: Fama betas
+        :rtype: np.ndarray
+        """
+
+        self._check_benchmark()
+
+        return np.sqrt(self._m2) / np.std(self._benchmark_returns, axis=0)
+
+    def diversification(self, annual_rfr=0.03, annual=True, compounding=True):
+        """
+        Calculates Diversification measures
+
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Diversification measures
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(
+            annual_rfr=annual_rfr, annual=annual, compounding=compounding
+        )
+
+        return (self.fama_beta() - self._capm(annual_rfr)[1]) * (
+            self._benchmark_mean_return(annual, compounding)
+            - self._rate(annual_rfr, annual)
+        )
+
+    def net_selectivity(self, annual_rfr=0.03, annual=True, compounding=True):
+        """
+        Calculates Net Selectivity
+
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Net Selectivity
+        :rtype: np.ndarray
+        """
+
+        return self.jensen_alpha(
+            annual_rfr, annual, compounding
+        ) - self.diversification(annual_rfr, annual, compounding)
+
+    def modigliani(
+        self,
+        annual_rfr=0.03,
+        annual=True,
+        compounding=True,
+        adjusted=False,
+        probabilistic=False,
+        sharpe_benchmark=0.0,
+    ):
+        """
+        Calculates Modigliani-Modigliani measures
+
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :param adjusted: Whether to use adjusted Sharpe ratio for calculation, defaults to False
+        :type adjusted: bool, optional
+        :param probabilistic: Whether to use probabilistic Sharpe ratio for calculation, defaults to False
+        :type probabilistic: bool, optional
+        :param sharpe_benchmark: Benchmark Sharpe ratio for probabilistic Sharpe ratio (if used), defaults to 0.0
+        :type sharpe_benchmark: float, optional
+        :return: Modigliani-Modigliani measures
+        :rtype: np.ndarray
+        """
+
+        self._check_benchmark()
+
+        sharpe_ratio = self.sharpe(
+            annual_rfr, annual, compounding, adjusted, probabilistic, sharpe_benchmark
+        )
+        benchmark_volatility = np.std(self._benchmark_returns, axis=0)
+        if annual:
+            benchmark_volatility = benchmark_volatility * np.sqrt(self.frequency)
+
+        return sharpe_ratio * benchmark_volatility + self._rate(annual_rfr, annual)
+
+    def hpm(self, annual_mar=0.03, moment=3):
+        """
+        Calculates Higher Partial Moments
+
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :param moment: Moment for calculation, defaults to 3
+        :type moment: int, optional
+        :return: Higher Partial Moments
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(annual_mar=annual_mar)
+        _checks._check_posints(moment=moment)
+
+        return _stats.hpm(self._returns, self._rate_conversion(annual_mar), moment)
+
+    def lpm(self, annual_mar=0.03, moment=3):
+        """
+        Calculates Lower Partial Moments
+
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :param moment: Moment for calculation, defaults to 3
+        :type moment: int, optional
+        :return: Lower Partial Moments
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(annual_mar=annual_mar)
+        _checks._check_posints(moment=moment)
+
+        return _stats.lpm(self._returns, self._rate_conversion(annual_mar), moment)
+
+    def upside_potential(self, annual_mar=0.03):
+        """
+        Calculates Upside potentials
+
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :return: Upside potentials
+        :rtype: np.ndarray
+        """
+
+        return self.hpm(annual_mar=annual_mar, moment=1)
+
+    def upside_risk(self, annual_mar=0.03):
+        """
+        Calculates Upside risks (also referred to as Upside semideviations)
+
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :return: Upside risks
+        :rtype: np.ndarray
+        """
+
+        return np.sqrt(self.hpm(annual_mar=annual_mar, moment=2))
+
+    def downside_potential(self, annual_mar=0.03):
+        """
+        Calculates Downside potentials
+
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :return: Downside potentials
+        :rtype: np.ndarray
+        """
+
+        return self.lpm(annual_mar=annual_mar, moment=1)
+
+    def downside_risk(self, annual_mar=0.03):
+        """
+        Calculates Downside risks (also referred to as Downside semideviations)
+
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :return: Downside risks
+        :rtype: np.ndarray
+        """
+
+        return np.sqrt(self.lpm(annual_mar=annual_mar, moment=2))
+
+    def volatility_skewness(self, annual_mar=0.03):
+        """
+        Calculates volatility skewness
+
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :return: Volatility skewness
+        :rtype: np.ndarray
+        """
+
+        return self.hpm(annual_mar=annual_mar, moment=2) / self.lpm(
+            annual_mar=annual_mar, moment=2
+        )
+
+    def sortino(self, annual_mar=0.03, annual_rfr=0.03, annual=True, compounding=True):
+        """
+        Calculates Sortino ratios
+
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Sortino ratios
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(
+            annual_mar=annual_mar,
+            annual_rfr=annual_rfr,
+            annual=annual,
+            compounding=compounding,
+        )
+
+        return (
+            self._mean_return(annual, compounding) - self._rate(annual_rfr, annual)
+        ) / self.downside_risk(annual_mar)
+
+    def kappa(self, annual_mar=0.03, moment=3, annual=True, compounding=True):
+        """
+        Calculates Kappa
+
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :param moment: Moment for calculation, defaults to 3
+        :type moment: int, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Kappa
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(
+            annual_mar=annual_mar, annual=annual, compounding=compounding
+        )
+        _checks._check_posints(moment=moment)
+
+        kappa_ratio = (
+            self._mean_return(annual, compounding) - self._rate(annual_mar, annual)
+        ) / np.power(self.lpm(annual_mar, moment), (1 / moment))
+
+        if annual:
+            kappa_ratio = 100 * kappa_ratio
+
+        return kappa_ratio
+
+    def gain_loss(self):
+        """
+        Calculates Gain-loss ratios
+
+        :return: Gain-loss ratios
+        :rtype: np.ndarray
+        """
+
+        return self.hpm(annual_mar=0, moment=1) / self.lpm(annual_mar=0, moment=1)
+
+    def omega_ratio(self, annual_mar=0.03):
+        """
+        Calculates Omega ratios
+
+        :param annual_mar: Annual Minimum Acceptable Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :return: Omega ratios
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(annual_mar=annual_mar)
+
+        excess_returns = self._returns - self._rate_conversion(annual_mar)
+        winning = np.where(excess_returns > 0, excess_returns, 0).sum(axis=0)
+        losing = -np.where(excess_returns <= 0, excess_returns, 0).sum(axis=0)
+
+        return winning / losing
+
+    def omega_sharpe_ratio(self, annual_mar=0.03):
+        """
+        Calculates Omega-Sharpe ratios
+
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :return: Omega-Sharpe ratios
+        :rtype: np.ndarray
+        """
+
+        upside_potential = self.upside_potential(annual_mar)
+        downside_potential = self.downside_potential(annual_mar)
+
+        return (upside_potential - downside_potential) / downside_potential
+
+    def omega_curve(
+        self, annual_mar=None, annual_mar_lower_bound=0, annual_mar_upper_bound=0.1
+    ):
+        """
+        Calculates Omega values of all portfolios across different Minimum Acceptable Returns (MAR)
+
+        :param annual_mar: Grid of annual MAR values, defaults to None (evenly spaced between `annual_mar_lower_bound` and `annual_mar_upper_bound`)
+        :type annual_mar: float, list or np.ndarray, optional
+        :param annual_mar_lower_bound: Lower bound for MAR that will be taken to calculate the values for curves, defaults to 0
+        :type annual_mar_lower_bound: float, optional
+        :param annual_mar_upper_bound: Upper bound for MAR that will be taken to calculate the values for curves, defaults to 0.1
+        :type annual_mar_upper_bound: float, optional
+        :return: Omega values with one row per MAR value and one column per portfolio
+        :rtype: pd.DataFrame
+        """
+
+        if annual_mar is None:
+            _checks._check_mar_bounds(
+                annual_mar_lower_bound=annual_mar_lower_bound,
+                annual_mar_upper_bound=annual_mar_upper_bound,
+            )
+            annual_mar = np.linspace(
+                annual_mar_lower_bound,
+                annual_mar_upper_bound,
+                round(100 * (annual_mar_upper_bound - annual_mar_lower_bound)),
+            )
+        annual_mar = _checks._check_rate_grid("annual_mar", annual_mar)
+
+        curve = _stats.omega_curve(self._returns, self._rate_conversion(annual_mar))
+
+        return pd.DataFrame(curve, index=annual_mar, columns=self.names)
+
+    def sweep(
+        self,
+        metrics=None,
+        annual_rfr=0.03,
+        annual_mar=0.03,
+        moment=3,
+        annual=True,
+        compounding=True,
+        processes=1,
+    ):
+        """
+        Calculates statistics and ratios of all portfolios across grids of Risk-free
+        Rates (RFR), Minimum Accepted Returns (MAR) and moments at once. Returns of
+        each portfolio are sorted only once and partial moments at all MAR values are
+        evaluated with prefix sums of the sorted returns
+
+        :param metrics: Names of the methods to be swept, defaults to None (all of `portan._stats.SWEEP_METRICS`)
+        :type metrics: list, optional
+        :param annual_rfr: Annual Risk-free Rate(s) (RFR), defaults to 0.03
+        :type annual_rfr: float or np.ndarray, optional
+        :param annual_mar: Annual Minimum Accepted Return(s) (MAR), defaults to 0.03
+        :type annual_mar: float or np.ndarray, optional
+        :param moment: Moment(s) for `kappa`, `lpm` and `hpm`, defaults to 3
+        :type moment: int or np.ndarray, optional
+        :param annual: Whether to calculate the statistics on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :param processes: Number of worker processes. Portfolios are split into
+                          `processes` chunks swept in parallel, defaults to 1 (no pool)
+        :type processes: int, optional
+        :return: Table with one row per (`annual_rfr`, `annual_mar`, `moment`) grid point and
+                 one column per (metric, portfolio) pair
+        :rtype: pd.DataFrame
+        """
+
+        metrics, annual_rfr, annual_mar, moment = _checks._check_sweep_arguments(
+            metrics=metrics,
+            annual_rfr=annual_rfr,
+            annual_mar=annual_mar,
+            moment=moment,
+            annual=annual,
+            compounding=compounding,
+            processes=processes,
+        )
+
+        mean_return = self._mean_return(annual, compounding)
+        volatility = self.annual_volatility if annual else self.volatility
+        arguments = (
+            metrics,
+            self._rate(annual_rfr, annual),
+            self._rate(annual_mar, annual),
+            self._rate_conversion(annual_mar),
+            moment,
+        )
+
+        portfolios = self._returns.shape[1]
+        if processes == 1 or portfolios == 1:
+            grids = _stats.sweep(self._returns, *arguments, mean_return, volatility)
+        else:
+            size = -(-portfolios // processes)
+            chunks = [slice(i, i + size) for i in range(0, portfolios, size)]
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                futures = [
+                    executor.submit(
+                        _stats.sweep,
+                        self._returns[:, chunk],
+                        *arguments,
+                        mean_return[chunk],
+                        volatility[chunk],
+                    )
+                    for chunk in chunks
+                ]
+                results = [future.result() for future in futures]
+            grids = {
+                metric: np.concatenate([result[metric] for result in results], axis=-1)
+                for metric in metrics
+            }
+        if annual and "kappa" in grids:
+            grids["kappa"] = 100 * grids["kappa"]
+
+        return pd.DataFrame(
+            np.hstack([grids[metric].reshape(-1, portfolios) for metric in metrics]),
+            index=pd.MultiIndex.from_product(
+                [annual_rfr, annual_mar, moment],
+                names=["annual_rfr", "annual_mar", "moment"],
+            ),
+            columns=pd.MultiIndex.from_product([metrics, self.names]),
+        )
+
+    def stress_test(self, periods=PERIODS):
+        """
+        Calculates statistics of all portfolios over stress periods. Boundaries of
+        all periods are located in the returns index at once, and statistics of all
+        periods and portfolios are calculated from cumulative sums and products of
+        returns. Periods include their start date and exclude their end date, and
+        periods without any returns in the data are left out
+
+        :param periods: Stress periods as `{name: (start, end)}`, defaults to PERIODS (`portan.PERIODS`)
+        :type periods: dict, optional
+        :return: Table with one row per period and one column per (statistic, portfolio) pair
+        :rtype: pd.DataFrame
+        """
+
+        names, starts, ends = _checks._check_stress_periods(periods, self.returns.index)
+        statistics = _stats.period_statistics(
+            self._returns, starts, ends, self._benchmark_returns
+        )
+
+        return pd.DataFrame(
+            np.hstack(list(statistics.values())),
+            index=pd.Index(names, name="Period"),
+            columns=pd.MultiIndex.from_product(
+                [[STRESS_COLUMNS[key] for key in statistics.keys()], self.names]
+            ),
+        )
+
+    def upside_frequency(self, annual_mar=0.03):
+        """
+        Calculates Upside frequencies
+
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :return: Upside frequencies
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(annual_mar=annual_mar)
+
+        return np.mean(self._returns > self._rate_conversion(annual_mar), axis=0)
+
+    def downside_frequency(self, annual_mar=0.03):
+        """
+        Calculates Downside frequencies
+
+        :param annual_mar: Annual Minimum Accepted Return (MAR), or its time-series, defaults to 0.03
+        :type annual_mar: float or pd.Series, optional
+        :return: Downside frequencies
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(annual_mar=annual_mar)
+
+        return np.mean(self._returns <= self._rate_conversion(annual_mar), axis=0)
+
+    def drawdowns(self):
+        """
+        Calculates portfolios drawdown levels at each time-point
+
+        :return: Drawdown levels
+        :rtype: pd.DataFrame
+        """
+
+        drawdowns = pd.DataFrame(self._drawdown_levels(), columns=self.names)
+        if self.prices is not None:
+            drawdowns.index = self.prices.index
+
+        return drawdowns
+
+    def _drawdown_levels(self):
+        if self._drawdowns is None:
+            self._drawdowns = _stats.drawdowns(_stats.wealth(self._returns))
+
+        return self._drawdowns
+
+    def _largest_drawdowns(self, largest):
+        drawdowns = self._drawdown_levels()
+        if largest == 0 or largest >= drawdowns.shape[0]:
+            return drawdowns
+
+        return np.partition(drawdowns, largest - 1, axis=0)[:largest]
+
+    def maximum_drawdown(self, periods=0, inverse=True):
+        """
+        Calculates Maximum drawdowns
+
+        :param periods: Number of periods taken into consideration for maximum drawdown calculation, defaults to 0
+        :type periods: int, optional
+        :param inverse: Whether to invert (i.e. make positive) maximum drawdown, defaults to True
+        :type inverse: bool, optional
+        :return: Maximum drawdowns
+        :rtype: np.ndarray
+        """
+
+        _checks._check_periods(periods=periods, state=self.aum)
+        _checks._check_booleans(inverse=inverse)
+
+        mdd = self._drawdown_levels()[-periods:].min(axis=0)
+
+        return -mdd if inverse else mdd
+
+    def average_drawdown(self, largest=0, inverse=True):
+        """
+        Calculates Average drawdowns
+
+        :param largest: Number of largest drawdowns taken into consideration for the calculation, defaults to 0
+        :type largest: int, optional
+        :param inverse: Whether to invert (i.e. make positive) average drawdown, defaults to True
+        :type inverse: bool, optional
+        :return: Average drawdowns
+        :rtype: np.ndarray
+        """
+
+        _checks._check_nonnegints(largest=largest)
+        _checks._check_booleans(inverse=inverse)
+
+        add = self._largest_drawdowns(largest).mean(axis=0)
+
+        return -add if inverse else add
+
+    def calmar(
+        self, periods=0, inverse=True, annual_rfr=0.03, annual=True, compounding=True
+    ):
+        """
+        Calculates Calmar ratios
+
+        :param periods: Number of periods taken into consideration for maximum drawdown calculation, defaults to 0
+        :type periods: int, optional
+        :param inverse: Whether to invert (i.e. make positive) maximum drawdown, defaults to True
+        :type inverse: bool, optional
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Calmar ratios
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(
+            annual_rfr=annual_rfr, annual=annual, compounding=compounding
+        )
+
+        return (
+            self._mean_return(annual, compounding) - self._rate(annual_rfr, annual)
+        ) / self.maximum_drawdown(periods=periods, inverse=inverse)
+
+    def sterling(
+        self,
+        annual_rfr=0.03,
+        annual_excess=0.1,
+        largest=0,
+        inverse=True,
+        annual=True,
+        compounding=True,
+        original=True,
+    ):
+        """
+        Calculates Sterling ratios
+
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param annual_excess: Annual return above average largest drawdown, defaults to 0.1
+        :type annual_excess: float, optional
+        :param largest: Number of largest drawdowns taken into consideration for the calculation, defaults to 0
+        :type largest: int, optional
+        :param inverse: Whether to invert (i.e. make positive) average drawdown, defaults to True
+        :type inverse: bool, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :param original: Whether to calculate the original version of Sterling ratio or Sterling-Calmar ratio, defaults to True
+        :type original: bool, optional
+        :return: Sterling ratios
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(
+            annual_rfr=annual_rfr, annual=annual, compounding=compounding
+        )
+
+        average_drawdown = self.average_drawdown(largest=largest, inverse=inverse)
+        mean_return = self._mean_return(annual, compounding)
+
+        if original:
+            return mean_return / (average_drawdown + self._rate(annual_excess, annual))
+        else:
+            return (mean_return - self._rate(annual_rfr, annual)) / average_drawdown
+
+    def burke(
+        self,
+        annual_rfr=0.03,
+        largest=0,
+        annual=True,
+        compounding=True,
+        modified=False,
+    ):
+        """
+        Calculates Burke ratios
+
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param largest: Number of largest drawdowns taken into consideration for the calculation, defaults to 0
+        :type largest: int, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :param modified: Whether to calculate modified Burke ratio, defaults to False
+        :type modified: bool, optional
+        :return: Burke ratios
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(
+            annual_rfr=annual_rfr, annual=annual, compounding=compounding
+        )
+        _checks._check_nonnegints(largest=largest)
+        _checks._check_booleans(modified=modified)
+
+        drawdowns = self._largest_drawdowns(largest)
+        burke_ratio = (
+            self._mean_return(annual, compounding) - self._rate(annual_rfr, annual)
+        ) / np.sqrt(np.sum(drawdowns**2, axis=0))
+
+        if modified:
+            burke_ratio = burke_ratio * np.sqrt(self._returns.shape[0])
+
+        return burke_ratio
+
+    def ulcer(self):
+        """
+        Calculates Ulcer Indices
+
+        :return: Ulcer Indices
+        :rtype: np.ndarray
+        """
+
+        return _stats.ulcer(self.aum.to_numpy())
+
+    def martin(self, annual_rfr=0.03, annual=True, compounding=True):
+        """
+        Calculates Martin ratios
+
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :param annual: Whether to calculate the statistic on annual basis or data frequency basis, defaults to True
+        :type annual: bool, optional
+        :param compounding: If `annual=True`, specifies if returns should be compounded, defaults to True
+        :type compounding: bool, optional
+        :return: Martin ratios
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(
+            annual_rfr=annual_rfr, annual=annual, compounding=compounding
+        )
+
+        return (
+            self._mean_return(annual, compounding) - self._rate(annual_rfr, annual)
+        ) / self.ulcer()
+
+    def parametric_var(self, ci=0.95, frequency=1):
+        """
+        Calculates parametric Value-at-Risk (VaR)
+
+        :param ci: Confidence interval for VaR, defaults to 0.95
+        :type ci: float, optional
+        :param frequency: frequency for changing periods of VaR, defaults to 1 (same as data)
+        :type frequency: int, optional
+        :return: Parametric VaR
+        :rtype: np.ndarray
+        """
+
+        return stats.norm.ppf(1 - ci, self.mean, self.volatility) * np.sqrt(frequency)
+
+    def historical_var(self, ci=0.95, frequency=1):
+        """
+        Calculates historical Value-at-Risk (VaR)
+
+        :param ci: Confidence interval for VaR, defaults to 0.95
+        :type ci: float, optional
+        :param frequency: frequency for changing periods of VaR, defaults to 1 (same as data)
+        :type frequency: int, optional
+        :return: Historical VaR
+        :rtype: np.ndarray
+        """
+
+        return np.percentile(self._returns, 100 * (1 - ci), axis=0) * np.sqrt(frequency)
+
+    def hurst_index(self):
+        """
+        Calculates Hurst Indices
+
+        :return: Hurst Indices
+        :rtype: np.ndarray
+        """
+
+        m = (self._returns.max(axis=0) - self._returns.min(axis=0)) / np.sqrt(self._m2)
+
+        return np.log(m) / np.log(self._returns.shape[0])
+
+    def bernardo_ledoit(self):
+        """
+        Calculates Bernardo and Ledoit ratios
+
+        :return: Bernardo and Ledoit ratios
+        :rtype: np.ndarray
+        """
+
+        positive = np.where(self._returns > 0, self._returns, 0).sum(axis=0)
+        negative = np.where(self._returns < 0, self._returns, 0).sum(axis=0)
+
+        return positive / -negative
+
+    def skewness_kurtosis_ratio(self):
+        """
+        Calculates skewness-kurtosis ratios
+
+        :return: skewness-kurtosis ratios
+        :rtype: np.ndarray
+        """
+
+        return self.skewness / self.kurtosis
+
+    def d(self):
+        """
+        Calculates D ratios
+
+        :return: D ratios
+        :rtype: np.ndarray
+        """
+
+        positive = self._returns > 0
+        negative = self._returns < 0
+        d_ratio = (
+            negative.sum(axis=0) * np.where(negative, self._returns, 0).sum(axis=0)
+        ) / (positive.sum(axis=0) * np.where(positive, self._returns, 0).sum(axis=0))
+
+        return -d_ratio
+
+    def kelly_criterion(self, annual_rfr=0.03):
+        """
+        Calculates Kelly criteria
+
+        :param annual_rfr: Annual Risk-free Rate (RFR), or its time-series, defaults to 0.03
+        :type annual_rfr: float or pd.Series, optional
+        :return: Kelly criteria
+        :rtype: np.ndarray
+        """
+
+        _checks._check_rate_arguments(annual_rfr=annual_rfr)
+
+        return (self.mean - self._rate(annual_rfr, False)) / self._m2
+
+    def up_capture(self):
+        """
+        Calculates Up-market captures
+
+        :return: Up-market captures
+        :rtype: np.ndarray
+        """
+
+        self._check_benchmark()
+        benchmark_returns = self._benchmark_columns()
+        up = benchmark_returns > 0
+
+        return np.sum(self._returns, axis=0, where=up) / np.sum(
+            benchmark_returns, axis=0, where=up
+        )
+
+    def down_capture(self):
+        """
+        Calculates Down-market captures
+
+        :return: Down-market captures
+        :rtype: np.ndarray
+        """
+
+        self._check_benchmark()
+        benchmark_returns = self._benchmark_columns()
+        down = benchmark_returns <= 0
+
+        return np.sum(self._returns, axis=0, where=down) / np.sum(
+            benchmark_returns, axis=0, where=down
+        )
+
+    def up_number(self):
+        """
+        Calculates Up-market numbers
+
+        :return: Up-market numbers
+        :rtype: np.ndarray
+        """
+
+        self._check_benchmark()
+        up = self._benchmark_columns() > 0
+
+        return np.sum(up & (self._returns > 0), axis=0) / up.sum(axis=0)
+
+    def down_number(self):
+        """
+        Calculates Down-market numbers
+
+        :return: Down-market numbers
+        :rtype: np.ndarray
+        """
+
+        self._check_benchmark()
+        down = self._benchmark_columns() <= 0
+
+        return np.sum(down & (self._returns < 0), axis=0) / down.sum(axis=0)
+
+    def up_percentage(self):
+        """
+        Calculates Up-market percentages
+
+        :return: Up-market percentages
+        :rtype: np.ndarray
+        """
+
+        self._check_benchmark()
+        benchmark_returns = self._benchmark_columns()
+        up = benchmark_returns > 0
+
+        return np.sum(up & (self._returns > benchmark_returns), axis=0) / up.sum(axis=0)
+
+    def down_percentage(self):
+        """
+        Calculates Down-market percentages
+
+        :return: Down-market percentages
+        :rtype: np.ndarray
+        """
+
+        self._check_benchmark()
+        benchmark_returns = self._benchmark_columns()
+        down = benchmark_returns <= 0
+
+        return np.sum(down & (self._returns > benchmark_returns), axis=0) / down.sum(
+            axis=0
+        )
@@ -0,0 +1,204 @@
+"""
+`bootstrap.py` module contains `bootstrap()` function for estimating
+standard errors and confidence intervals of statistics and ratios of
+`portan.Analytics` and `portan.BatchAnalytics` portfolios by resampling
+their returns
+"""
+
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from portan import _checks, _stats
+from portan.batch import BatchAnalytics, METRICS, BENCHMARK_METRICS
+
+METHODS = ["stationary", "block", "iid"]
+
+
+def _series(portfolio):
+    """
+    Returns, names and benchmark returns of `portan.Analytics` (one portfolio)
+    or `portan.BatchAnalytics` (many portfolios) objects as arrays
+    """
+
+    if isinstance(portfolio, BatchAnalytics):
+        return portfolio._returns, portfolio.names, portfolio._benchmark_returns
+
+    returns = portfolio.returns.to_numpy(dtype=float).reshape(-1, 1)
+    benchmark_returns = portfolio.benchmark_returns
+    if benchmark_returns is not None:
+        benchmark_returns = benchmark_returns.to_numpy(dtype=float).ravel()
+
+    return returns, [portfolio.name], benchmark_returns
+
+
+def _resample(
+    returns,
+    benchmark_returns,
+    seeds,
+    method,
+    block_size,
+    metrics,
+    frequency,
+    initial_aum,
+    kwargs,
+):
+    """
+    Evaluates metrics over one batch of resamples. Indices are drawn once and
+    shared by all portfolios and the benchmark, so that resamples keep their
+    cross-sectional dependence. Every (resample, portfolio) pair becomes one
+    column of a `portan.BatchAnalytics` object. Each resample has its own
+    random stream, so that resamples don't depend on how they are batched
+    """
+
+    observations, portfolios = returns.shape
+    resamples = len(seeds)
+    indices = np.vstack(
+        [
+            _stats.bootstrap_indices(
+                observations, 1, method, block_size, np.random.default_rng(seed)
+            )
+            for seed in seeds
+        ]
+    ).T
+
+    resampled = returns[indices].reshape(observations, -1)
+    if benchmark_returns is not None:
+        benchmark_returns = benchmark_returns[indices]
+        if benchmark_returns.ndim == 2:
+            benchmark_returns = np.repeat(benchmark_returns, portfolios, axis=1)
+        else:
+            benchmark_returns = benchmark_returns.reshape(observations, -1)
+
+    batch = BatchAnalytics.from_returns(
+        resampled,
+        benchmark_returns=benchmark_returns,
+        names=list(range(resampled.shape[1])),
+        initial_aum=initial_aum,
+        frequency=frequency,
+    )
+
+    return (
+        batch.summary(metrics, **kwargs).to_numpy().reshape(resamples, portfolios, -1)
+    )
+
+
+def bootstrap(
+    portfolio,
+    metrics=None,
+    resamples=1000,
+    method="stationary",
+    block_size=None,
+    ci=0.95,
+    seed=None,
+    batch_size=None,
+    processes=1,
+    **kwargs,
+):
+    """
+    Estimates standard errors and percentile confidence intervals of statistics
+    and ratios by resampling portfolio returns (and the aligned benchmark returns).
+    Resample indices are drawn once and all metrics of a batch of resamples are
+    evaluated on them at once, with every resample being one portfolio of a
+    `portan.BatchAnalytics` object. Memory use is bounded by `batch_size`, and
+    results don't depend on `batch_size` or `processes` for a given `seed`
+
+    :param portfolio: Portfolio(s) whose returns are resampled
+    :type portfolio: portan.Analytics or portan.BatchAnalytics
+    :param metrics: Names of the statistics and ratios (keys of `portan.batch.METRICS`), defaults to None
+                    (all, benchmark ones only if the benchmark is set)
+    :type metrics: list, optional
+    :param resamples: Number of resamples, defaults to 1000
+    :type resamples: int, optional
+    :param method: Resampling method. `"stationary"` (stationary bootstrap with geometric block
+                   lengths), `"block"` (circular block bootstrap with fixed block lengths) or
+                   `"iid"` (independent observations), defaults to "stationary"
+    :type method: str, optional
+    :param block_size: (Expected) block length for `"stationary"` and `"block"` methods,
+                       defaults to None (cube root of the number of observations)
+    :type block_size: int, optional
+    :param ci: Confidence level of the intervals, defaults to 0.95
+    :type ci: float, optional
+    :param seed: Seed of the random number generator, defaults to None
+    :type seed: int, optional
+    :param batch_size: Number of resamples evaluated at once, defaults to None (about 8 MB of resampled returns per batch)
+    :type batch_size: int, optional
+    :param processes: Number of worker processes evaluating the batches, defaults to 1 (no pool)
+    :type processes: int, optional
+    :param kwargs: Arguments passed to every metric that accepts them (e.g. `annual_rfr`, `annual_mar`)
+    :return: Point estimates, standard errors and confidence interval bounds with one row per metric
+             (per portfolio and metric for `portan.BatchAnalytics`)
+    :rtype: pd.DataFrame
+    """
+
+    returns, names, benchmark_returns = _series(portfolio)
+    observations, portfolios = returns.shape
+    block_size = _checks._check_bootstrap_arguments(
+        resamples=resamples,
+        method=method,
+        available_methods=METHODS,
+        block_size=block_size,
+        observations=observations,
+        ci=ci,
+        batch_size=batch_size,
+        processes=processes,
+    )
+    if metrics is None:
+        metrics = [
+            metric
+            for metric in METRICS.keys()
+            if benchmark_returns is not None or metric not in BENCHMARK_METRICS
+        ]
+
+    estimate = BatchAnalytics.from_returns(
+        returns,
+        benchmark_returns=benchmark_returns,
+        names=names,
+        initial_aum=portfolio.initial_aum,
+        frequency=portfolio.frequency,
+    ).summary(metrics, **kwargs)
+
+    batch_size = _stats.chunk_rows(observations * portfolios, batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(resamples)
+    batches = [seeds[i : i + batch_size] for i in range(0, resamples, batch_size)]
+    arguments = (
+        method,
+        block_size,
+        metrics,
+        portfolio.frequency,
+        portfolio.initial_aum,
+        kwargs,
+    )
+    if processes == 1 or len(batches) == 1:
+        values = [
+            _resample(returns, benchmark_returns, batch, *arguments)
+            for batch in batches
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(
+                    _resample, returns, benchmark_returns, batch, *arguments
+                )
+                for batch in batches
+            ]
+            values = [future.result() for future in futures]
+    distribution = np.concatenate(values)
+
+    with np.errstate(invalid="ignore"):
+        finite = np.where(np.isfinite(distribution), distribution, np.nan)
+        standard_error = np.nanstd(finite, axis=0, ddof=1)
+        lower, upper = np.nanquantile(finite, [(1 - ci) / 2, (1 + ci) / 2], axis=0)
+
+    table = pd.DataFrame(
+        {
+            "Estimate": estimate.to_numpy().ravel(),
+            "Standard Error": standard_error.ravel(),
+            "Lower": lower.ravel(),
+            "Upper": upper.ravel(),
+        },
+        index=pd.MultiIndex.from_product([names, estimate.columns]),
+    )
+    if not isinstance(portfolio, BatchAnalytics):
+        table.index = estimate.columns
+
+    return table
@@ -0,0 +1,376 @@
+"""
+`cache.py` module contains `PriceCache` class for persistent on-disk
+storage of downloaded assets data
+"""
+
+
+import os
+import json
+import hashlib
+import threading
+import importlib.util
+from datetime import datetime, timedelta
+import pandas as pd
+
+
+FILE_FORMATS = ["parquet", "pickle"]
+
+
+class PriceCache:
+    """
+    `portan.PriceCache` object stores downloaded assets data on disk, one file per
+    ticker and interval, and keeps track of the date range covered by each file so
+    that only the missing part of the requested history has to be downloaded
+
+    - Properties
+
+        - `directory` - Directory where the cached data is stored
+        - `file_format` - Format of the cached files, `"parquet"` or `"pickle"`
+        - `max_bytes` - Maximum size of the cache in bytes before least recently used entries are evicted
+        - `offline` - Whether downloading is disabled and only cached data is used
+        - `entries` - Metadata of the cached entries
+        - `info` - Cached assets information (e.g. names, sectors)
+        - `size` - Current size of the cache in bytes
+    """
+
+    def __init__(
+        self,
+        directory="~/.portan_cache",
+        file_format=None,
+        max_bytes=None,
+        offline=False,
+    ) -> None:
+        """
+        Initiates `portan.PriceCache` object
+
+        :param directory: Directory where the cached data is stored. It is created if it doesn't exist, defaults to "~/.portan_cache"
+        :type directory: str, optional
+        :param file_format: Format of the cached files. Available are `"parquet"` (requires `pyarrow`) and `"pickle"`, defaults to None (`"parquet"` if `pyarrow` is installed, `"pickle"` otherwise)
+        :type file_format: str, optional
+        :param max_bytes: Maximum size of the cache in bytes. When exceeded, least recently used entries are evicted, defaults to None (no limit)
+        :type max_bytes: int, optional
+        :param offline: Whether to use only the cached data without downloading the missing data, defaults to False
+        :type offline: bool, optional
+        """
+
+        if file_format is None:
+            if importlib.util.find_spec("pyarrow") is not None:
+                file_format = "parquet"
+            else:
+                file_format = "pickle"
+        if file_format not in FILE_FORMATS:
+            raise ValueError("`file_format` should be either `parquet` or `pickle`")
+        if max_bytes is not None and (not isinstance(max_bytes, int) or max_bytes < 1):
+            raise ValueError("`max_bytes` should be a positive integer or `None`")
+        if not isinstance(offline, bool):
+            raise ValueError("`offline` should be of type `bool`")
+
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.file_format = file_format
+        self.max_bytes = max_bytes
+        self.offline = offline
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.RLock()
+        self._index_path = os.path.join(self.directory, "index.json")
+        if os.path.exists(self._index_path):
+            with open(self._index_path, "r") as f:
+                self.entries = json.load(f)
+        else:
+            self.entries = dict()
+        self._info_path = os.path.join(self.directory, "info.json")
+        if os.path.exists(self._info_path):
+            with open(self._info_path, "r") as f:
+                self.info = json.load(f)
+        else:
+            self.info = dict()
+
+    def __getstate__(self):
+        # Locks can't be pickled, e.g. when portfolios are sent to worker processes
+        state = self.__dict__.copy()
+        del state["_lock"]
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def size(self):
+        """
+        Gives the current size of the cache in bytes
+
+        :return: Size of the cached files
+        :rtype: int
+        """
+
+        with self._lock:
+            return sum(
+                os.path.getsize(os.path.join(self.directory, entry["file"]))
+                for entry in self.entries.values()
+                if os.path.exists(os.path.join(self.directory, entry["file"]))
+            )
+
+    def missing(self, ticker, interval, start, end, **kwargs):
+        """
+        Finds the date ranges of the requested history that are not in the cache.
+        The last cached bar is always included in the tail range so that a bar that
+        was incomplete at the time of caching is replaced
+
+        :param ticker: Asset ticker
+        :type ticker: str
+        :param interval: Data interval
+        :type interval: str
+        :param start: Start date of the requested history
+        :type start: str (YYYY-MM-DD) or `datetime.datetime()` or `pd.Timestamp`
+        :param end: End date (exclusive) of the requested history
+        :type end: str (YYYY-MM-DD) or `datetime.datetime()` or `pd.Timestamp`
+        :return: List of (start, end) ranges that have to be downloaded
+        :rtype: list
+        """
+
+        start, end = _naive(start), _naive(end)
+
+        with self._lock:
+            entry = self.entries.get(_key(ticker, interval, **kwargs))
+        if entry is None:
+            return [(start, end)]
+
+        ranges = list()
+        covered_start = pd.Timestamp(entry["start"])
+        covered_end = pd.Timestamp(entry["end"])
+        if start < covered_start:
+            ranges.append((start, covered_start))
+        if end > covered_end:
+            last = pd.Timestamp(entry["last"]) if entry["last"] else covered_end
+            ranges.append((min(covered_end, last), end))
+
+        return ranges
+
+    def get(self, ticker, interval, start, end, **kwargs):
+        """
+        Reads the cached data of the requested history
+
+        :param ticker: Asset ticker
+        :type ticker: str
+        :param interval: Data interval
+        :type interval: str
+        :param start: Start date of the requested history
+        :type start: str (YYYY-MM-DD) or `datetime.datetime()` or `pd.Timestamp`
+        :param end: End date (exclusive) of the requested history
+        :type end: str (YYYY-MM-DD) or `datetime.datetime()` or `pd.Timestamp`
+        :return: Cached data, `None` if the ticker isn't cached
+        :rtype: pd.DataFrame or NoneType
+        """
+
+        with self._lock:
+            entry = self.entries.get(_key(ticker, interval, **kwargs))
+            if entry is None:
+                return None
+            data = self._read(entry["file"])
+            entry["accessed"] = datetime.now().isoformat()
+            self._save_index()
+
+        if data.empty:
+            return data
+
+        return data.loc[
+            (data.index >= _localize(start, data.index))
+            & (data.index < _localize(end, data.index))
+        ]
+
+    def put(self, ticker, interval, data, start, end, **kwargs):
+        """
+        Merges newly downloaded data into the cache and extends the covered date range.
+        The current day is never marked as covered as its data can still change
+
+        :param ticker: Asset ticker
+        :type ticker: str
+        :param interval: Data interval
+        :type interval: str
+        :param data: Downloaded data
+        :type data: pd.DataFrame
+        :param start: Start date of the downloaded history
+        :type start: str (YYYY-MM-DD) or `datetime.datetime()` or `pd.Timestamp`
+        :param end: End date (exclusive) of the downloaded history
+        :type end: str (YYYY-MM-DD) or `datetime.datetime()` or `pd.Timestamp`
+        """
+
+        start, end = _naive(start), _coverage_end(end)
+        key = _key(ticker, interval, **kwargs)
+
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                cached = self._read(entry["file"])
+                if not cached.empty:
+                    data = pd.concat([cached, data]) if not data.empty else cached
+                    data = data[~data.index.duplicated(keep="last")].sort_index()
+                start = min(start, pd.Timestamp(entry["start"]))
+                end = max(end, pd.Timestamp(entry["end"]))
+
+            file = f"{key}.{self.file_format}"
+            self._write(data, file)
+            now = datetime.now().isoformat()
+            self.entries[key] = {
+                "ticker": ticker,
+                "interval": interval,
+                "file": file,
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "last": _naive(data.index[-1]).isoformat() if not data.empty else None,
+                "accessed": now,
+                "updated": now,
+            }
+            self._save_index()
+
+        if self.max_bytes is not None:
+            self.evict(max_bytes=self.max_bytes)
+
+    def get_info(self, ticker):
+        """
+        Reads the cached information about an asset
+
+        :param ticker: Asset ticker
+        :type ticker: str
+        :return: Asset information, `None` if the ticker isn't cached
+        :rtype: dict or NoneType
+        """
+
+        with self._lock:
+            return self.info.get(ticker)
+
+    def put_info(self, info):
+        """
+        Stores the information about assets
+
+        :param info: Assets information keyed by ticker
+        :type info: dict
+        """
+
+        with self._lock:
+            self.info.update(info)
+            _dump(self.info, self._info_path)
+
+    def invalidate(self, tickers=None, interval=None):
+        """
+        Removes cached entries. Without arguments the whole cache is cleared.
+        Assets information is removed too, unless `interval` is given
+
+        :param tickers: Tickers whose entries are removed, defaults to None (all tickers)
+        :type tickers: list, optional
+        :param interval: Interval whose entries are removed, defaults to None (all intervals)
+        :type interval: str, optional
+        """
+
+        with self._lock:
+            for key in list(self.entries.keys()):
+                if tickers is not None and self.entries[key]["ticker"] not in tickers:
+                    continue
+                if interval is not None and self.entries[key]["interval"] != interval:
+                    continue
+                self._remove(key)
+            self._save_index()
+            if interval is None:
+                for ticker in list(self.info.keys()):
+                    if tickers is None or ticker in tickers:
+                        del self.info[ticker]
+                _dump(self.info, self._info_path)
+
+    def evict(self, max_bytes=None, max_age=None):
+        """
+        Evicts cached entries. Entries that weren't accessed for longer than `max_age`
+        are removed first, then least recently used entries are removed until the
+        cache fits into `max_bytes`
+
+        :param max_bytes: Maximum size of the cache in bytes, defaults to None (no size limit)
+        :type max_bytes: int, optional
+        :param max_age: Maximum time since the last access, defaults to None (no age limit)
+        :type max_age: `datetime.timedelta` or int (days), optional
+        """
+
+        if isinstance(max_age, int):
+            max_age = timedelta(days=max_age)
+
+        with self._lock:
+            by_access = sorted(
+                self.entries.keys(), key=lambda key: self.entries[key]["accessed"]
+            )
+            if max_age is not None:
+                cutoff = (datetime.now() - max_age).isoformat()
+                for key in list(by_access):
+                    if self.entries[key]["accessed"] < cutoff:
+                        self._remove(key)
+                        by_access.remove(key)
+            if max_bytes is not None:
+                size = self.size
+                while size > max_bytes and by_access:
+                    key = by_access.pop(0)
+                    path = os.path.join(self.directory, self.entries[key]["file"])
+                    size -= os.path.getsize(path) if os.path.exists(path) else 0
+                    self._remove(key)
+            self._save_index()
+
+    def _remove(self, key):
+        path = os.path.join(self.directory, self.entries.pop(key)["file"])
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _read(self, file):
+        path = os.path.join(self.directory, file)
+        if file.endswith(".parquet"):
+            return pd.read_parquet(path)
+        else:
+            return pd.read_pickle(path)
+
+    def _write(self, data, file):
+        path = os.path.join(self.directory, file)
+        temporary = path + ".tmp"
+        if self.file_format == "parquet":
+            data.to_parquet(temporary)
+        else:
+            data.to_pickle(temporary)
+        os.replace(temporary, path)
+
+    def _save_index(self):
+        _dump(self.entries, self._index_path)
+
+
+def _dump(content, path):
+    temporary = path + ".tmp"
+    with open(temporary, "w") as f:
+        json.dump(content, f, indent=1, default=str)
+    os.replace(temporary, path)
+
+
+def _key(ticker, interval, **kwargs):
+    # Download keyword arguments (e.g. `auto_adjust`) change the data so they are part of the key
+    key = f"{ticker}_{interval}"
+    if kwargs:
+        digest = hashlib.md5(
+            json.dumps(kwargs, sort_keys=True, default=str).encode()
+        ).hexdigest()[:8]
+        key = f"{key}_{digest}"
+
+    return key
+
+
+def _naive(date):
+    date = pd.Timestamp(date)
+    if date.tzinfo is not None:
+        date = date.tz_localize(None)
+
+    return date
+
+
+def _coverage_end(end):
+    return min(_naive(end), pd.Timestamp.now().normalize())
+
+
+def _localize(date, index):
+    date = _naive(date)
+    if getattr(index, "tz", None) is not None:
+        date = date.tz_localize(index.tz)
+
+    return date
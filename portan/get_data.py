@@ -5,30 +5,147 @@ for downloading and exporting financial data
 
 
 import os
+import time
+import warnings
 from datetime import datetime
-import yfinance as yf
-from portan import _checks
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from portan import _checks, _io
+from portan._lazy import LazyModule
+
+# `yfinance` is imported when data is first downloaded
+yf = LazyModule("yfinance")
 
 
 CURRENT_DATE = str(datetime.now())[0:10]
 
 
+class YahooSource:
+    """
+    `portan.YahooSource` object downloads assets data with `yfinance`. It is the
+    default data source of `portan.GetData`. Any object with the same `history()`
+    method can be used as a data source instead (e.g. a local database)
+    """
+
+    def history(self, ticker, start, end, interval, **kwargs):
+        """
+        Downloads the history of a single asset
+
+        :param ticker: Asset ticker
+        :type ticker: str
+        :param start: Download start date for the data
+        :type start: str (YYYY-MM-DD) or `datetime.datetime()` or `pd.Timestamp`
+        :param end: Download end date for the data
+        :type end: str (YYYY-MM-DD) or `datetime.datetime()` or `pd.Timestamp`
+        :param interval: Data interval
+        :type interval: str
+        :return: Asset data with `Open`, `High`, `Low`, `Close` and `Volume` columns
+        :rtype: pd.DataFrame
+        """
+
+        return yf.Ticker(ticker).history(
+            start=start, end=end, interval=interval, **kwargs
+        )
+
+    def info(self, ticker):
+        """
+        Downloads the information about a single asset (e.g. name, sector)
+
+        :param ticker: Asset ticker
+        :type ticker: str
+        :return: Asset information
+        :rtype: dict
+        """
+
+        return yf.Ticker(ticker).info
+
+
+def get_info(tickers, cache=None, source=None, workers=8):
+    """
+    Downloads the information about assets (e.g. names, sectors) concurrently.
+    Information already stored in `cache` isn't downloaded again, and nothing
+    is downloaded if `cache` is offline
+
+    :param tickers: Tickers of assets for which information is to be downloaded
+    :type tickers: list, np.ndarray, pd.Series, pd.DataFrame
+    :param cache: On-disk cache where the information is stored, defaults to None (no caching)
+    :type cache: `portan.PriceCache` or str, optional
+    :param source: Data source with `info(ticker)` method, defaults to None (`portan.YahooSource`)
+    :type source: object, optional
+    :param workers: Maximum number of concurrent downloads, defaults to 8
+    :type workers: int, optional
+    :return: Information about each asset and tickers that couldn't be downloaded with the reason why
+    :rtype: dict, dict
+    """
+
+    tickers = _checks._check_tickers(tickers)
+    _checks._check_posints(workers=workers)
+    cache = _checks._check_cache(cache)
+    source = YahooSource() if source is None else source
+
+    info = dict()
+    if cache is not None:
+        for ticker in tickers:
+            cached = cache.get_info(ticker)
+            if cached is not None:
+                info[ticker] = cached
+
+    missing = [ticker for ticker in tickers if ticker not in info]
+    failed = dict()
+    if missing and cache is not None and cache.offline:
+        warnings.warn(
+            f"Cache is offline, so information about {missing} isn't downloaded"
+        )
+        failed = {ticker: "Cache is offline" for ticker in missing}
+    elif missing:
+        with ThreadPoolExecutor(max_workers=min(workers, len(missing))) as executor:
+            futures = {
+                ticker: executor.submit(source.info, ticker) for ticker in missing
+            }
+        downloaded = dict()
+        for ticker, future in futures.items():
+            try:
+                downloaded[ticker] = future.result()
+            except Exception as error:
+                failed[ticker] = repr(error)
+        if cache is not None and downloaded:
+            cache.put_info(downloaded)
+        info.update(downloaded)
+
+    return {ticker: info[ticker] for ticker in tickers if ticker in info}, failed
+
+
 class GetData:
     """
     portan.GetData object allows downloading and exporting of financial data with `yfinance`
 
     - Properties
 
-        - `tickers`/`tickers` - `yfinance.Ticker`/`yfinance.Tickers` object
+        - `tickers` - Tickers of the assets
         - `data` - Full DataFrame of the downloaded data
         - `close` - Assets prices at trading close
+        - `failed` - Tickers that couldn't be downloaded and the reason why
+        - `cache` - `portan.PriceCache` object used to store downloaded data
+        - `source` - Data source used for downloading
     """
 
     def __init__(
-        self, tickers, start="1970-01-02", end=CURRENT_DATE, interval="1d", **kwargs
+        self,
+        tickers,
+        start="1970-01-02",
+        end=CURRENT_DATE,
+        interval="1d",
+        cache=None,
+        source=None,
+        workers=8,
+        retries=2,
+        backoff=1.0,
+        **kwargs,
     ):
         """
-        Initialtes GetData object by downloading data from `yfinance` which the user can use within `Python` or save as `.csv`
+        Initialtes GetData object by downloading data from `yfinance` which the user can use within `Python` or save as `.csv`.
+        Assets are downloaded concurrently and each download is retried on failure. Tickers that
+        still couldn't be downloaded are reported in `failed` property and omitted from the data
 
         :param tickers: Tickers of assets for which data is to be downloaded
         :type tickers: list, np.ndarray, pd.Series, pd.DataFrame
@@ -38,20 +155,103 @@ class GetData:
         :type end: str (YYYY-MM-DD) or `datetime.datetime()` or `pd.Timestamp`, optional
         :param interval: Data interval. Valid intervals are: '1m', '2m', '5m', '15m', '30m', '60m', '90m', '1h', '1d', '5d', '1wk', '1mo', '3mo', defaults to "1d"
         :type interval: str, optional
+        :param cache: On-disk cache consulted before downloading. Only the history missing from the cache is downloaded. A path can be passed to use a `portan.PriceCache` stored in that directory, defaults to None (no caching)
+        :type cache: `portan.PriceCache` or str, optional
+        :param source: Data source with `history(ticker, start, end, interval, **kwargs)` method, defaults to None (`portan.YahooSource`)
+        :type source: object, optional
+        :param workers: Maximum number of concurrent downloads, defaults to 8
+        :type workers: int, optional
+        :param retries: Number of times a failed download is retried, defaults to 2
+        :type retries: int, optional
+        :param backoff: Waiting time in seconds before the first retry. It doubles with every following retry, defaults to 1.0
+        :type backoff: float, optional
         """
 
         tickers = _checks._check_get_data(tickers, start, end, interval)
+        _checks._check_posints(workers=workers)
+        _checks._check_nonnegints(retries=retries)
 
-        if len(tickers) == 1:
-            self.ticker = yf.Ticker(tickers[0])
-            self._data = self.ticker.history(
-                start=start, end=end, interval=interval, **kwargs
+        self.tickers = tickers
+        self.cache = _checks._check_cache(cache)
+        self.source = YahooSource() if source is None else source
+        self.failed = dict()
+        self._retries = retries
+        self._backoff = backoff
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(tickers))) as executor:
+            futures = {
+                ticker: executor.submit(
+                    self._history, ticker, start, end, interval, **kwargs
+                )
+                for ticker in tickers
+            }
+        frames = dict()
+        for ticker, future in futures.items():
+            try:
+                frames[ticker] = future.result()
+            except Exception as error:
+                self.failed[ticker] = repr(error)
+
+        if not frames:
+            raise ValueError(f"None of the tickers could be downloaded: {self.failed}")
+        if self.failed:
+            warnings.warn(
+                f"Tickers {list(self.failed.keys())} couldn't be downloaded and are omitted from the data. Reasons are available in `failed` property"
             )
+
+        if len(tickers) == 1:
+            self._data = frames[tickers[0]]
         elif len(tickers) > 1:
-            self.tickers = yf.Tickers(tickers)
-            self._data = self.tickers.history(
-                start=start, end=end, interval=interval, **kwargs
-            ).reindex(columns=tickers, level=1)
+            self._data = (
+                pd.concat(
+                    frames.values(),
+                    axis=1,
+                    keys=frames.keys(),
+                    names=["Symbols", "Attributes"],
+                )
+                .swaplevel(axis=1)
+                .sort_index(level=0, axis=1, sort_remaining=False)
+            )
+
+    def _download(self, ticker, start, end, interval, allow_empty=False, **kwargs):
+        for attempt in range(self._retries + 1):
+            try:
+                history = self.source.history(ticker, start, end, interval, **kwargs)
+                if not allow_empty and (history is None or history.empty):
+                    raise ValueError(f"No data returned for `{ticker}`")
+                return history
+            except Exception:
+                if attempt == self._retries:
+                    raise
+                time.sleep(self._backoff * 2**attempt)
+
+    def _history(self, ticker, start, end, interval, **kwargs):
+        if self.cache is None:
+            return self._download(ticker, start, end, interval, **kwargs)
+
+        for fetch_start, fetch_end in self.cache.missing(
+            ticker, interval, start, end, **kwargs
+        ):
+            if self.cache.offline:
+                warnings.warn(
+                    f"Cache is offline, so history of `{ticker}` from {fetch_start.date()} to {fetch_end.date()} isn't downloaded"
+                )
+                continue
+            # Ranges without any bars (e.g. a weekend tail) are valid
+            history = self._download(
+                ticker, fetch_start, fetch_end, interval, allow_empty=True, **kwargs
+            )
+            self.cache.put(ticker, interval, history, fetch_start, fetch_end, **kwargs)
+
+        history = self.cache.get(ticker, interval, start, end, **kwargs)
+        if history is None:
+            raise ValueError(
+                f"`{ticker}` isn't cached and can't be downloaded as the cache is offline"
+            )
+        if history.empty:
+            raise ValueError(f"No data available for `{ticker}`")
+
+        return history
 
     @property
     def data(self):
@@ -75,42 +275,80 @@ class GetData:
 
         return self._data["Close"]
 
-    def save_long(self):
+    def save_long(self, path="all_tickers_data_long.csv", file_format=None):
         """
-        Saves downloaded data as `.csv` in long format
+        Saves downloaded data in long format
+
+        :param path: Path of the file, defaults to "all_tickers_data_long.csv"
+        :type path: str, optional
+        :param file_format: `"csv"`, `"parquet"` or `"feather"`, defaults to None (inferred from `path` extension)
+        :type file_format: str, optional
         """
 
+        file_format = _io.file_format(path, file_format)
         data_long = (
             self.data.stack(level=1)
             .reset_index(level=1)
-            .rename(columns={"level_1": "Ticker"})
+            .rename(columns={"Symbols": "Ticker", "level_1": "Ticker"})
             .sort_values(by=["Ticker", "Date"])
         )
-        data_long.to_csv("all_tickers_data_long.csv")
+        _io.write(data_long, path, file_format)
 
-    def save_wide(self):
+    def save_wide(
+        self, path="all_tickers_data_wide.csv", file_format=None, chunk_size=None
+    ):
         """
-        Saves downloaded data as `.csv` in wide format
+        Saves downloaded data in wide format
+
+        :param path: Path of the file, defaults to "all_tickers_data_wide.csv"
+        :type path: str, optional
+        :param file_format: `"csv"`, `"parquet"`, `"feather"` or `"npz"`, defaults to None (inferred from `path` extension)
+        :type file_format: str, optional
+        :param chunk_size: Number of rows written at once, which bounds memory use for large panels, defaults to None (all rows at once)
+        :type chunk_size: int, optional
         """
 
-        self.data.to_csv("all_tickers_data_wide.csv")
+        file_format = _io.file_format(path, file_format)
+        _io.write(self.data, path, file_format, chunk_size)
 
-    def save_close(self):
+    def save_close(self, path="close_only.csv", file_format=None, chunk_size=None):
         """
-        Saves trading close prices as `.csv`
+        Saves trading close prices. Files can be loaded with `portan.load_prices()`
+
+        :param path: Path of the file, defaults to "close_only.csv"
+        :type path: str, optional
+        :param file_format: `"csv"`, `"parquet"`, `"feather"` or `"npz"`, defaults to None (inferred from `path` extension)
+        :type file_format: str, optional
+        :param chunk_size: Number of rows written at once, which bounds memory use for large panels, defaults to None (all rows at once)
+        :type chunk_size: int, optional
         """
 
-        self.close.to_csv("close_only.csv")
+        file_format = _io.file_format(path, file_format)
+        close = self.close
+        if isinstance(close, pd.Series):
+            close = close.to_frame(self.tickers[0])
+        _io.write(close, path, file_format, chunk_size)
 
-    def save_separately(self):
+    def save_separately(self, directory="tickers_data", file_format="csv"):
         """
-        Saves trading data as `.csv` for each asset separately
+        Saves trading data for each asset separately, as `<ticker>_data.<file_format>`
+
+        :param directory: Directory where the files are saved, defaults to "tickers_data"
+        :type directory: str, optional
+        :param file_format: `"csv"`, `"parquet"`, `"feather"` or `"npz"`, defaults to "csv"
+        :type file_format: str, optional
         """
 
-        os.mkdir("tickers_data")
-        os.chdir("tickers_data")
-        current_data = self.data
-        current_data.columns = self.data.columns.swaplevel("Symbols", "Attributes")
-        for ticker in current_data.columns:
-            time_series = current_data[ticker]
-            time_series.to_csv("%s_data.csv" % ticker)
+        file_format = _io.file_format(f"data.{file_format}")
+        os.makedirs(directory, exist_ok=True)
+        if isinstance(self.data.columns, pd.MultiIndex):
+            data = self.data.swaplevel("Symbols", "Attributes", axis=1)
+            frames = {ticker: data[ticker] for ticker in self.tickers if ticker in data}
+        else:
+            frames = {self.tickers[0]: self.data}
+        for ticker, frame in frames.items():
+            _io.write(
+                frame,
+                os.path.join(directory, f"{ticker}_data.{file_format}"),
+                file_format,
+            )
@@ -53,6 +53,17 @@ Currently implemented periods are
 import pandas as pd
 
 
+# Column labels of `stress_test()` tables
+STRESS_COLUMNS = {
+    "observations": "Observations",
+    "return": "Return",
+    "volatility": "Volatility",
+    "maximum_drawdown": "Maximum Drawdown",
+    "benchmark_return": "Benchmark Return",
+    "up_capture": "Up-market Capture",
+    "down_capture": "Down-market Capture",
+}
+
 PERIODS = dict()
 
 
@@ -0,0 +1,125 @@
+"""
+`rebalancing.py` module contains the rebalancing engine of `portan.Analytics`.
+It simulates holdings of a portfolio that is rebalanced to its target weights
+on a calendar schedule, every number of observations and/or when its weights
+drift away from the target weights by more than a threshold
+"""
+
+import numpy as np
+import pandas as pd
+from portan import _checks, _stats
+
+SCHEDULES = {"weekly": "W", "monthly": "M", "quarterly": "Q", "annually": "A"}
+
+
+def _candidates(index, rebalancing, observations=0, previous=None):
+    """
+    Rows of `index` at which the portfolio can be rebalanced: the first observation
+    of each calendar period, every `rebalancing` observations, or every observation.
+    The first observation of a portfolio (`previous=None`) is its initial allocation
+    """
+
+    if rebalancing is None:
+        candidates = np.ones(index.shape[0], dtype=bool)
+    elif isinstance(rebalancing, str):
+        dates = index if previous is None else index.insert(0, previous)
+        if dates.tz is not None:
+            dates = dates.tz_localize(None)
+        periods = dates.to_period(SCHEDULES[rebalancing]).asi8
+        candidates = periods[1:] != periods[:-1]
+        if previous is None:
+            candidates = np.concatenate([[False], candidates])
+    else:
+        candidates = (observations + np.arange(index.shape[0])) % rebalancing == 0
+    if previous is None:
+        candidates[0] = False
+
+    return np.flatnonzero(candidates)
+
+
+def _simulate(
+    prices,
+    index,
+    weights,
+    holdings,
+    rebalancing,
+    threshold,
+    observations=0,
+    previous=None,
+    chunk_size=None,
+):
+    """
+    Units held in each segment between rebalances, rows of the rebalances, AUM
+    and trades (changes in weights) at the rebalances of prices (forward filled `np.ndarray`) starting from `holdings`
+    """
+
+    candidates = _candidates(index, rebalancing, observations, previous)
+    starts = _stats.rebalancing_starts(prices, weights, holdings, candidates, threshold)
+    units, aum, trades = _stats.rebalance(prices, weights, holdings, starts, chunk_size)
+
+    return units, starts, aum, trades
+
+
+def rebalance(
+    prices,
+    weights,
+    rebalancing="monthly",
+    threshold=None,
+    initial_aum=10000,
+    chunk_size=None,
+):
+    """
+    Simulates holdings of a portfolio rebalanced to `weights` at the close of the
+    rebalancing dates. Holdings are constant between rebalances, so the whole
+    path is calculated with cumulative products over the segments between them.
+    `rebalancing="monthly"` rebalances at the first observation of every month,
+    and with a `threshold` only if the weights drifted by more than `threshold`
+
+    :param prices: Assets prices time-series
+    :type prices: pd.DataFrame
+    :param weights: Target assets weights, summing to 1
+    :type weights: list or np.ndarray
+    :param rebalancing: Rebalancing schedule, one of `"weekly"`, `"monthly"`, `"quarterly"` and `"annually"`
+                        (first observation of each period), a number of observations between rebalances,
+                        or `None` (every observation is a candidate for `threshold`), defaults to "monthly"
+    :type rebalancing: str or int, optional
+    :param threshold: Largest absolute difference between the drifted and target weight of any asset
+                      that doesn't trigger a rebalance, defaults to None (rebalancing on schedule)
+    :type threshold: float, optional
+    :param initial_aum: Initial Assets Under Management (AUM), defaults to 10000
+    :type initial_aum: int, optional
+    :param chunk_size: Number of rows of `prices` processed at once when calculating AUM, defaults to None (chunks of about 8 MB)
+    :type chunk_size: int, optional
+    :return: State of each asset and the whole portfolio, and turnover (sum of absolute changes
+             in weights) indexed by the rebalancing dates
+    :rtype: tuple(pd.DataFrame, pd.Series)
+    """
+
+    if not isinstance(prices, pd.DataFrame):
+        raise ValueError("`prices` should be of type `pd.DataFrame`")
+    weights = np.asarray(weights, dtype=float)
+    if weights.shape != (prices.shape[1],):
+        raise ValueError("Number of `weights` doesn't match the number of assets")
+    _checks._check_rebalancing(rebalancing, threshold, weights, SCHEDULES, prices.index)
+    if chunk_size is not None:
+        _checks._check_posints(chunk_size=chunk_size)
+
+    values = _stats.forward_fill(prices.to_numpy(dtype=float))
+    units, starts, aum, trades = _simulate(
+        values,
+        prices.index,
+        weights,
+        initial_aum * weights / values[0],
+        rebalancing,
+        threshold,
+        chunk_size=chunk_size,
+    )
+    segments = np.searchsorted(starts, np.arange(values.shape[0]), side="right")
+    state = pd.DataFrame(
+        values * units[segments], index=prices.index, columns=prices.columns
+    )
+    state["Portfolio"] = aum
+
+    turnover = np.abs(trades).sum(axis=1)
+
+    return state, pd.Series(turnover, index=prices.index[starts], name="Turnover")
@@ -0,0 +1,149 @@
+"""
+`rendering.py` module contains `render_figures()` function for rendering
+`plot_*` figures of many `portan.Analytics` objects without a display, e.g.
+in batch jobs or on servers
+"""
+
+import os
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from portan import _checks
+from portan._lazy import LazyModule
+from portan.analytics import STYLE
+
+matplotlib = LazyModule("matplotlib")
+plt = LazyModule("matplotlib.pyplot")
+
+PLOTS = [
+    "plot_aum",
+    "plot_returns",
+    "plot_return_distribution",
+    "plot_cumulative_returns",
+    "plot_initial_holdings",
+    "plot_assets_cumulative_returns",
+    "plot_capm",
+    "plot_parametric_var",
+    "plot_historical_var",
+    "plot_correlation",
+    "plot_covariance",
+    "plot_omega_curve",
+    "plot_drawdowns",
+]
+
+
+@contextlib.contextmanager
+def _headless(style, rcParams_update):
+    """
+    Switches `matplotlib` to the non-interactive `Agg` backend and applies
+    the style once, restoring the previous backend and style on exit
+    """
+
+    backend = matplotlib.get_backend()
+    plt.switch_backend("agg")
+    try:
+        with plt.style.context(style or []), plt.rc_context(rcParams_update):
+            yield
+    finally:
+        plt.switch_backend(backend)
+
+
+def _figures(portfolio, plots, plot_kwargs):
+    """
+    Yields `(plot, figure)` pairs of a portfolio and closes each figure once
+    the caller is done with it
+    """
+
+    for plot in plots:
+        if plot == "plot_capm" and portfolio.benchmark_returns is None:
+            continue
+        fig = getattr(portfolio, plot)(
+            style=None, show=False, save=False, **plot_kwargs.get(plot, {})
+        )
+        try:
+            yield plot, fig
+        finally:
+            plt.close(fig)
+
+
+def _render(
+    portfolios, plots, directory, file_format, style, rcParams_update, plot_kwargs
+):
+    paths = []
+    with _headless(style, rcParams_update):
+        for portfolio in portfolios:
+            for plot, fig in _figures(portfolio, plots, plot_kwargs):
+                path = os.path.join(
+                    directory, f"{portfolio.name}_{plot[5:]}.{file_format}"
+                )
+                fig.savefig(path, format=file_format)
+                paths.append(path)
+
+    return paths
+
+
+def render_figures(
+    portfolios,
+    plots=None,
+    directory=".",
+    file_format="png",
+    style=STYLE,
+    rcParams_update={},
+    processes=1,
+    plot_kwargs={},
+):
+    """
+    Renders figures of many portfolios to files with a non-interactive backend.
+    The style is applied once per batch (rather than once per figure) and every
+    figure is closed after it is saved, so memory use doesn't grow with the
+    number of figures. Files are named `<portfolio name>_<plot>.<file_format>`,
+    e.g. `Investment Portfolio_drawdowns.png`
+
+    :param portfolios: Portfolios whose figures are rendered
+    :type portfolios: list
+    :param plots: Names of `plot_*` methods to render, defaults to None (all of `PLOTS`).
+                  `plot_capm` is skipped for portfolios without a benchmark
+    :type plots: list, optional
+    :param directory: Directory the figures are written to, created if it doesn't exist, defaults to "."
+    :type directory: str, optional
+    :param file_format: File format of the figures, e.g. `"png"`, `"pdf"` or `"svg"`, defaults to "png"
+    :type file_format: str, optional
+    :param style: `matplotlib` style to be used for plots. User can pass
+                  built-in `matplotlib` style (e.g. `classic`, `fivethirtyeight`),
+                  or a path to a custom style defined in a `.mplstyle` document,
+                  defaults to STYLE (propriatery PortAn style). `None` keeps
+                  the style currently in use
+    :type style: str, optional
+    :param rcParams_update: `matplotlib.rcParams` to modify the style defined by
+                            `style` argument, defaults to {} (no modification)
+    :type rcParams_update: dict, optional
+    :param processes: Number of worker processes. Portfolios are split into
+                      `processes` chunks rendered in parallel, defaults to 1 (no pool)
+    :type processes: int, optional
+    :param plot_kwargs: Keyword arguments passed to individual plots, keyed
+                        on the plot name, e.g. `{"plot_capm": {"annual_rfr": 0.02}}`,
+                        defaults to {}
+    :type plot_kwargs: dict, optional
+    :return: Paths of the rendered figures
+    :rtype: list
+    """
+
+    plots = _checks._check_render_arguments(
+        portfolios=portfolios,
+        plots=plots,
+        available_plots=PLOTS,
+        file_format=file_format,
+        processes=processes,
+    )
+    os.makedirs(directory, exist_ok=True)
+
+    arguments = (plots, directory, file_format, style, rcParams_update, plot_kwargs)
+    if processes == 1 or len(portfolios) == 1:
+        return _render(portfolios, *arguments)
+
+    # Contiguous chunks, so that the paths come back in the order of `portfolios`
+    size = -(-len(portfolios) // processes)
+    chunks = [portfolios[i : i + size] for i in range(0, len(portfolios), size)]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        futures = [executor.submit(_render, chunk, *arguments) for chunk in chunks]
+
+        return [path for future in futures for path in future.result()]
@@ -1,39 +1,239 @@
-from portan import Analytics
+"""
+`report.py` module contains `portan.Report` class for generating
+self-contained HTML and PDF tearsheets of `portan.Analytics` portfolios
+"""
+
+import io
+import time
+import base64
+import html
+from concurrent.futures import ThreadPoolExecutor
+from portan import _checks
+from portan._lazy import LazyModule
+from portan.analytics import STYLE
+from portan.rendering import PLOTS, _figures, _headless
+
+plt = LazyModule("matplotlib.pyplot")
+backend_pdf = LazyModule("matplotlib.backends.backend_pdf")
+
+TABLES = {
+    "summary_return_moments": "Return Moments",
+    "summary_aum": "Assets Under Management",
+    "summary_drawdowns_ratio": "Drawdowns Ratios",
+    "summary_downside_risk": "Downside Risk",
+    "summary_up_down": "Up-market and Down-market",
+    "summary_frequency": "Frequency",
+}
+
+HTML_STYLE = """
+body { font-family: Helvetica, Arial, sans-serif; margin: 2em auto; max-width: 60em; color: #222; }
+h1 { border-bottom: 2px solid #222; }
+table { border-collapse: collapse; margin-bottom: 1.5em; }
+td, th { padding: 0.25em 1em; border-bottom: 1px solid #ddd; text-align: right; }
+th { text-align: left; }
+img { max-width: 100%; }
+"""
 
 
 class Report:
-    def __init__(self) -> None:
-        pass
+    """
+    `portan.Report` object generates a tearsheet of a `portan.Analytics` portfolio.
+    Summary tables are computed in a thread pool, figures are rendered with a
+    non-interactive backend, and both are written to a single self-contained
+    HTML or PDF file
+
+    - Properties
+
+        - `analytics` - Portfolio the report is on
+        - `plots` - Names of `plot_*` methods included in the report
+        - `annual_rfr` - Annual Risk-free Rate (RFR) used in the summary tables
+        - `annual_mar` - Annual Minimum Accepted Return (MAR) used in the summary tables
+        - `ci` - Confidence interval for VaR
+        - `style` - `matplotlib` style used for plots
+        - `rcParams_update` - `matplotlib.rcParams` modifying `style`
+        - `plot_kwargs` - Keyword arguments passed to individual plots, keyed on the plot name
+        - `threads` - Number of threads computing the summary tables
+        - `generation_time` - Time (in seconds) the last `save()` took, `None` before the report is saved
+    """
+
+    def __init__(
+        self,
+        analytics,
+        annual_rfr=0.03,
+        annual_mar=0.03,
+        ci=0.95,
+        plots=None,
+        style=STYLE,
+        rcParams_update={},
+        plot_kwargs={},
+        threads=None,
+    ):
+        """
+        Tearsheet of a portfolio with summary tables and figures
+
+        :param analytics: Portfolio to report on
+        :type analytics: portan.Analytics
+        :param annual_rfr: Annual Risk-free Rate (RFR), defaults to 0.03
+        :type annual_rfr: float, optional
+        :param annual_mar: Annual Minimum Accepted Return (MAR), defaults to 0.03
+        :type annual_mar: float, optional
+        :param ci: Confidence interval for VaR, defaults to 0.95
+        :type ci: float, optional
+        :param plots: Names of `plot_*` methods included in the report, defaults to None (all of `PLOTS`).
+                      `plot_capm` is skipped for portfolios without a benchmark
+        :type plots: list, optional
+        :param style: `matplotlib` style to be used for plots. User can pass
+                      built-in `matplotlib` style (e.g. `classic`, `fivethirtyeight`),
+                      or a path to a custom style defined in a `.mplstyle` document,
+                      defaults to STYLE (propriatery PortAn style)
+        :type style: str, optional
+        :param rcParams_update: `matplotlib.rcParams` to modify the style defined by
+                                `style` argument, defaults to {} (no modification)
+        :type rcParams_update: dict, optional
+        :param plot_kwargs: Keyword arguments passed to individual plots, keyed
+                            on the plot name, defaults to {}
+        :type plot_kwargs: dict, optional
+        :param threads: Number of threads computing the summary tables, defaults to None (one per table)
+        :type threads: int, optional
+        """
+
+        self.plots = _checks._check_report_arguments(
+            analytics=analytics, plots=plots, available_plots=PLOTS, threads=threads
+        )
+        self.analytics = analytics
+        self.annual_rfr = annual_rfr
+        self.annual_mar = annual_mar
+        self.ci = ci
+        self.style = style
+        self.rcParams_update = rcParams_update
+        self.plot_kwargs = plot_kwargs
+        self.threads = threads
+        self.generation_time = None
+
+    def tables(self):
+        """
+        Computes the summary tables. Tables are computed in a thread pool and
+        share intermediate results (e.g. drawdowns, partial moments) through
+        the memoization of the `Analytics` object
+
+        :return: Summary tables keyed on their titles
+        :rtype: dict
+        """
+
+        analytics = self.analytics
+        arguments = {
+            "summary_return_moments": {},
+            "summary_aum": {},
+            "summary_drawdowns_ratio": {"annual_rfr": self.annual_rfr},
+            "summary_downside_risk": {"annual_mar": self.annual_mar, "ci": self.ci},
+            "summary_up_down": {},
+            "summary_frequency": {"annual_mar": self.annual_mar},
+        }
+        if analytics.benchmark_returns is None:
+            del arguments["summary_up_down"]
+
+        # Intermediates used by several tables are computed once, up front, so
+        # that the threads don't race to compute them
+        analytics._drawdowns()
+
+        with ThreadPoolExecutor(max_workers=self.threads or len(arguments)) as executor:
+            futures = {
+                TABLES[name]: executor.submit(getattr(analytics, name), **kwargs)
+                for name, kwargs in arguments.items()
+            }
+
+            return {title: future.result() for title, future in futures.items()}
+
+    def save(self, path, file_format=None):
+        """
+        Generates the report and writes it to a single self-contained file.
+        Figures are rendered with a non-interactive backend and embedded in
+        the file. Total generation time (in seconds) is stored in
+        `generation_time`
+
+        :param path: Path of the report
+        :type path: str
+        :param file_format: `"html"` or `"pdf"`, defaults to None (inferred from `path` extension)
+        :type file_format: str, optional
+        :return: Path of the report
+        :rtype: str
+        """
+
+        file_format = _checks._check_report_format(path, file_format)
+
+        start = time.perf_counter()
+        tables = self.tables()
+        with _headless(self.style, self.rcParams_update):
+            if file_format == "html":
+                self._html(path, tables)
+            else:
+                self._pdf(path, tables)
+        self.generation_time = time.perf_counter() - start
+
+        return path
+
+    def _title(self):
+        analytics = self.analytics
 
+        return (
+            analytics.name,
+            f"{str(analytics.prices.index[0])[:10]} to {str(analytics.prices.index[-1])[:10]}",
+        )
 
-def tearsheet(self, rfr=0.02, mar=0.03):
-    parameters = {"rfr": rfr, "mar": mar}
-    self.tickers
-    self.weights
-    self.plot_piechart()
+    def _html(self, path, tables):
+        title, period = self._title()
+        body = [f"<h1>{html.escape(title)}</h1>", f"<p>{html.escape(period)}</p>"]
+        for table_title, table in tables.items():
+            body.append(f"<h2>{html.escape(table_title)}</h2>")
+            body.append(table.to_frame(title).to_html(float_format="{:.6g}".format))
+        for plot, fig in _figures(self.analytics, self.plots, self.plot_kwargs):
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format="png", bbox_inches="tight")
+            image = base64.b64encode(buffer.getvalue()).decode("ascii")
+            body.append(f'<img alt="{plot[5:]}" src="data:image/png;base64,{image}">')
 
-    self.geometric_mean
-    self.annual_volatility
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(
+                "<!DOCTYPE html>\n"
+                f'<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>'
+                f"<style>{HTML_STYLE}</style></head>\n<body>\n"
+                + "\n".join(body)
+                + "\n</body></html>\n"
+            )
 
-    Modern().sharpe()
-    Modern().plot_capm()
+    def _pdf(self, path, tables):
+        title, period = self._title()
+        with backend_pdf.PdfPages(path) as pdf:
+            fig, ax = plt.subplots(figsize=(8.27, 11.69))
+            ax.axis("off")
+            lines = [title, period, ""]
+            for table_title, table in tables.items():
+                lines.append(table_title)
+                lines.extend(
+                    f"    {label}: {value:.6g}" for label, value in table.items()
+                )
+                lines.append("")
+            ax.text(0, 1, "\n".join(lines), va="top", family="monospace", fontsize=9)
+            pdf.savefig(fig)
+            plt.close(fig)
+            for plot, fig in _figures(self.analytics, self.plots, self.plot_kwargs):
+                pdf.savefig(fig, bbox_inches="tight")
 
-    PostModern().downside_capm()
-    PostModern().sortino()
-    PostModern().maximum_drawdown()
-    PostModern().jensen_alpha()
-    PostModern().treynor()
-    PostModern().kappa()
-    PostModern().calmar()
-    PostModern().sterling()
 
-    Ulcer.martin()
-    Ulcer.plot_ulcer()
+def tearsheet(analytics, path, **report_kwargs):
+    """
+    Generates a tearsheet of a portfolio and writes it to `path`.
+    Shorthand for `Report(analytics, **report_kwargs).save(path)`
 
-    ValueAtRisk().plot_analytical_var()
-    ValueAtRisk().plot_historical_var()
+    :param analytics: Portfolio to report on
+    :type analytics: portan.Analytics
+    :param path: Path of the report, ending with `.html` or `.pdf`
+    :type path: str
+    :return: Report that was generated
+    :rtype: portan.Report
+    """
 
-    Matrices().plot_correlation()
+    report = Report(analytics, **report_kwargs)
+    report.save(path)
 
-    Omega().omega_ratio()
-    Omega().plot_omega_curve()
+    return report
@@ -0,0 +1,141 @@
+"""
+`simulation.py` module contains `monte_carlo_var()` function for estimating
+Value-at-Risk (VaR) and Conditional Value-at-Risk (CVaR, also referred to as
+Expected Shortfall) of `portan.Analytics` and `portan.BatchAnalytics`
+portfolios from simulated assets returns paths
+"""
+
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from portan import _checks, _stats
+from portan.batch import BatchAnalytics
+
+METHODS = ["normal", "filtered_historical"]
+
+
+def _assets(portfolio):
+    """
+    Assets returns, weights (assets x portfolios) and portfolio names.
+    `portan.BatchAnalytics` objects created from portfolio returns are
+    simulated as portfolios of one asset each
+    """
+
+    if isinstance(portfolio, BatchAnalytics):
+        if portfolio.assets_returns is None:
+            returns = portfolio._returns
+            weights = np.eye(returns.shape[1])
+        else:
+            returns = portfolio.assets_returns.to_numpy(dtype=float)
+            weights = portfolio.weights.T
+        names = portfolio.names
+    else:
+        returns = portfolio.assets_returns.to_numpy(dtype=float)
+        weights = portfolio.weights.to_numpy(dtype=float).reshape(-1, 1)
+        names = [portfolio.name]
+    # Leading rows of assets without prices yet
+    returns = returns[np.all(np.isfinite(returns), axis=1)]
+
+    return returns, weights, names
+
+
+def _simulate(model, weights, horizons, seed, simulations, decay):
+    return _stats.simulate_returns(
+        model, weights, horizons, simulations, np.random.default_rng(seed), decay
+    )
+
+
+def monte_carlo_var(
+    portfolio,
+    ci=0.95,
+    horizon=1,
+    simulations=100000,
+    method="normal",
+    decay=0.94,
+    seed=None,
+    chunk_size=None,
+    processes=1,
+):
+    """
+    Estimates Value-at-Risk (VaR) and Conditional Value-at-Risk (CVaR) by Monte Carlo
+    simulation of assets returns paths. Paths of all assets are simulated jointly and
+    aggregated through the portfolio weights (with the same constant weights as
+    `returns`), and portfolio returns are compounded over the horizon. Simulations
+    are split into chunks of `chunk_size` paths with their own random streams, so
+    results don't depend on `processes` for a given `seed` and `chunk_size`
+
+    :param portfolio: Portfolio(s) whose returns are simulated
+    :type portfolio: portan.Analytics or portan.BatchAnalytics
+    :param ci: Confidence level(s) of VaR, defaults to 0.95
+    :type ci: float or list, optional
+    :param horizon: Horizon(s) in number of data observations (e.g. `[1, 5, 10]` days for daily data), defaults to 1
+    :type horizon: int or list, optional
+    :param simulations: Number of simulated paths, defaults to 100000
+    :type simulations: int, optional
+    :param method: `"normal"` (multivariate normal returns with the mean and covariance of
+                   `assets_returns`) or `"filtered_historical"` (historical standardized
+                   residuals of exponentially weighted volatilities, rescaled by the simulated
+                   volatilities), defaults to "normal"
+    :type method: str, optional
+    :param decay: Decay factor of the exponentially weighted variances for `"filtered_historical"`, defaults to 0.94
+    :type decay: float, optional
+    :param seed: Seed of the random number generator, defaults to None
+    :type seed: int, optional
+    :param chunk_size: Number of paths simulated at once, defaults to None (about 8 MB of assets returns per step)
+    :type chunk_size: int, optional
+    :param processes: Number of worker processes simulating the chunks, defaults to 1 (no pool)
+    :type processes: int, optional
+    :return: VaR and CVaR (as returns, negative for losses) with one row per (horizon, ci) pair
+             (and one column per portfolio for `portan.BatchAnalytics`)
+    :rtype: pd.DataFrame
+    """
+
+    ci, horizons = _checks._check_simulation_arguments(
+        ci=ci,
+        horizon=horizon,
+        simulations=simulations,
+        method=method,
+        available_methods=METHODS,
+        decay=decay,
+        chunk_size=chunk_size,
+        processes=processes,
+    )
+    returns, weights, names = _assets(portfolio)
+    if method == "normal":
+        model = ("normal", *_stats.normal_model(returns))
+    else:
+        model = ("filtered_historical", *_stats.filtered_model(returns, decay))
+
+    chunk_size = _stats.chunk_rows(max(weights.shape), chunk_size)
+    sizes = [
+        min(chunk_size, simulations - start)
+        for start in range(0, simulations, chunk_size)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    arguments = (model, weights, horizons)
+    if processes == 1 or len(sizes) == 1:
+        paths = [
+            _simulate(*arguments, seed, size, decay) for seed, size in zip(seeds, sizes)
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(_simulate, *arguments, seed, size, decay)
+                for seed, size in zip(seeds, sizes)
+            ]
+            paths = [future.result() for future in futures]
+
+    var, cvar = _stats.value_at_risk(np.concatenate(paths, axis=1), ci)
+    # (ci, horizons, portfolios) to rows ordered by horizon, then ci
+    var = var.transpose(1, 0, 2).reshape(-1, len(names))
+    cvar = cvar.transpose(1, 0, 2).reshape(-1, len(names))
+    index = pd.MultiIndex.from_product([horizons, ci], names=["horizon", "ci"])
+
+    if isinstance(portfolio, BatchAnalytics):
+        return pd.DataFrame(
+            np.hstack([var, cvar]),
+            index=index,
+            columns=pd.MultiIndex.from_product([["VaR", "CVaR"], names]),
+        )
+
+    return pd.DataFrame({"VaR": var[:, 0], "CVaR": cvar[:, 0]}, index=index)
@@ -9,13 +9,18 @@ Currently implemented utilities are:
     - `fill_nan()`
     - `fill_inf()`
     - `multi_returns()`
+    - `load_prices()`
+    - `compare_portfolios()`
 """
 
 
 import numpy as np
 import pandas as pd
 from portan.get_data import GetData
-from portan._checks import _check_array_lengths
+from portan.batch import BatchAnalytics, METRICS, CURRENT_DATE
+from portan.portfolios import TICKERS, WEIGHTS
+from portan import _io
+from portan._checks import _check_array_lengths, _check_model_portfolios
 
 
 def concatenate_portfolios(portfolio_one, portfolio_two):
@@ -123,3 +128,156 @@ def multi_returns(tickers, weights, **kwargs):
     returns = data.pct_change().drop(data.index[0])
 
     return returns
+
+
+def load_prices(path, file_format=None, attribute="Close", dtype=None):
+    """
+    Loads prices saved with `GetData.save_close()`, `GetData.save_wide()` or
+    `GetData.save_separately()`. Parquet and Feather files are read through
+    Arrow and `.npz` files directly into an array, without `.csv` parsing, and
+    the result can be passed to `Analytics(prices=...)`. Timestamps in `.csv`
+    files with mixed UTC offsets are loaded in UTC
+
+    :param path: Path of the file
+    :type path: str
+    :param file_format: `"csv"`, `"parquet"`, `"feather"` or `"npz"`, defaults to None (inferred from `path` extension)
+    :type file_format: str, optional
+    :param attribute: Attribute selected from data with multiple attributes per asset (e.g. wide format data), defaults to "Close"
+    :type attribute: str, optional
+    :param dtype: Floating point type the prices are converted to, e.g. `"float32"` for `Analytics(dtype="float32")`, defaults to None (as stored)
+    :type dtype: str or np.dtype, optional
+    :return: Prices
+    :rtype: pd.DataFrame
+    """
+
+    file_format = _io.file_format(path, file_format)
+    prices = _io.read(path, file_format)
+    if isinstance(prices.columns, pd.MultiIndex) or attribute in prices.columns:
+        prices = prices[attribute]
+    if isinstance(prices, pd.Series):
+        prices = prices.to_frame()
+    if dtype is not None:
+        prices = prices.astype(dtype, copy=False)
+
+    return prices
+
+
+def compare_portfolios(
+    tickers=TICKERS,
+    weights=WEIGHTS,
+    metrics=None,
+    rank_by="sharpe",
+    ascending=False,
+    prices=None,
+    benchmark_tickers=None,
+    benchmark_prices=None,
+    benchmark_weights=None,
+    benchmark_name="Benchmark Portfolio",
+    initial_aum=10000,
+    frequency=252,
+    start="1970-01-02",
+    end=CURRENT_DATE,
+    interval="1d",
+    cache=None,
+    download_kwargs={},
+    **kwargs,
+):
+    """
+    Compares portfolios given as dictionaries of tickers and weights, such as
+    the model portfolios in `portan.TICKERS` and `portan.WEIGHTS`. The union of
+    all tickers (and benchmark tickers) is downloaded once and aligned on one
+    calendar, and all portfolios are evaluated in a single pass as rows of one
+    weights matrix with `portan.BatchAnalytics`
+
+    :param tickers: Tickers of each portfolio, keyed on portfolio names, defaults to TICKERS
+    :type tickers: dict, optional
+    :param weights: Weights of each portfolio, keyed on portfolio names, defaults to WEIGHTS
+    :type weights: dict, optional
+    :param metrics: Names of the statistics and ratios (keys of `portan.batch.METRICS`), defaults to None (all, benchmark ones only if the benchmark is set)
+    :type metrics: list, optional
+    :param rank_by: Metric the portfolios are ranked by, defaults to "sharpe"
+    :type rank_by: str, optional
+    :param ascending: Whether lower values of `rank_by` rank higher (e.g. for `volatility`), defaults to False. Portfolios with undefined (`NaN`) `rank_by` values rank last
+    :type ascending: bool, optional
+    :param prices: Prices of (at least) all assets, used instead of downloading them, defaults to None
+    :type prices: pd.DataFrame, optional
+    :param benchmark_tickers: Benchmark assets tickers, defaults to None
+    :type benchmark_tickers: list, optional
+    :param benchmark_prices: Benchmark assets prices time-series, defaults to None
+    :type benchmark_prices: pd.DataFrame, optional
+    :param benchmark_weights: Benchmark assets weights, defaults to None
+    :type benchmark_weights: list or np.ndarray, optional
+    :param benchmark_name: Benchmark name, defaults to "Benchmark Portfolio"
+    :type benchmark_name: str, optional
+    :param initial_aum: Initial Assets Under Management (AUM) of each portfolio, defaults to 10000
+    :type initial_aum: int, optional
+    :param frequency: Data frequency, number of data observations in a year, defaults to 252
+    :type frequency: int, optional
+    :param start: Start date used for downloading assets prices data, defaults to "1970-01-02"
+    :type start: str (YYYY-MM-DD) or `datetime.datetime()` or `pd.Timestamp`, optional
+    :param end: End date used for downloading assets prices data, defaults to current date
+    :type end: str (YYYY-MM-DD) or `datetime.datetime()` or `pd.Timestamp`, optional
+    :param interval: Interval of the downloaded data, defaults to "1d"
+    :type interval: str, optional
+    :param cache: On-disk cache of downloaded prices, defaults to None
+    :type cache: portan.PriceCache or str, optional
+    :param download_kwargs: Keyword arguments for `portan.GetData` used for downloading prices, defaults to {}
+    :type download_kwargs: dict, optional
+    :param kwargs: Arguments passed to every metric that accepts them (e.g. `annual_rfr`, `annual_mar`)
+    :return: Table with one row per portfolio, ordered by `Rank`, and one column per metric
+    :rtype: pd.DataFrame
+    """
+
+    _check_model_portfolios(tickers, weights)
+    if rank_by not in METRICS:
+        raise ValueError(f"`rank_by` should be one of {list(METRICS)}")
+    names = list(tickers.keys())
+    union = list(dict.fromkeys(ticker for name in names for ticker in tickers[name]))
+
+    # Weights matrix scattered from (portfolio, asset, weight) triplets, so
+    # that repeated tickers within a portfolio are summed
+    positions = {ticker: column for column, ticker in enumerate(union)}
+    rows = np.repeat(np.arange(len(names)), [len(tickers[name]) for name in names])
+    columns = [positions[ticker] for name in names for ticker in tickers[name]]
+    matrix = np.zeros((len(names), len(union)))
+    np.add.at(
+        matrix,
+        (rows, columns),
+        [weight for name in names for weight in weights[name]],
+    )
+
+    if prices is not None:
+        missing = [ticker for ticker in union if ticker not in prices.columns]
+        if missing:
+            raise ValueError(f"`prices` don't contain prices of {missing}")
+        prices = prices[union]
+    batch = BatchAnalytics(
+        tickers=None if prices is not None else union,
+        prices=prices,
+        weights=matrix,
+        benchmark_tickers=benchmark_tickers,
+        benchmark_prices=benchmark_prices,
+        benchmark_weights=benchmark_weights,
+        names=names,
+        benchmark_name=benchmark_name,
+        initial_aum=initial_aum,
+        frequency=frequency,
+        start=start,
+        end=end,
+        interval=interval,
+        cache=cache,
+        download_kwargs=download_kwargs,
+    )
+
+    if metrics is not None and rank_by not in metrics:
+        metrics = list(metrics) + [rank_by]
+    table = batch.summary(metrics, **kwargs)
+    if METRICS[rank_by] not in table.columns:
+        raise ValueError("`rank_by` should be one of the compared metrics")
+    # Portfolios for which the metric isn't defined (`NaN`) are ranked last
+    ranks = table[METRICS[rank_by]].rank(
+        ascending=ascending, method="min", na_option="bottom"
+    )
+    table.insert(0, "Rank", ranks.astype(int))
+
+    return table.sort_values("Rank", kind="stable")
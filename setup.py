@@ -24,6 +24,7 @@ setup(
         "scikit-learn",
         "statsmodels",
     ],
+    extras_require={"parquet": ["pyarrow"]},
     keywords="portfolio finance asset-management quant trading investment",
     classifiers=[
         "Development Status :: 4 - Beta",
@@ -0,0 +1,35 @@
+import string
+import pytest
+import numpy as np
+import pandas as pd
+
+
+@pytest.fixture
+def make_prices():
+    """
+    Synthetic prices of `assets` assets over `rows` business days, following
+    geometric random walks with normal returns drawn with `seed`
+    """
+
+    def make_prices(
+        rows,
+        assets,
+        seed,
+        start="2015-01-01",
+        mean=0.0003,
+        volatility=0.01,
+        columns=None,
+    ):
+        index = pd.bdate_range(start, periods=rows, name="Date")
+        rng = np.random.default_rng(seed)
+        if columns is None:
+            columns = list(string.ascii_uppercase[:assets])
+        prices = pd.DataFrame(
+            100 * np.cumprod(1 + rng.normal(mean, volatility, (rows, assets)), axis=0),
+            index=index,
+            columns=columns,
+        )
+
+        return prices
+
+    return make_prices
@@ -0,0 +1,67 @@
+import pytest
+import numpy as np
+from portan import Analytics
+
+
+@pytest.fixture
+def prices(make_prices):
+    prices = make_prices(600, 3, 4, start="2018-01-01", mean=0.0002, volatility=0.012)
+
+    return prices
+
+
+def analytics(prices):
+    return Analytics(
+        prices=prices[["A", "B"]],
+        weights=[0.4, 0.6],
+        benchmark_prices=prices[["C"]],
+        benchmark_weights=[1],
+        fetch_info=False,
+    )
+
+
+def test_append_matches_rebuild(prices):
+    portfolio = analytics(prices.iloc[:400])
+    portfolio.maximum_drawdown()
+    portfolio.capm()
+
+    portfolio.append(prices[["A", "B"]].iloc[400:550], prices[["C"]].iloc[400:550])
+    for i in range(550, 600):
+        portfolio.append(prices[["A", "B"]].iloc[i], prices[["C"]].iloc[i])
+
+    rebuilt = analytics(prices)
+
+    for attribute in [
+        "mean",
+        "geometric_mean",
+        "volatility",
+        "skewness",
+        "kurtosis",
+        "min_aum",
+        "max_aum",
+        "mean_aum",
+        "final_aum",
+        "benchmark_mean",
+        "benchmark_geometric_mean",
+    ]:
+        assert np.abs(
+            getattr(portfolio, attribute) - getattr(rebuilt, attribute)
+        ) < 1e-10 * max(1, np.abs(getattr(rebuilt, attribute)))
+
+    assert portfolio.returns.shape == rebuilt.returns.shape
+    assert portfolio.state.index.equals(rebuilt.state.index)
+    assert np.abs(portfolio.drawdowns() - rebuilt.drawdowns()).to_numpy().max() < 1e-12
+    assert np.abs(portfolio.maximum_drawdown() - rebuilt.maximum_drawdown()) < 1e-12
+    assert np.abs(portfolio.capm()[1] - rebuilt.capm()[1]) < 1e-12
+    assert np.abs(portfolio.capm()[3] - rebuilt.capm()[3]) < 1e-12
+    assert np.abs(portfolio.tracking_error() - rebuilt.tracking_error()) < 1e-12
+    assert np.abs(portfolio.sortino() - rebuilt.sortino()) < 1e-10
+
+
+def test_append_checks(prices):
+    portfolio = analytics(prices.iloc[:400])
+
+    with pytest.raises(ValueError):
+        portfolio.append(prices[["A", "B"]].iloc[300:410], prices[["C"]].iloc[300:410])
+    with pytest.raises(ValueError):
+        portfolio.append(prices[["A", "B"]].iloc[400:410])
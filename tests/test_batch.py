@@ -0,0 +1,128 @@
+import pytest
+import numpy as np
+from portan import Analytics, BatchAnalytics
+
+
+@pytest.fixture
+def prices(make_prices):
+    prices = make_prices(500, 4, 1, volatility=0.012)
+
+    return prices
+
+
+@pytest.fixture
+def weights():
+    rng = np.random.default_rng(2)
+    weights = rng.dirichlet(np.ones(3), 50)
+
+    return weights
+
+
+@pytest.fixture
+def batch(prices, weights):
+    batch = BatchAnalytics(
+        prices=prices[["A", "B", "C"]],
+        weights=weights,
+        benchmark_prices=prices[["D"]],
+        benchmark_weights=[1],
+    )
+
+    return batch
+
+
+def test_batch_matches_analytics(batch, prices, weights):
+    summary = batch.summary(annual_rfr=0.02, annual_mar=0.01)
+
+    assert summary.shape[0] == weights.shape[0]
+    assert not summary.isna().any().any()
+
+    for i in [0, 17, 49]:
+        portfolio = Analytics(
+            prices=prices[["A", "B", "C"]],
+            weights=weights[i],
+            benchmark_prices=prices[["D"]],
+            benchmark_weights=[1],
+            fetch_info=False,
+        )
+        row = summary.iloc[i]
+
+        assert np.abs(row["Mean Return"] - portfolio.mean) < 1e-12
+        assert (
+            np.abs(row["Annualized Volatility"] - portfolio.annual_volatility) < 1e-12
+        )
+        assert np.abs(row["Skewness"] - portfolio.skewness) < 1e-10
+        assert np.abs(row["Kurtosis"] - portfolio.kurtosis) < 1e-10
+        assert np.abs(row["Final AUM"] - portfolio.final_aum) < 1e-8
+        assert np.abs(row["Sharpe Ratio"] - portfolio.sharpe(0.02)) < 1e-10
+        assert np.abs(row["Sortino Ratio"] - portfolio.sortino(0.01, 0.02)) < 1e-10
+        assert (
+            np.abs(row["Omega Ratio"] - portfolio.omega_ratio(annual_mar=0.01)) < 1e-10
+        )
+        assert np.abs(row["Maximum Drawdown"] - portfolio.maximum_drawdown()) < 1e-12
+        assert np.abs(row["Average Drawdown"] - portfolio.average_drawdown()) < 1e-12
+        assert np.abs(row["Burke Ratio"] - portfolio.burke(0.02)) < 1e-10
+        assert np.abs(row["Ulcer Index"] - portfolio.ulcer()) < 1e-10
+        assert np.abs(row["Historical VaR"] - portfolio.historical_var()) < 1e-12
+        assert np.abs(row["D Ratio"] - portfolio.d()) < 1e-10
+        assert np.abs(row["Tracking Error"] - portfolio.tracking_error()) < 1e-12
+        assert np.abs(row["Information Ratio"] - portfolio.information_ratio()) < 1e-10
+        assert np.abs(row["Down-market Capture"] - portfolio.down_capture()) < 1e-10
+        assert np.abs(row["Up-market Percentage"] - portfolio.up_percentage()) < 1e-12
+
+
+def test_batch_largest_drawdowns(batch, prices, weights):
+    portfolio = Analytics(
+        prices=prices[["A", "B", "C"]],
+        weights=weights[3],
+        fetch_info=False,
+    )
+
+    assert (
+        np.abs(batch.average_drawdown(largest=10)[3] - portfolio.average_drawdown(10))
+        < 1e-12
+    )
+    assert np.abs(batch.burke(largest=10)[3] - portfolio.burke(largest=10)) < 1e-10
+
+
+def test_from_returns(batch):
+    resampled = BatchAnalytics.from_returns(batch.returns)
+
+    assert np.all(np.abs(resampled.sharpe() - batch.sharpe()) < 1e-12)
+    assert np.all(
+        np.abs(resampled.maximum_drawdown() - batch.maximum_drawdown()) < 1e-12
+    )
+    assert "Tracking Error" not in resampled.summary().columns
+
+
+def test_weights_shape(prices):
+    with pytest.raises(ValueError):
+        BatchAnalytics(prices=prices, weights=np.ones((2, 3)) / 3)
+
+
+def test_batch_capm(batch, prices, weights):
+    portfolio = Analytics(
+        prices=prices[["A", "B", "C"]],
+        weights=weights[5],
+        benchmark_prices=prices[["D"]],
+        benchmark_weights=[1],
+        fetch_info=False,
+    )
+    alpha, beta, r_squared = batch.capm()
+    capm = portfolio.capm()
+
+    assert np.abs(alpha[5] - capm[0]) < 1e-14
+    assert np.abs(beta[5] - capm[1]) < 1e-12
+    assert np.abs(r_squared[5] - capm[3]) < 1e-12
+    assert np.abs(batch.treynor()[5] - portfolio.treynor()) < 1e-10
+    assert np.abs(batch.appraisal()[5] - portfolio.appraisal()) < 1e-10
+    assert np.abs(batch.modigliani()[5] - portfolio.modigliani()) < 1e-10
+    assert np.abs(batch.net_selectivity()[5] - portfolio.net_selectivity()) < 1e-12
+
+
+def test_capm_many_benchmarks(batch, prices):
+    benchmarks = prices.pct_change().dropna()
+    alpha, beta, r_squared = batch.capm(benchmark_returns=benchmarks)
+
+    assert beta.shape == (4, 50)
+    assert np.all(np.abs(beta.loc["D"].to_numpy() - batch.capm()[1]) < 1e-12)
+    assert np.all((r_squared.to_numpy() >= 0) & (r_squared.to_numpy() <= 1))
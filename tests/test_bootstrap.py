@@ -0,0 +1,138 @@
+import pytest
+import numpy as np
+from portan import Analytics, BatchAnalytics, bootstrap, _stats
+
+
+@pytest.fixture
+def prices(make_prices):
+    prices = make_prices(600, 3, 11, start="2016-01-01")
+
+    return prices
+
+
+@pytest.fixture
+def portfolio(prices):
+    portfolio = Analytics(
+        prices=prices[["A", "B"]],
+        weights=[0.5, 0.5],
+        benchmark_prices=prices[["C"]],
+        benchmark_weights=[1],
+        fetch_info=False,
+    )
+
+    return portfolio
+
+
+@pytest.mark.parametrize("method", ["stationary", "block", "iid"])
+def test_bootstrap_indices(method):
+    indices = _stats.bootstrap_indices(50, 200, method, 5, np.random.default_rng(0))
+
+    assert indices.shape == (200, 50)
+    assert indices.min() >= 0
+    assert indices.max() < 50
+    steps = np.diff(indices, axis=1) % 50
+    if method == "block":
+        # Blocks of 5 consecutive observations
+        assert np.all(steps[:, [0, 1, 2, 3]] == 1)
+    if method == "stationary":
+        # Expected block length of 5
+        assert 0.7 < np.mean(steps == 1) < 0.9
+
+
+def test_bootstrap(portfolio):
+    table = bootstrap(
+        portfolio,
+        metrics=["sharpe", "omega_ratio", "maximum_drawdown", "treynor"],
+        resamples=300,
+        seed=1,
+        annual_rfr=0.02,
+    )
+
+    assert table.index.tolist() == [
+        "Sharpe Ratio",
+        "Omega Ratio",
+        "Maximum Drawdown",
+        "Treynor Ratio",
+    ]
+    assert table.columns.tolist() == ["Estimate", "Standard Error", "Lower", "Upper"]
+    assert (
+        np.abs(table.loc["Sharpe Ratio", "Estimate"] - portfolio.sharpe(0.02)) < 1e-10
+    )
+    assert (
+        np.abs(table.loc["Omega Ratio", "Estimate"] - portfolio.omega_ratio()) < 1e-10
+    )
+    assert np.all(table["Standard Error"] > 0)
+    assert np.all(table["Lower"] < table["Upper"])
+    assert (
+        table.loc["Sharpe Ratio", "Lower"]
+        < table.loc["Sharpe Ratio", "Estimate"]
+        < table.loc["Sharpe Ratio", "Upper"]
+    )
+
+
+def test_bootstrap_reproducible(portfolio):
+    kwargs = {"metrics": ["sortino", "up_capture"], "resamples": 60, "seed": 3}
+    table = bootstrap(portfolio, **kwargs)
+
+    assert table.equals(bootstrap(portfolio, batch_size=7, **kwargs))
+    assert table.equals(bootstrap(portfolio, batch_size=7, processes=2, **kwargs))
+    assert not table.equals(bootstrap(portfolio, **{**kwargs, "seed": 4}))
+
+
+def test_bootstrap_iid_standard_error(portfolio):
+    # Standard error of the mean of independent resamples is about sigma / sqrt(n)
+    table = bootstrap(portfolio, metrics=["mean"], resamples=2000, method="iid", seed=2)
+    expected = portfolio.returns.std(ddof=0).iloc[0] / np.sqrt(
+        portfolio.returns.shape[0]
+    )
+
+    assert np.abs(table.loc["Mean Return", "Standard Error"] / expected - 1) < 0.1
+
+
+def test_bootstrap_batch(prices, portfolio):
+    returns = prices.pct_change().dropna()
+    batch = BatchAnalytics.from_returns(
+        returns[["A", "B"]], benchmark_returns=returns["C"]
+    )
+    table = bootstrap(batch, metrics=["sharpe", "tracking_error"], resamples=50, seed=0)
+
+    assert table.shape == (4, 4)
+    assert table.index.get_level_values(0).tolist() == ["A", "A", "B", "B"]
+    assert (
+        np.abs(
+            table.loc[("A", "Tracking Error"), "Estimate"] - batch.tracking_error()[0]
+        )
+        < 1e-10
+    )
+
+
+def test_paired_benchmarks(prices):
+    returns = prices.pct_change().dropna().to_numpy()
+    paired = BatchAnalytics.from_returns(
+        returns[:, :2], benchmark_returns=returns[:, [2, 0]]
+    )
+    for column, benchmark in [(0, 2), (1, 0)]:
+        single = BatchAnalytics.from_returns(
+            returns[:, [column]], benchmark_returns=returns[:, benchmark]
+        )
+        for metric in ["treynor", "tracking_error", "up_capture", "down_percentage"]:
+            assert (
+                np.abs(getattr(paired, metric)()[column] - getattr(single, metric)()[0])
+                < 1e-10
+            )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"method": "jackknife"},
+        {"resamples": 0},
+        {"block_size": 1000},
+        {"ci": 1.5},
+        {"processes": 0},
+        {"metrics": ["unknown"]},
+    ],
+)
+def test_bootstrap_arguments(portfolio, kwargs):
+    with pytest.raises(ValueError):
+        bootstrap(portfolio, **{"resamples": 10, **kwargs})
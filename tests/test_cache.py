@@ -0,0 +1,79 @@
+import pytest
+import numpy as np
+import pandas as pd
+from portan import GetData, PriceCache
+
+
+class LocalSource:
+    def __init__(self):
+        self.requests = list()
+
+    def history(self, ticker, start, end, interval, **kwargs):
+        self.requests.append((ticker, pd.Timestamp(start), pd.Timestamp(end)))
+        index = pd.bdate_range(
+            start, pd.Timestamp(end) - pd.Timedelta(days=1), name="Date"
+        )
+        close = 100 + (index - pd.Timestamp("2000-01-03")).days.to_numpy()
+        return pd.DataFrame({"Close": close.astype(float), "Volume": 1.0}, index=index)
+
+
+@pytest.fixture
+def source():
+    return LocalSource()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PriceCache(str(tmp_path), file_format="pickle")
+
+
+def test_cache_hit(cache, source):
+    first = GetData(
+        ["XOM", "GOOG"], "2012-01-01", "2012-02-01", cache=cache, source=source
+    )
+    second = GetData(
+        ["XOM", "GOOG"], "2012-01-01", "2012-02-01", cache=cache, source=source
+    )
+
+    assert len(source.requests) == 2
+    assert second.close.equals(first.close)
+    assert list(second.close.columns) == ["XOM", "GOOG"]
+
+
+def test_cache_top_up(cache, source):
+    GetData(["XOM"], "2012-01-01", "2012-02-01", cache=cache, source=source)
+    data = GetData(["XOM"], "2012-01-01", "2012-03-01", cache=cache, source=source)
+
+    assert source.requests[-1][1] == pd.Timestamp("2012-01-31")
+    assert data.close.index[0] == pd.Timestamp("2012-01-02")
+    assert data.close.index[-1] == pd.Timestamp("2012-02-29")
+    assert not data.close.index.duplicated().any()
+
+
+def test_cache_offline(cache, source):
+    GetData(["XOM"], "2012-01-01", "2012-02-01", cache=cache, source=source)
+    offline = PriceCache(cache.directory, file_format="pickle", offline=True)
+
+    with pytest.warns(UserWarning):
+        data = GetData(
+            ["XOM"], "2012-01-01", "2012-03-01", cache=offline, source=source
+        )
+    assert len(source.requests) == 1
+    assert data.close.index[-1] == pd.Timestamp("2012-01-31")
+    with pytest.raises(ValueError):
+        GetData(["GOOG"], "2012-01-01", "2012-02-01", cache=offline, source=source)
+
+
+def test_cache_eviction(cache, source):
+    GetData(
+        ["XOM", "GOOG", "T"], "2012-01-01", "2012-02-01", cache=cache, source=source
+    )
+    cache.invalidate(tickers=["XOM"])
+
+    assert sorted(entry["ticker"] for entry in cache.entries.values()) == [
+        "GOOG",
+        "T",
+    ]
+
+    cache.evict(max_bytes=cache.size - 1)
+    assert len(cache.entries) == 1
@@ -0,0 +1,97 @@
+import pytest
+import numpy as np
+from portan import Analytics, compare_portfolios, TICKERS, WEIGHTS
+
+
+@pytest.fixture
+def prices(make_prices):
+    tickers = list(
+        dict.fromkeys(ticker for name in TICKERS for ticker in TICKERS[name])
+    )
+    prices = make_prices(750, len(tickers), 22, mean=0.0004, columns=tickers)
+    # An asset listed later than the others
+    prices.iloc[:20, 0] = np.nan
+
+    return prices
+
+
+def test_compare_portfolios(prices):
+    table = compare_portfolios(prices=prices, metrics=["mean", "volatility"])
+    calendar = prices.dropna()
+
+    assert sorted(table.index) == sorted(TICKERS.keys())
+    assert table.columns.tolist() == [
+        "Rank",
+        "Mean Return",
+        "Volatility",
+        "Sharpe Ratio",
+    ]
+    assert table["Rank"].tolist() == list(range(1, len(TICKERS) + 1))
+    assert table["Sharpe Ratio"].is_monotonic_decreasing
+    for name in TICKERS:
+        portfolio = Analytics(
+            prices=calendar[TICKERS[name]],
+            weights=WEIGHTS[name],
+            fetch_info=False,
+        )
+        assert np.abs(table.loc[name, "Mean Return"] - portfolio.mean) < 1e-10
+        assert np.abs(table.loc[name, "Volatility"] - portfolio.volatility) < 1e-10
+        assert np.abs(table.loc[name, "Sharpe Ratio"] - portfolio.sharpe()) < 1e-10
+
+
+def test_compare_portfolios_custom(prices):
+    tickers = {"Stocks": ["ITOT"], "Mixed": ["ITOT", "SCHR", "ITOT"]}
+    weights = {"Stocks": [1.0], "Mixed": [0.3, 0.4, 0.3]}
+    table = compare_portfolios(
+        tickers,
+        weights,
+        metrics=["volatility"],
+        rank_by="volatility",
+        ascending=True,
+        prices=prices,
+    )
+    portfolio = Analytics(
+        prices=prices[["ITOT", "SCHR"]].dropna(), weights=[0.6, 0.4], fetch_info=False
+    )
+
+    assert table.index.tolist() == ["Mixed", "Stocks"]
+    assert table.columns.tolist() == ["Rank", "Volatility"]
+    # Repeated tickers are summed
+    assert np.abs(table.loc["Mixed", "Volatility"] - portfolio.volatility) < 1e-10
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"tickers": ["ITOT"], "weights": [1.0]},
+        {"tickers": {"A": ["ITOT"]}, "weights": {"B": [1.0]}},
+        {"tickers": {"A": ["ITOT", "SCHR"]}, "weights": {"A": [1.0]}},
+        {"tickers": {"A": ["ITOT"]}, "weights": {"A": ["1.0"]}},
+        {"tickers": {"A": ["XYZ"]}, "weights": {"A": [1.0]}},
+        {"rank_by": "treynor"},
+    ],
+)
+def test_compare_portfolios_arguments(prices, kwargs):
+    with pytest.raises(ValueError):
+        compare_portfolios(prices=prices, **kwargs)
+
+
+def test_compare_portfolios_undefined_metric(prices):
+    prices = prices.assign(CASH=100.0)
+    tickers = {"Cash": ["CASH"], "Stocks": ["ITOT"], "Bonds": ["SCHR"]}
+    weights = {"Cash": [1.0], "Stocks": [1.0], "Bonds": [1.0]}
+    table = compare_portfolios(
+        tickers, weights, metrics=["skewness"], rank_by="skewness", prices=prices
+    )
+
+    # Skewness of constant returns isn't defined, so the portfolio ranks last
+    assert np.isnan(table.loc["Cash", "Skewness"])
+    assert table.index[-1] == "Cash"
+    assert table["Rank"].tolist() == [1, 2, 3]
+
+
+def test_compare_portfolios_rank_by(prices, monkeypatch):
+    # `rank_by` is checked before any portfolio is evaluated
+    monkeypatch.setattr("portan.utilities.BatchAnalytics", None)
+    with pytest.raises(ValueError):
+        compare_portfolios(prices=prices, rank_by="sharpe_ratio")
@@ -0,0 +1,77 @@
+import pytest
+import numpy as np
+import pandas as pd
+from portan import Analytics
+
+
+@pytest.fixture
+def portfolio():
+    prices = pd.DataFrame(
+        [100, 110, 99, 105, 111, 100, 90, 95],
+        index=pd.bdate_range("2020-01-01", periods=8, name="Date"),
+        columns=["A"],
+    )
+    with pytest.warns(UserWarning):
+        portfolio = Analytics(prices=prices, weights=[1], fetch_info=False)
+
+    return portfolio
+
+
+def test_episodes(portfolio):
+    episodes = portfolio.drawdown_episodes()
+    dates = portfolio.prices.index
+
+    assert episodes.shape[0] == 2
+    assert episodes.loc[0, "Peak"] == dates[4]
+    assert episodes.loc[0, "Trough"] == dates[6]
+    assert pd.isna(episodes.loc[0, "Recovery"])
+    assert np.abs(episodes.loc[0, "Drawdown"] - (90 / 111 - 1)) < 1e-12
+    assert episodes.loc[0, "Duration"] == 3
+    assert episodes.loc[1, "Recovery"] == dates[4]
+    assert np.abs(episodes.loc[1, "Drawdown"] + 0.1) < 1e-12
+    assert episodes.loc[1, "Duration"] == 3
+    assert episodes.loc[1, "Recovery Time"] == 2
+
+
+def test_largest_episodes(portfolio):
+    largest = portfolio.drawdown_episodes(largest=1)
+
+    assert largest.shape[0] == 1
+    assert np.abs(portfolio.maximum_drawdown() + largest.loc[0, "Drawdown"]) < 1e-12
+
+
+def test_episode_ratios(portfolio):
+    depths = np.array([90 / 111 - 1, -0.1])
+
+    assert np.abs(portfolio.average_drawdown(episodes=True) + depths.mean()) < 1e-12
+    assert (
+        np.abs(portfolio.average_drawdown(largest=1, episodes=True) + depths[0]) < 1e-12
+    )
+    assert (
+        np.abs(
+            portfolio.burke(episodes=True)
+            - (portfolio.geometric_mean - 0.03) / np.sqrt(np.sum(depths**2))
+        )
+        < 1e-12
+    )
+
+
+def test_per_bar_drawdowns(portfolio):
+    drawdowns = portfolio.drawdowns().to_numpy()[:, 0]
+    largest = np.sort(drawdowns)[:3]
+
+    assert np.abs(portfolio.average_drawdown(largest=3) + largest.mean()) < 1e-12
+    assert np.all(
+        portfolio.sorted_drawdowns(largest=3).to_numpy()[:, 0] == largest[::-1]
+    )
+
+
+def test_burke_kwargs(portfolio):
+    assert (
+        np.abs(portfolio.burke(largest=3, kind="stable") - portfolio.burke(largest=3))
+        < 1e-12
+    )
+    with pytest.raises(TypeError):
+        portfolio.burke(sort_order="descending")
+    with pytest.raises(ValueError):
+        portfolio.burke(episodes=True, kind="stable")
@@ -0,0 +1,67 @@
+import pytest
+import numpy as np
+from portan import Analytics
+
+# Float32 prices carry a relative rounding error of at most 2**-24, so
+# portfolio returns are off by at most 2**-23 * (1 + r)
+RETURNS_BOUND = 2**-23 * 1.1
+
+
+@pytest.fixture
+def prices(make_prices):
+    prices = make_prices(3000, 5, 7, start="2005-01-01", volatility=0.015)
+
+    return prices
+
+
+def portfolios(prices, **kwargs):
+    weights = [0.3, 0.1, 0.2, 0.25, 0.15]
+    return (
+        Analytics(prices=prices, weights=weights, fetch_info=False, **kwargs),
+        Analytics(
+            prices=prices, weights=weights, fetch_info=False, dtype="float32", **kwargs
+        ),
+    )
+
+
+def test_float32_storage(prices):
+    _, portfolio = portfolios(prices)
+
+    assert portfolio.prices.dtypes.eq(np.float32).all()
+    assert portfolio.assets_returns.dtypes.eq(np.float32).all()
+    assert portfolio.state[["A", "B"]].dtypes.eq(np.float32).all()
+    assert portfolio.returns.dtypes.eq(np.float64).all()
+
+
+def test_float32_error_bounds(prices):
+    reference, portfolio = portfolios(prices)
+
+    assert (
+        np.abs(portfolio.returns - reference.returns).to_numpy().max() < RETURNS_BOUND
+    )
+    assert np.abs(portfolio.mean - reference.mean) < RETURNS_BOUND
+    assert np.abs(portfolio.volatility / reference.volatility - 1) < 1e-5
+    assert np.abs(portfolio.geometric_mean - reference.geometric_mean) < 1e-4
+    assert np.abs(portfolio.final_aum / reference.final_aum - 1) < 1e-6
+    assert np.abs(portfolio.sharpe() - reference.sharpe()) < 1e-4
+    assert np.abs(portfolio.maximum_drawdown() - reference.maximum_drawdown()) < 1e-6
+    assert (
+        np.abs(portfolio.state - reference.state).to_numpy().max()
+        < 1e-6 * reference.state.to_numpy().max()
+    )
+
+
+def test_float32_append(prices):
+    reference, portfolio = portfolios(prices.iloc[:2000])
+    portfolio.append(prices.iloc[2000:])
+    reference.append(prices.iloc[2000:])
+
+    assert portfolio.prices.dtypes.eq(np.float32).all()
+    assert (
+        np.abs(portfolio.returns - reference.returns).to_numpy().max() < RETURNS_BOUND
+    )
+
+
+def test_dtype_check(prices):
+    with pytest.raises(ValueError):
+        Analytics(prices=prices, weights=[0.2] * 5, fetch_info=False, dtype="int64")
@@ -0,0 +1,203 @@
+import time
+import threading
+import pytest
+import numpy as np
+import pandas as pd
+from portan import Analytics, GetData, PriceCache, get_info, load_prices
+
+
+class LocalSource:
+    def __init__(self, failing=(), flaky=(), delay=0.0):
+        self.failing = failing
+        self.flaky = set(flaky)
+        self.delay = delay
+        self.calls = dict()
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def history(self, ticker, start, end, interval, **kwargs):
+        with self._lock:
+            self.calls[ticker] = self.calls.get(ticker, 0) + 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if ticker in self.failing:
+            raise ConnectionError(f"{ticker} unavailable")
+        if ticker in self.flaky:
+            self.flaky.remove(ticker)
+            raise ConnectionError(f"{ticker} timed out")
+
+        index = pd.bdate_range(start, end, inclusive="left", name="Date")
+        rng = np.random.default_rng(sum(map(ord, ticker)))
+        close = 100 * np.cumprod(1 + rng.normal(0.0005, 0.01, index.shape[0]))
+        return pd.DataFrame({"Close": close, "Volume": 1.0}, index=index)
+
+    def info(self, ticker):
+        with self._lock:
+            self.calls[f"info_{ticker}"] = self.calls.get(f"info_{ticker}", 0) + 1
+        if ticker in self.failing:
+            raise ConnectionError(f"{ticker} unavailable")
+        return {"longName": f"{ticker} Inc.", "sector": "Energy"}
+
+
+def test_concurrent_download():
+    source = LocalSource(delay=0.05)
+    tickers = [f"T{i}" for i in range(16)]
+    data = GetData(tickers, "2012-01-01", "2012-02-01", source=source, workers=8)
+
+    assert list(data.close.columns) == tickers
+    assert source.max_active > 1
+    assert source.max_active <= 8
+
+
+def test_retry_and_partial_failure():
+    source = LocalSource(failing=["BAD"], flaky=["XOM"])
+
+    with pytest.warns(UserWarning):
+        data = GetData(
+            ["XOM", "BAD", "GOOG"],
+            "2012-01-01",
+            "2012-02-01",
+            source=source,
+            retries=1,
+            backoff=0.0,
+        )
+    assert list(data.close.columns) == ["XOM", "GOOG"]
+    assert list(data.failed.keys()) == ["BAD"]
+    assert source.calls["XOM"] == 2
+    assert source.calls["BAD"] == 2
+
+
+def test_analytics_download():
+    source = LocalSource()
+    portfolio = Analytics(
+        tickers=["XOM", "GOOG"],
+        weights=[0.7, 0.3],
+        benchmark_tickers=["ITOT", "IEF"],
+        benchmark_weights=[0.6, 0.4],
+        start="2012-01-01",
+        end="2012-02-01",
+        download_kwargs={"source": source},
+    )
+
+    assert sorted(source.calls.keys()) == ["GOOG", "IEF", "ITOT", "XOM"]
+    assert portfolio.prices.columns.tolist() == ["XOM", "GOOG"]
+    assert portfolio.benchmark_prices.columns.tolist() == ["ITOT", "IEF"]
+
+
+@pytest.fixture
+def prices(make_prices):
+    rows = pd.bdate_range("2012-01-01", "2012-02-01").shape[0]
+    return make_prices(
+        rows, 2, 0, start="2012-01-01", mean=0.0005, columns=["XOM", "GOOG"]
+    )
+
+
+def test_lazy_info(prices, tmp_path):
+    source = LocalSource()
+    portfolio = Analytics(
+        prices=prices,
+        weights=[0.7, 0.3],
+        cache=str(tmp_path),
+        download_kwargs={"source": source},
+    )
+
+    assert source.calls == {}
+    assert portfolio.assets_names == ["XOM Inc.", "GOOG Inc."]
+    assert portfolio.sectors().tolist() == ["Energy", "Energy"]
+    assert source.calls == {"info_XOM": 1, "info_GOOG": 1}
+
+    cached = Analytics(
+        prices=prices,
+        weights=[0.7, 0.3],
+        cache=str(tmp_path),
+        download_kwargs={"source": source},
+    )
+    assert cached.assets_names == ["XOM Inc.", "GOOG Inc."]
+    assert source.calls == {"info_XOM": 1, "info_GOOG": 1}
+
+
+def test_offline_info(tmp_path):
+    source = LocalSource()
+    get_info(["XOM"], cache=str(tmp_path), source=source)
+    cache = PriceCache(str(tmp_path), offline=True)
+
+    with pytest.warns(UserWarning):
+        info, failed = get_info(["XOM", "GOOG"], cache=cache, source=source)
+    assert info == {"XOM": {"longName": "XOM Inc.", "sector": "Energy"}}
+    assert list(failed) == ["GOOG"]
+    assert source.calls == {"info_XOM": 1}
+    with pytest.raises(ValueError):
+        get_info("XOM", source=source)
+
+
+def test_skip_info(prices):
+    source = LocalSource()
+    portfolio = Analytics(
+        prices=prices,
+        weights=[0.7, 0.3],
+        fetch_info=False,
+        download_kwargs={"source": source},
+    )
+
+    assert portfolio.assets_names == ["XOM", "GOOG"]
+    assert source.calls == {}
+
+
+@pytest.mark.parametrize("file_format", ["csv", "parquet", "feather", "npz"])
+def test_export_formats(file_format, tmp_path):
+    data = GetData(
+        ["XOM", "GOOG", "T"], "2012-01-01", "2013-01-01", source=LocalSource()
+    )
+
+    path = tmp_path / f"close.{file_format}"
+    data.save_close(path)
+    prices = load_prices(path)
+    assert prices.index.equals(data.close.index)
+    assert np.abs(prices.to_numpy() - data.close.to_numpy()).max() < 1e-12
+
+    data.save_wide(tmp_path / "wide", file_format=file_format, chunk_size=50)
+    wide = load_prices(tmp_path / "wide", file_format=file_format)
+    assert wide.shape == data.close.shape
+    assert wide.columns.tolist() == data.close.columns.tolist()
+    assert wide.index.equals(data.close.index)
+    assert np.abs(wide.to_numpy() - data.close.to_numpy()).max() < 1e-12
+
+    data.save_separately(tmp_path / "separately", file_format=file_format)
+    xom = load_prices(tmp_path / "separately" / f"XOM_data.{file_format}")
+    assert np.abs(xom.to_numpy()[:, 0] - data.close["XOM"].to_numpy()).max() < 1e-12
+
+    portfolio = Analytics(prices=prices, weights=[0.5, 0.3, 0.2], fetch_info=False)
+    assert portfolio.prices.shape == prices.shape
+
+
+def test_csv_timezone(tmp_path):
+    class TimezoneSource(LocalSource):
+        def history(self, ticker, start, end, interval, **kwargs):
+            data = super().history(ticker, start, end, interval, **kwargs)
+            data.index = data.index.tz_localize("America/New_York")
+            return data
+
+    # Spans the start of daylight saving time, so UTC offsets are mixed
+    data = GetData(["XOM", "GOOG"], "2012-02-01", "2012-04-15", source=TimezoneSource())
+    data.save_close(tmp_path / "close.csv")
+    data.save_wide(tmp_path / "wide.csv")
+
+    for path in [tmp_path / "close.csv", tmp_path / "wide.csv"]:
+        prices = load_prices(path)
+        assert isinstance(prices.index, pd.DatetimeIndex)
+        assert prices.index.equals(data.close.index.tz_convert("UTC"))
+        assert prices.columns.tolist() == ["XOM", "GOOG"]
+        assert np.abs(prices.to_numpy() - data.close.to_numpy()).max() < 1e-12
+
+
+def test_export_checks(tmp_path):
+    data = GetData(["XOM", "GOOG"], "2012-01-01", "2012-02-01", source=LocalSource())
+
+    with pytest.raises(ValueError):
+        data.save_close(tmp_path / "close.xlsx")
+    with pytest.raises(ValueError):
+        data.save_long(tmp_path / "long.npz")
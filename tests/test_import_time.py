@@ -0,0 +1,51 @@
+import sys
+import subprocess
+
+
+HEAVY_MODULES = [
+    "matplotlib",
+    "seaborn",
+    "scipy",
+    "sklearn",
+    "statsmodels",
+    "yfinance",
+]
+
+# Cold-start budget for `import portan` on top of `numpy` and `pandas`, in seconds
+IMPORT_BUDGET = 0.5
+
+
+def run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+
+def test_heavy_modules_not_imported():
+    loaded = run(
+        "import sys, portan; "
+        f"print([m for m in {HEAVY_MODULES} if m in sys.modules])"
+    )
+
+    assert loaded.strip() == "[]"
+
+
+def test_import_time():
+    elapsed = run(
+        "import time, numpy, pandas; "
+        "start = time.perf_counter(); "
+        "import portan; "
+        "print(time.perf_counter() - start)"
+    )
+
+    assert float(elapsed) < IMPORT_BUDGET
+
+
+def test_lazy_module_loads_on_use():
+    loaded = run(
+        "import sys, portan.analytics as analytics; "
+        "analytics.stats.norm.ppf(0.05); "
+        "print('scipy.stats' in sys.modules)"
+    )
+
+    assert loaded.strip() == "True"
@@ -0,0 +1,112 @@
+import pytest
+import numpy as np
+import pyarrow as pa
+from portan import Analytics
+
+
+@pytest.fixture
+def prices(make_prices):
+    prices = make_prices(2000, 4, 6, start="2010-01-01")
+
+    return prices
+
+
+def assert_same(portfolio, reference):
+    for attribute in [
+        "mean",
+        "geometric_mean",
+        "volatility",
+        "skewness",
+        "kurtosis",
+        "min_aum",
+        "max_aum",
+        "mean_aum",
+        "final_aum",
+    ]:
+        assert np.abs(
+            getattr(portfolio, attribute) - getattr(reference, attribute)
+        ) < 1e-10 * max(1, np.abs(getattr(reference, attribute)))
+    assert portfolio.returns.index.equals(reference.returns.index)
+    assert np.abs(portfolio.maximum_drawdown() - reference.maximum_drawdown()) < 1e-12
+    assert np.abs(portfolio.ulcer() - reference.ulcer()) < 1e-10
+
+
+def test_memmap(prices, tmp_path):
+    weights = [0.1, 0.2, 0.3, 0.4]
+    array = np.lib.format.open_memmap(
+        tmp_path / "prices.npy", mode="w+", shape=prices.shape
+    )
+    array[:] = prices.to_numpy()
+    array.flush()
+    array = np.load(tmp_path / "prices.npy", mmap_mode="r")
+
+    reference = Analytics(prices=prices, weights=weights, fetch_info=False)
+    portfolio = Analytics(
+        prices=array,
+        index=prices.index,
+        weights=weights,
+        fetch_info=False,
+        chunk_size=128,
+    )
+
+    assert_same(portfolio, reference)
+    assert np.shares_memory(portfolio.prices.to_numpy(), array)
+    assert portfolio._state is None
+    assert np.abs(portfolio.state.to_numpy() - reference.state.to_numpy()).max() < 1e-9
+    assert (
+        np.abs(
+            portfolio.assets_returns.to_numpy() - reference.assets_returns.to_numpy()
+        )
+        < 1e-15
+    ).all()
+
+
+def test_arrow(prices):
+    weights = [0.25, 0.25, 0.25, 0.25]
+    table = pa.table({str(column): prices[column].to_numpy() for column in prices})
+
+    reference = Analytics(prices=prices, weights=weights, fetch_info=False)
+    portfolio = Analytics(
+        prices=table, index=prices.index, weights=weights, fetch_info=False
+    )
+
+    assert_same(portfolio, reference)
+
+
+def test_chunked_nan_handling(prices):
+    weights = [0.1, 0.2, 0.3, 0.4]
+    prices = prices.copy()
+    prices.iloc[:5, 0] = np.nan
+    prices.iloc[700, 1] = np.nan
+
+    with pytest.warns(UserWarning):
+        reference = Analytics(prices=prices, weights=weights, fetch_info=False)
+    with pytest.warns(UserWarning):
+        portfolio = Analytics(
+            prices=prices, weights=weights, fetch_info=False, chunk_size=64
+        )
+    assert_same(portfolio, reference)
+
+    prices.iloc[-1, 2] = np.nan
+    with pytest.raises(ValueError):
+        Analytics(prices=prices, weights=weights, fetch_info=False, chunk_size=64)
+    prices.iloc[-1, 2] = np.inf
+    with pytest.raises(ValueError):
+        Analytics(prices=prices, weights=weights, fetch_info=False, chunk_size=64)
+
+
+def test_index_checks(prices):
+    with pytest.raises(ValueError):
+        Analytics(
+            prices=prices.to_numpy(),
+            index=prices.index[1:],
+            weights=[0.25, 0.25, 0.25, 0.25],
+            fetch_info=False,
+        )
+    with pytest.raises(ValueError):
+        Analytics(
+            prices=prices,
+            index=prices.index,
+            weights=[0.25, 0.25, 0.25, 0.25],
+            fetch_info=False,
+        )
@@ -0,0 +1,57 @@
+import pytest
+import numpy as np
+from portan import Analytics
+
+
+@pytest.fixture
+def prices(make_prices):
+    prices = make_prices(500, 4, 0, mean=0.0004)
+
+    return prices
+
+
+@pytest.fixture
+def portfolio(prices):
+    portfolio = Analytics(
+        prices=prices[["A", "B"]],
+        weights=[0.7, 0.3],
+        benchmark_prices=prices[["C"]],
+        benchmark_weights=[1],
+        fetch_info=False,
+    )
+
+    return portfolio
+
+
+def test_memoized_partial_moments(portfolio):
+    downside_risk = portfolio.downside_risk()
+    sortino = portfolio.sortino()
+    keys = [key for key in portfolio._memo.keys() if key[0] == "lpm"]
+
+    assert len(keys) == 1
+    assert np.abs(sortino - (portfolio.geometric_mean - 0.03) / downside_risk) < 1e-12
+    assert portfolio.lpm(0.03, 2) == portfolio.lpm(annual_mar=0.03, moment=2)
+
+
+def test_memoized_drawdowns(portfolio):
+    drawdowns = portfolio.drawdowns()
+    drawdowns.iloc[:] = 0
+
+    assert portfolio.maximum_drawdown() > 0
+    assert portfolio.drawdowns().min()[0] < 0
+
+
+def test_memo_invalidation(portfolio, prices):
+    beta = portfolio.capm()[1]
+    treynor = portfolio.treynor()
+    assert np.abs(treynor - (portfolio.geometric_mean - 0.03) / beta) < 1e-12
+
+    benchmark = {
+        "benchmark_prices": prices[["D"]],
+        "benchmark_weights": [1],
+    }
+    with pytest.warns(UserWarning):
+        new_beta = portfolio.capm(benchmark=benchmark)[1]
+
+    assert new_beta != beta
+    assert portfolio.capm()[1] == new_beta
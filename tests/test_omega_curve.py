@@ -0,0 +1,68 @@
+import warnings
+import pytest
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from portan import Analytics, BatchAnalytics
+
+
+@pytest.fixture
+def portfolio(make_prices):
+    prices = make_prices(800, 2, 5, start="2016-01-01")
+    portfolio = Analytics(prices=prices, weights=[0.5, 0.5], fetch_info=False)
+
+    return portfolio
+
+
+def test_omega_curve(portfolio):
+    rng = np.random.default_rng(6)
+    returns = pd.DataFrame(rng.normal(0.0004, 0.01, (800, 3)), columns=["x", "y", "z"])
+    grid = np.linspace(-0.2, 0.3, 41)
+    curve = portfolio.omega_curve(returns, annual_mar=grid)
+
+    assert curve.shape == (41, 3)
+    for mar in [0, 12, 40]:
+        for column in returns.columns:
+            assert (
+                np.abs(
+                    curve.loc[grid[mar], column]
+                    - portfolio.omega_ratio(returns[column], grid[mar])
+                )
+                < 1e-10
+            )
+
+
+def test_omega_curve_default(portfolio):
+    curve = portfolio.omega_curve()
+
+    assert curve.shape == (10, 1)
+    assert (
+        np.abs(curve.iloc[3, 0] - portfolio.omega_ratio(annual_mar=curve.index[3]))
+        < 1e-10
+    )
+    assert np.all(np.diff(curve.iloc[:, 0]) < 0)
+
+
+def test_batch_omega_curve(portfolio):
+    batch = BatchAnalytics(prices=portfolio.prices, weights=[[0.5, 0.5], [0.9, 0.1]])
+    curve = batch.omega_curve(annual_mar=[0.0, 0.05])
+
+    assert np.abs(curve.iloc[1, 0] - portfolio.omega_ratio(annual_mar=0.05)) < 1e-10
+
+
+def test_omega_curve_warnings(portfolio):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        curve = portfolio.omega_curve(annual_mar=0.03)
+
+    assert curve.shape == (1, 1)
+    assert np.abs(curve.iloc[0, 0] - portfolio.omega_ratio(annual_mar=0.03)) < 1e-10
+    with pytest.warns(UserWarning):
+        fig = portfolio.plot_omega_curve(show=False)
+    plt.close(fig)
+
+
+@pytest.mark.parametrize("annual_mar", [[], [[0.01, 0.02]], [0.01, np.nan], "0.03"])
+def test_omega_curve_arguments(portfolio, annual_mar):
+    with pytest.raises(ValueError):
+        portfolio.omega_curve(annual_mar=annual_mar)
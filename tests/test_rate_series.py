@@ -0,0 +1,195 @@
+import pytest
+import numpy as np
+import pandas as pd
+from portan import Analytics, BatchAnalytics, _stats
+
+
+@pytest.fixture
+def prices(make_prices):
+    prices = make_prices(600, 3, 25, mean=0.0004)
+
+    return prices
+
+
+@pytest.fixture
+def portfolio(prices):
+    portfolio = Analytics(
+        prices=prices[["A", "B"]],
+        weights=[0.6, 0.4],
+        benchmark_prices=prices[["C"]],
+        benchmark_weights=[1],
+        fetch_info=False,
+    )
+
+    return portfolio
+
+
+@pytest.fixture
+def rates():
+    # Monthly rates rising from 0% to 5%, starting before the first observation
+    rates = pd.Series(
+        np.linspace(0, 0.05, 30),
+        index=pd.date_range("2014-12-01", periods=30, freq="MS"),
+    )
+
+    return rates
+
+
+def per_period(rates, index):
+    return (1 + rates.reindex(index, method="ffill").to_numpy()) ** (1 / 252) - 1
+
+
+@pytest.mark.parametrize(
+    "method, kwargs",
+    [
+        ("sharpe", {"annual_rfr": 0.03}),
+        ("sharpe", {"annual_rfr": 0.03, "annual": False}),
+        ("sortino", {"annual_rfr": 0.03, "annual_mar": 0.03}),
+        ("treynor", {"annual_rfr": 0.03}),
+        ("jensen_alpha", {"annual_rfr": 0.03, "annual": False}),
+        ("kappa", {"annual_mar": 0.03}),
+        ("omega_ratio", {"annual_mar": 0.03}),
+        ("lpm", {"annual_mar": 0.03}),
+        ("hpm", {"annual_mar": 0.03}),
+        ("calmar", {"annual_rfr": 0.03}),
+        ("modigliani", {"annual_rfr": 0.03}),
+        ("kelly_criterion", {"annual_rfr": 0.03}),
+    ],
+)
+def test_constant_rate_series(prices, portfolio, method, kwargs):
+    constant = pd.Series(0.03, index=prices.index)
+    series_kwargs = {
+        key: constant if key in ["annual_rfr", "annual_mar"] else value
+        for key, value in kwargs.items()
+    }
+
+    scalar = getattr(portfolio, method)(**kwargs)
+    series = getattr(portfolio, method)(**series_kwargs)
+
+    assert np.abs(series - scalar) < 1e-10 * max(1, np.abs(scalar))
+
+
+def test_rate_series(portfolio, rates):
+    rfr = per_period(rates, portfolio.returns.index)
+    returns = portfolio.returns.iloc[:, 0].to_numpy()
+    benchmark_returns = portfolio.benchmark_returns.iloc[:, 0].to_numpy()
+
+    assert (
+        np.abs(
+            portfolio.sharpe(annual_rfr=rates, annual=False)
+            - (returns - rfr).mean() / returns.std(ddof=1)
+        )
+        < 1e-12
+    )
+    assert (
+        np.abs(
+            portfolio.lpm(annual_mar=rates, moment=2)
+            - np.mean(np.maximum(rfr - returns, 0) ** 2)
+        )
+        < 1e-12
+    )
+    assert (
+        np.abs(portfolio.upside_frequency(annual_mar=rates) - np.mean(returns > rfr))
+        < 1e-12
+    )
+    beta, alpha = np.polyfit(benchmark_returns - rfr, returns - rfr, 1)
+    capm = portfolio.capm(annual_rfr=rates)
+    assert np.abs(capm[0] - alpha) < 1e-12
+    assert np.abs(capm[1] - beta) < 1e-10
+
+
+def test_rolling_rate_series(portfolio, rates):
+    rfr = per_period(rates, portfolio.returns.index)
+    returns = portfolio.returns.iloc[:, 0].to_numpy()
+    rolling = portfolio.rolling_sharpe(window=100, annual_rfr=rates, annual=False)
+    excess = returns[-100:] - rfr[-100:]
+
+    assert (
+        np.abs(rolling.iloc[-1, 0] - excess.mean() / returns[-100:].std(ddof=1)) < 1e-10
+    )
+
+
+def test_batch_rate_series(prices, portfolio, rates):
+    batch = BatchAnalytics(
+        prices=prices[["A", "B"]],
+        weights=np.array([[0.6, 0.4], [0.2, 0.8]]),
+        benchmark_prices=prices[["C"]],
+        benchmark_weights=[1],
+    )
+
+    for annual in [True, False]:
+        assert (
+            np.abs(
+                batch.sharpe(annual_rfr=rates, annual=annual)[0]
+                - portfolio.sharpe(annual_rfr=rates, annual=annual)
+            )
+            < 1e-12
+        )
+    assert np.abs(batch.capm(annual_rfr=rates)[1][0] - portfolio.capm(rates)[1]) < 1e-12
+    assert (
+        np.abs(
+            batch.omega_ratio(annual_mar=rates)[0] - portfolio.omega_ratio(None, rates)
+        )
+        < 1e-12
+    )
+
+
+def test_rate_series_cache(portfolio, rates):
+    converted = portfolio._rate_conversion(rates)
+
+    assert portfolio._rate_conversion(rates) is converted
+    assert portfolio._rate_conversion(rates.copy()) is converted
+    assert converted.shape == (portfolio.returns.shape[0], 1)
+
+    # Series modified in place are converted again
+    sharpe = portfolio.sharpe(annual_rfr=rates)
+    rates.iloc[10:] += 0.01
+    assert portfolio._rate_conversion(rates) is not converted
+    assert portfolio.sharpe(annual_rfr=rates) < sharpe
+
+    for shift in range(20):
+        portfolio._rate_conversion(rates + shift / 100)
+    assert len(portfolio._rates) <= _stats.RATES_CACHE_SIZE
+
+
+@pytest.mark.parametrize(
+    "rates",
+    [
+        pd.Series([0.01, 0.02], index=pd.to_datetime(["2016-01-01", "2017-01-01"])),
+        pd.Series([0.02, 0.01], index=pd.to_datetime(["2015-01-01", "2014-01-01"])),
+        pd.Series(
+            [0.01, 0.02],
+            index=pd.to_datetime(["2014-01-01", "2014-01-01"]).tz_localize("UTC"),
+        ),
+        pd.Series([0.01, -1.5], index=pd.to_datetime(["2014-01-01", "2016-01-01"])),
+    ],
+)
+def test_rate_series_arguments(portfolio, rates):
+    with pytest.raises(ValueError):
+        portfolio.sharpe(annual_rfr=rates)
+
+
+def test_omega_ratio_array_returns(portfolio, rates):
+    returns = np.random.default_rng(7).normal(0.0005, 0.01, 300)
+    mar = (1 + 0.03) ** (1 / 252) - 1
+    omega = np.sum(np.maximum(returns - mar, 0)) / np.sum(np.maximum(mar - returns, 0))
+
+    assert np.abs(portfolio.omega_ratio(returns, annual_mar=0.03) - omega) < 1e-12
+
+    # Arrays are aligned to the observations of the portfolio for rate series
+    series = portfolio.returns.iloc[:, 0]
+    assert (
+        np.abs(
+            portfolio.omega_ratio(series.to_numpy(), rates)
+            - portfolio.omega_ratio(series, rates)
+        )
+        < 1e-12
+    )
+    assert (
+        np.abs(
+            portfolio.omega_ratio(series, rates) - portfolio.omega_ratio(None, rates)
+        )
+        < 1e-12
+    )
+    with pytest.raises(ValueError):
+        portfolio.omega_ratio(returns, rates)
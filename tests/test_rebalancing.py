@@ -0,0 +1,129 @@
+import pytest
+import numpy as np
+from portan import Analytics, rebalance
+
+
+@pytest.fixture
+def prices(make_prices):
+    prices = make_prices(800, 3, 23, mean=0.0004, volatility=0.012)
+
+    return prices
+
+
+def loop_aum(prices, weights, rebalancing=None, threshold=None):
+    # Reference simulation, one observation at a time
+    values = prices.to_numpy()
+    weights = np.array(weights)
+    periods = prices.index.to_period("M")
+    holdings = 10000 * weights / values[0]
+    aum = []
+    for t in range(values.shape[0]):
+        scheduled = t > 0 and (
+            rebalancing is None
+            or (rebalancing == "monthly" and periods[t] != periods[t - 1])
+            or (isinstance(rebalancing, int) and t % rebalancing == 0)
+        )
+        drifted = holdings * values[t] / (holdings @ values[t])
+        if scheduled and (
+            threshold is None or np.abs(drifted - weights).max() > threshold
+        ):
+            holdings = weights * (holdings @ values[t]) / values[t]
+        aum.append(holdings @ values[t])
+
+    return np.array(aum)
+
+
+@pytest.mark.parametrize(
+    "rebalancing, threshold",
+    [("monthly", None), (21, None), (None, 0.03), ("monthly", 0.02)],
+)
+def test_rebalancing(prices, rebalancing, threshold):
+    weights = [0.5, 0.3, 0.2]
+    portfolio = Analytics(
+        prices=prices,
+        weights=weights,
+        fetch_info=False,
+        rebalancing=rebalancing,
+        threshold=threshold,
+    )
+    aum = loop_aum(prices, weights, rebalancing, threshold)
+
+    assert np.all(np.abs(portfolio.state[portfolio.name] - aum) < 1e-8)
+    assert np.all(np.abs(portfolio.state[portfolio.tickers].sum(axis=1) - aum) < 1e-8)
+    assert np.all(
+        np.abs(portfolio.returns.iloc[:, 0].to_numpy() - (aum[1:] / aum[:-1] - 1))
+        < 1e-12
+    )
+    assert np.abs(portfolio.final_aum - aum[-1]) < 1e-8
+    # Weights are back on target after each rebalance
+    weights_after = portfolio.state.loc[portfolio.turnover.index, portfolio.tickers]
+    assert np.all(
+        np.abs(
+            weights_after.div(
+                portfolio.state.loc[portfolio.turnover.index].iloc[:, -1], axis=0
+            )
+            - weights
+        )
+        < 1e-12
+    )
+    if threshold is not None:
+        assert np.all(portfolio.turnover > 0)
+
+
+def test_rebalancing_every_observation(prices):
+    portfolio = Analytics(prices=prices, weights=[0.5, 0.3, 0.2], fetch_info=False)
+    rebalanced = Analytics(
+        prices=prices, weights=[0.5, 0.3, 0.2], fetch_info=False, rebalancing=1
+    )
+
+    assert np.all(np.abs(rebalanced.returns - portfolio.returns) < 1e-12)
+    assert rebalanced.turnover.shape[0] == prices.shape[0] - 1
+    assert portfolio.turnover is None
+
+
+def test_rebalancing_append(prices):
+    kwargs = {"weights": [0.5, 0.3, 0.2], "fetch_info": False}
+    kwargs.update({"rebalancing": "monthly", "threshold": 0.01})
+    portfolio = Analytics(prices=prices.iloc[:500], **kwargs)
+    portfolio.state
+    portfolio.append(prices.iloc[500:650])
+    portfolio.append(prices.iloc[650:])
+    full = Analytics(prices=prices, **kwargs)
+
+    assert np.all(np.abs(portfolio.returns - full.returns) < 1e-12)
+    assert np.all(np.abs(portfolio.state - full.state) < 1e-8)
+    assert portfolio.turnover.index.equals(full.turnover.index)
+
+
+def test_rebalance(prices):
+    state, turnover = rebalance(prices, [0.5, 0.3, 0.2], "monthly")
+    portfolio = Analytics(
+        prices=prices, weights=[0.5, 0.3, 0.2], fetch_info=False, rebalancing="monthly"
+    )
+
+    assert np.all(np.abs(state.to_numpy() - portfolio.state.to_numpy()) < 1e-8)
+    assert np.all(np.abs(turnover - portfolio.turnover) < 1e-12)
+    # First observation of every month after the initial allocation
+    months = prices.index.to_period("M")
+    assert turnover.index.equals(prices.index[1:][months[1:] != months[:-1]])
+
+
+def test_rebalancing_calendar_index(prices):
+    with pytest.raises(ValueError):
+        rebalance(prices.reset_index(drop=True), [0.5, 0.3, 0.2], "monthly")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"rebalancing": "daily"},
+        {"rebalancing": 0},
+        {"rebalancing": True},
+        {"threshold": 1.5},
+        {"threshold": 0.05, "weights": [0.5, 0.3, 0.1]},
+    ],
+)
+def test_rebalancing_arguments(prices, kwargs):
+    kwargs = {"weights": [0.5, 0.3, 0.2], **kwargs}
+    with pytest.raises(ValueError):
+        Analytics(prices=prices, fetch_info=False, **kwargs)
@@ -0,0 +1,77 @@
+import os
+import pytest
+import matplotlib.pyplot as plt
+from portan import Analytics, render_figures
+
+
+@pytest.fixture
+def portfolios(make_prices):
+    prices = make_prices(300, 3, 0, start="2018-01-01")
+    portfolios = [
+        Analytics(
+            prices=prices[["A", "B"]],
+            weights=weights,
+            name=f"Portfolio {i}",
+            fetch_info=False,
+        )
+        for i, weights in enumerate([[0.5, 0.5], [0.2, 0.8], [0.9, 0.1]])
+    ]
+
+    return portfolios
+
+
+def test_render_figures(portfolios, tmp_path):
+    backend = plt.get_backend()
+    paths = render_figures(
+        portfolios,
+        plots=["plot_aum", "plot_drawdowns", "plot_capm"],
+        directory=tmp_path,
+        file_format="svg",
+    )
+
+    assert len(paths) == 6
+    assert os.path.basename(paths[0]) == "Portfolio 0_aum.svg"
+    assert all(os.path.isfile(path) for path in paths)
+    assert plt.get_fignums() == []
+    assert plt.get_backend() == backend
+
+
+def test_render_figures_processes(portfolios, tmp_path):
+    paths = render_figures(
+        portfolios, plots=["plot_aum"], directory=tmp_path, processes=2
+    )
+
+    assert [os.path.basename(path) for path in paths] == [
+        "Portfolio 0_aum.png",
+        "Portfolio 1_aum.png",
+        "Portfolio 2_aum.png",
+    ]
+    assert all(os.path.isfile(path) for path in paths)
+
+
+def test_render_figures_processes_cache(portfolios, tmp_path):
+    cached = [
+        Analytics(
+            prices=portfolio.prices,
+            weights=portfolio.weights,
+            name=portfolio.name,
+            fetch_info=False,
+            cache=str(tmp_path / "cache"),
+        )
+        for portfolio in portfolios[:2]
+    ]
+    paths = render_figures(
+        cached, plots=["plot_aum"], directory=tmp_path / "figures", processes=2
+    )
+
+    assert len(paths) == 2
+    assert all(os.path.isfile(path) for path in paths)
+
+
+def test_render_checks(portfolios, tmp_path):
+    with pytest.raises(ValueError):
+        render_figures(portfolios, plots=["plot_nothing"], directory=tmp_path)
+    with pytest.raises(ValueError):
+        render_figures([portfolios[0], portfolios[0]], directory=tmp_path)
+    with pytest.raises(ValueError):
+        render_figures(portfolios, directory=tmp_path, processes=0)
@@ -0,0 +1,66 @@
+import os
+import pytest
+import numpy as np
+from portan import Analytics, Report, tearsheet
+
+
+@pytest.fixture
+def portfolio(make_prices):
+    prices = make_prices(400, 3, 5, start="2018-01-01")
+    portfolio = Analytics(
+        prices=prices[["A", "B"]],
+        weights=[0.5, 0.5],
+        benchmark_prices=prices[["C"]],
+        benchmark_weights=[1],
+        fetch_info=False,
+    )
+
+    return portfolio
+
+
+def test_tables(portfolio):
+    tables = Report(portfolio, annual_rfr=0.02).tables()
+
+    assert len(tables) == 6
+    assert np.abs(tables["Return Moments"]["Mean Return"] - portfolio.mean) < 1e-15
+    assert (
+        np.abs(
+            tables["Drawdowns Ratios"]["Calmar ratio"]
+            - portfolio.calmar(annual_rfr=0.02)
+        )
+        < 1e-12
+    )
+    assert (
+        np.abs(
+            tables["Up-market and Down-market"]["Up-market Capture"]
+            - portfolio.up_capture()
+        )
+        < 1e-12
+    )
+
+
+def test_html(portfolio, tmp_path):
+    path = os.path.join(tmp_path, "report.html")
+    report = tearsheet(portfolio, path, plots=["plot_aum", "plot_capm"])
+
+    with open(path, encoding="utf-8") as file:
+        content = file.read()
+
+    assert report.generation_time > 0
+    assert content.count("data:image/png;base64,") == 2
+    assert "Maximum Drawdown" in content
+
+
+def test_pdf(portfolio, tmp_path):
+    path = os.path.join(tmp_path, "report.pdf")
+    Report(portfolio, plots=["plot_drawdowns"]).save(path)
+
+    with open(path, "rb") as file:
+        assert file.read(4) == b"%PDF"
+
+
+def test_report_checks(portfolio, tmp_path):
+    with pytest.raises(ValueError):
+        Report(portfolio, plots=["plot_nothing"])
+    with pytest.raises(ValueError):
+        Report(portfolio).save(os.path.join(tmp_path, "report.docx"))
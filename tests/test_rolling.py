@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+from portan import Analytics
+
+
+@pytest.fixture
+def portfolio(make_prices):
+    prices = make_prices(1500, 3, 3, start="2010-01-01", volatility=0.011)
+    portfolio = Analytics(
+        prices=prices[["A", "B"]],
+        weights=[0.5, 0.5],
+        benchmark_prices=prices[["C"]],
+        benchmark_weights=[1],
+        fetch_info=False,
+    )
+
+    return portfolio
+
+
+def test_rolling_moments(portfolio):
+    returns = portfolio.returns[portfolio.name]
+    volatility = portfolio.rolling_volatility(window=100, annual=False)
+    mean = portfolio.rolling_mean(window=100, annual=False)
+
+    assert volatility.shape == portfolio.returns.shape
+    assert volatility.iloc[:99].isna().all()[0]
+    assert (
+        np.nanmax(np.abs(volatility[portfolio.name] - returns.rolling(100).std()))
+        < 1e-12
+    )
+    assert np.nanmax(np.abs(mean[portfolio.name] - returns.rolling(100).mean())) < 1e-12
+
+
+def test_rolling_matches_window(portfolio):
+    window = 252
+    end = 1000
+    sharpe = portfolio.rolling_sharpe(window=window).iloc[end - 1, 0]
+    sortino = portfolio.rolling_sortino(window=window).iloc[end - 1, 0]
+    beta = portfolio.rolling_beta(window=window).iloc[end - 1, 0]
+    alpha = portfolio.rolling_alpha(window=window).iloc[end - 1, 0]
+    information_ratio = portfolio.rolling_information_ratio(window=window).iloc[
+        end - 1, 0
+    ]
+
+    prices = portfolio.prices.iloc[end - window : end + 1]
+    benchmark_prices = portfolio.benchmark_prices.iloc[end - window : end + 1]
+    sliced = Analytics(
+        prices=prices,
+        weights=[0.5, 0.5],
+        benchmark_prices=benchmark_prices,
+        benchmark_weights=[1],
+        fetch_info=False,
+    )
+
+    assert np.abs(sharpe - sliced.sharpe()) < 1e-10
+    assert np.abs(sortino - sliced.sortino()) < 1e-10
+    assert np.abs(beta - sliced.capm()[1]) < 1e-10
+    assert np.abs(alpha - sliced.capm()[0]) < 1e-12
+    assert np.abs(information_ratio - sliced.information_ratio()) < 1e-10
+
+
+def test_window_check(portfolio):
+    with pytest.raises(ValueError):
+        portfolio.rolling_sharpe(window=5000)
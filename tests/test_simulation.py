@@ -0,0 +1,107 @@
+import pytest
+import numpy as np
+import pandas as pd
+from scipy import stats
+from portan import Analytics, BatchAnalytics, monte_carlo_var, _stats
+
+
+@pytest.fixture
+def prices():
+    index = pd.bdate_range("2016-01-01", periods=1000, name="Date")
+    rng = np.random.default_rng(12)
+    covariance = [[1e-4, 5e-5, 0], [5e-5, 1e-4, 0], [0, 0, 4e-4]]
+    prices = pd.DataFrame(
+        100
+        * np.cumprod(
+            1 + rng.multivariate_normal([0.0003] * 3, covariance, 1000), axis=0
+        ),
+        index=index,
+        columns=["A", "B", "C"],
+    )
+
+    return prices
+
+
+@pytest.fixture
+def portfolio(prices):
+    portfolio = Analytics(prices=prices, weights=[0.5, 0.3, 0.2], fetch_info=False)
+
+    return portfolio
+
+
+def test_monte_carlo_var(portfolio):
+    table = monte_carlo_var(
+        portfolio, ci=[0.95, 0.99], horizon=[1, 10], simulations=200000, seed=0
+    )
+
+    assert table.index.tolist() == [(1, 0.95), (1, 0.99), (10, 0.95), (10, 0.99)]
+    assert table.columns.tolist() == ["VaR", "CVaR"]
+    # One period returns are normal with the portfolio mean and volatility
+    for ci in [0.95, 0.99]:
+        assert (
+            np.abs(table.loc[(1, ci), "VaR"] / portfolio.parametric_var(ci) - 1) < 0.02
+        )
+        cvar = portfolio.mean - portfolio.volatility * stats.norm.pdf(
+            stats.norm.ppf(ci)
+        ) / (1 - ci)
+        assert np.abs(table.loc[(1, ci), "CVaR"] / cvar - 1) < 0.02
+    assert np.all(table["CVaR"] < table["VaR"])
+    assert table.loc[(10, 0.95), "VaR"] < table.loc[(1, 0.95), "VaR"]
+
+
+@pytest.mark.parametrize("method", ["normal", "filtered_historical"])
+def test_monte_carlo_var_reproducible(portfolio, method):
+    kwargs = {"simulations": 5000, "horizon": [1, 3], "method": method, "seed": 4}
+    table = monte_carlo_var(portfolio, chunk_size=1000, **kwargs)
+
+    assert table.equals(
+        monte_carlo_var(portfolio, chunk_size=1000, processes=2, **kwargs)
+    )
+    assert not table.equals(monte_carlo_var(portfolio, chunk_size=700, **kwargs))
+
+
+def test_monte_carlo_var_batch(prices, portfolio):
+    weights = np.array([[0.5, 0.3, 0.2], [0.0, 0.0, 1.0]])
+    batch = BatchAnalytics(prices=prices, weights=weights)
+    table = monte_carlo_var(batch, simulations=100000, seed=1)
+
+    assert table.shape == (1, 4)
+    assert (
+        np.abs(
+            table[("VaR", "Portfolio 0")].iloc[0]
+            / monte_carlo_var(portfolio, simulations=100000, seed=1)["VaR"].iloc[0]
+            - 1
+        )
+        < 0.02
+    )
+    assert table[("VaR", "Portfolio 1")].iloc[0] < table[("VaR", "Portfolio 0")].iloc[0]
+
+
+def test_filtered_model():
+    rng = np.random.default_rng(3)
+    # Volatility doubles in the second half, residuals stay close to unit variance
+    returns = np.concatenate(
+        [rng.normal(0, 0.01, (500, 2)), rng.normal(0, 0.02, (500, 2))]
+    )
+    mean, residuals, forecast = _stats.filtered_model(returns)
+
+    assert residuals.shape == returns.shape
+    assert np.all(np.abs(residuals[100:].std(axis=0) - 1) < 0.1)
+    assert np.all(np.abs(np.sqrt(forecast) / 0.02 - 1) < 0.3)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"ci": 95},
+        {"ci": [0.9, 1.0]},
+        {"horizon": 0},
+        {"horizon": 1.5},
+        {"method": "historical"},
+        {"decay": 1},
+        {"simulations": 0},
+    ],
+)
+def test_monte_carlo_var_arguments(portfolio, kwargs):
+    with pytest.raises(ValueError):
+        monte_carlo_var(portfolio, **kwargs)
@@ -0,0 +1,121 @@
+import pytest
+import numpy as np
+import pandas as pd
+from portan import Analytics, BatchAnalytics, PERIODS
+
+
+@pytest.fixture
+def prices(make_prices):
+    rows = pd.bdate_range("2005-01-03", "2016-12-30").shape[0]
+    prices = make_prices(rows, 3, 13, start="2005-01-03")
+
+    return prices
+
+
+@pytest.fixture
+def portfolio(prices):
+    portfolio = Analytics(
+        prices=prices[["A", "B"]],
+        weights=[0.6, 0.4],
+        benchmark_prices=prices[["C"]],
+        benchmark_weights=[1],
+        fetch_info=False,
+    )
+
+    return portfolio
+
+
+def test_stress_test(portfolio):
+    table = portfolio.stress_test()
+
+    # Periods before 2005 or after 2016 are left out
+    assert "Black Monday" not in table.index
+    assert "COVID Market Crash" not in table.index
+    assert "GFC Crash" in table.index
+    for period in ["GFC Crash", "August 2007", "Flash Crash of 2010", "Fall 2015"]:
+        start, end = PERIODS[period]
+        dates = (portfolio.returns.index >= start) & (portfolio.returns.index < end)
+        returns = portfolio.returns[dates].iloc[:, 0]
+        benchmark_returns = portfolio.benchmark_returns[dates].iloc[:, 0]
+        levels = np.concatenate([[1], np.cumprod(1 + returns)])
+        up = benchmark_returns > 0
+        row = table.loc[period]
+
+        assert row["Observations"] == returns.shape[0]
+        assert np.abs(row["Return"] - (np.prod(1 + returns) - 1)) < 1e-10
+        if returns.shape[0] > 1:
+            assert np.abs(row["Volatility"] - returns.std()) < 1e-10
+        assert (
+            np.abs(
+                row["Maximum Drawdown"]
+                + np.min(levels / np.maximum.accumulate(levels) - 1)
+            )
+            < 1e-10
+        )
+        assert (
+            np.abs(row["Benchmark Return"] - (np.prod(1 + benchmark_returns) - 1))
+            < 1e-10
+        )
+        if up.any():
+            assert (
+                np.abs(
+                    row["Up-market Capture"]
+                    - returns[up].mean() / benchmark_returns[up].mean()
+                )
+                < 1e-10
+            )
+        if (~up).any():
+            assert (
+                np.abs(
+                    row["Down-market Capture"]
+                    - returns[~up].mean() / benchmark_returns[~up].mean()
+                )
+                < 1e-10
+            )
+
+
+def test_stress_test_custom_periods(portfolio):
+    periods = {
+        "Whole": (pd.Timestamp("2000-01-01"), pd.Timestamp("2030-01-01")),
+        "Empty": (pd.Timestamp("1990-01-01"), pd.Timestamp("1991-01-01")),
+    }
+    table = portfolio.stress_test(periods)
+
+    assert table.index.tolist() == ["Whole"]
+    assert np.abs(table.loc["Whole", "Volatility"] - portfolio.volatility) < 1e-10
+    assert (
+        np.abs(table.loc["Whole", "Maximum Drawdown"] - portfolio.maximum_drawdown())
+        < 1e-10
+    )
+
+
+def test_batch_stress_test(prices, portfolio):
+    weights = np.array([[0.6, 0.4], [0.0, 1.0]])
+    batch = BatchAnalytics(
+        prices=prices[["A", "B"]],
+        weights=weights,
+        benchmark_prices=prices[["C"]],
+        benchmark_weights=[1],
+    )
+    table = batch.stress_test()
+    single = portfolio.stress_test()
+
+    assert table.index.tolist() == single.index.tolist()
+    assert table.shape[1] == 2 * single.shape[1]
+    for column in single.columns:
+        assert np.all(
+            np.abs(table[(column, "Portfolio 0")] - single[column]).fillna(0) < 1e-10
+        )
+
+
+@pytest.mark.parametrize(
+    "periods",
+    [
+        [("2008-01-01", "2009-01-01")],
+        {"Reversed": (pd.Timestamp("2009-01-01"), pd.Timestamp("2008-01-01"))},
+        {"Single": (pd.Timestamp("2009-01-01"),)},
+    ],
+)
+def test_stress_test_arguments(portfolio, periods):
+    with pytest.raises(ValueError):
+        portfolio.stress_test(periods)
@@ -0,0 +1,133 @@
+import pytest
+import numpy as np
+from portan import Analytics, BatchAnalytics, _stats
+
+
+@pytest.fixture
+def portfolio(make_prices):
+    prices = make_prices(800, 3, 8, start="2016-01-01")
+    portfolio = Analytics(prices=prices, weights=[0.5, 0.3, 0.2], fetch_info=False)
+
+    return portfolio
+
+
+@pytest.fixture
+def batch():
+    rng = np.random.default_rng(9)
+    returns = rng.normal(0.0004, 0.012, (600, 5))
+    batch = BatchAnalytics.from_returns(returns)
+
+    return batch
+
+
+def test_partial_moments():
+    rng = np.random.default_rng(10)
+    returns = rng.normal(0.0005, 0.01, (500, 3))
+    # Thresholds on, below and above all observations
+    thresholds = np.concatenate([[-1, returns[7, 0], 0, 0.001], [1]])
+    moments = np.array([1, 2, 3, 4])
+    lower, higher, below = _stats.partial_moments(returns, thresholds, moments)
+
+    assert lower.shape == (5, 4, 3)
+    assert np.all(lower[0] == 0)
+    assert np.all(higher[-1] == 0)
+    for i, threshold in enumerate(thresholds):
+        assert np.all(below[i] == np.sum(returns <= threshold, axis=0))
+        for j, moment in enumerate(moments):
+            lpm = _stats.lpm(returns, threshold, moment)
+            hpm = _stats.hpm(returns, threshold, moment)
+            assert np.all(np.abs(lower[i, j] - lpm) <= 1e-10 * np.maximum(lpm, 1e-12))
+            assert np.all(np.abs(higher[i, j] - hpm) <= 1e-10 * np.maximum(hpm, 1e-12))
+
+
+@pytest.mark.parametrize(
+    "annual, compounding", [(True, True), (True, False), (False, True)]
+)
+def test_sweep(portfolio, annual, compounding):
+    annual_rfr = np.array([0.0, 0.02, 0.05])
+    annual_mar = np.linspace(-0.1, 0.2, 7)
+    moment = [1, 3]
+    grid = portfolio.sweep(
+        annual_rfr=annual_rfr,
+        annual_mar=annual_mar,
+        moment=moment,
+        annual=annual,
+        compounding=compounding,
+    )
+
+    assert grid.shape == (42, len(_stats.SWEEP_METRICS))
+    assert grid.index.names == ["annual_rfr", "annual_mar", "moment"]
+    for rfr, mar, m in [
+        (0.0, annual_mar[0], 1),
+        (0.02, annual_mar[3], 3),
+        (0.05, 0.2, 3),
+    ]:
+        row = grid.loc[(rfr, mar, m)]
+        expected = {
+            "excess_mar": portfolio.excess_mar(mar, annual, compounding),
+            "sharpe": portfolio.sharpe(rfr, annual, compounding),
+            "sortino": portfolio.sortino(mar, rfr, annual, compounding),
+            "kappa": portfolio.kappa(mar, m, annual, compounding),
+            "omega_ratio": portfolio.omega_ratio(annual_mar=mar),
+            "omega_sharpe_ratio": portfolio.omega_sharpe_ratio(mar),
+            "upside_frequency": portfolio.upside_frequency(mar),
+            "downside_frequency": portfolio.downside_frequency(mar),
+            "lpm": portfolio.lpm(mar, m),
+            "hpm": portfolio.hpm(mar, m),
+            "upside_risk": portfolio.upside_risk(mar),
+            "downside_variance": portfolio.downside_variance(mar),
+            "volatility_skewness": portfolio.volatility_skewness(mar),
+        }
+        for metric, value in expected.items():
+            assert np.abs(row[metric] - value) < 1e-10 * max(1, np.abs(value))
+
+
+def test_sweep_scalars(portfolio):
+    grid = portfolio.sweep(metrics=["sharpe", "omega_ratio"])
+
+    assert grid.shape == (1, 2)
+    assert np.abs(grid["sharpe"].iloc[0] - portfolio.sharpe()) < 1e-10
+    assert np.abs(grid["omega_ratio"].iloc[0] - portfolio.omega_ratio()) < 1e-10
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_batch_sweep(batch, processes):
+    annual_rfr = [0.01, 0.03]
+    annual_mar = np.linspace(0, 0.1, 5)
+    grid = batch.sweep(
+        metrics=["sharpe", "sortino", "kappa", "upside_frequency"],
+        annual_rfr=annual_rfr,
+        annual_mar=annual_mar,
+        moment=[2, 3],
+        processes=processes,
+    )
+
+    assert grid.shape == (20, 20)
+    assert grid.columns.get_level_values(1)[:5].tolist() == batch.names
+    row = grid.loc[(0.03, annual_mar[2], 2)]
+    for metric, value in {
+        "sharpe": batch.sharpe(0.03),
+        "sortino": batch.sortino(annual_mar[2], 0.03),
+        "kappa": batch.kappa(annual_mar[2], 2),
+        "upside_frequency": batch.upside_frequency(annual_mar[2]),
+    }.items():
+        assert np.all(
+            np.abs(row[metric].to_numpy() - value)
+            < 1e-10 * np.maximum(1, np.abs(value))
+        )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"metrics": ["calmar"]},
+        {"annual_rfr": [0.01, np.nan]},
+        {"annual_mar": "0.03"},
+        {"moment": 0},
+        {"moment": [1.5]},
+        {"annual": 1},
+    ],
+)
+def test_sweep_arguments(portfolio, kwargs):
+    with pytest.raises(ValueError):
+        portfolio.sweep(**kwargs)
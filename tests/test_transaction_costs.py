@@ -0,0 +1,111 @@
+import pytest
+import numpy as np
+from portan import Analytics
+
+
+@pytest.fixture
+def prices(make_prices):
+    prices = make_prices(800, 3, 24, mean=0.0004, volatility=0.012)
+
+    return prices
+
+
+@pytest.fixture
+def portfolio(prices):
+    portfolio = Analytics(
+        prices=prices,
+        weights=[0.5, 0.3, 0.2],
+        fetch_info=False,
+        rebalancing="monthly",
+        threshold=0.01,
+    )
+
+    return portfolio
+
+
+def loop_costs(prices, weights, bps, spreads, fees):
+    # Reference simulation, one observation at a time
+    values = prices.to_numpy()
+    weights = np.array(weights)
+    periods = prices.index.to_period("M")
+    holdings = 10000 * weights / values[0]
+    aum, costs, paid = [], [], 0
+    for t in range(values.shape[0]):
+        if t > 0 and periods[t] != periods[t - 1]:
+            total = holdings @ values[t]
+            traded = np.abs(weights - holdings * values[t] / total)
+            if traded.max() > 0.01:
+                cost = total * traded @ (bps + spreads) / 10000
+                cost += fees * np.count_nonzero(traded)
+                paid += cost
+                holdings = weights * (total - cost) / values[t]
+        aum.append(holdings @ values[t])
+        costs.append(paid)
+
+    return np.array(aum), np.array(costs)
+
+
+def test_transaction_costs(prices, portfolio):
+    spreads = np.array([5.0, 2.0, 20.0])
+    aum, costs = loop_costs(prices, [0.5, 0.3, 0.2], 10, spreads, 3)
+    net_returns = portfolio.net_returns(bps=10, spreads=spreads, fees=3)
+
+    assert net_returns.columns.tolist() == [portfolio.name]
+    assert np.all(np.abs(net_returns.iloc[:, 0] - (aum[1:] / aum[:-1] - 1)) < 1e-12)
+    assert np.all(
+        np.abs(portfolio.transaction_costs(10, spreads, 3).iloc[:, 0] - costs) < 1e-8
+    )
+    assert (
+        np.abs(
+            portfolio.net_return(bps=10, spreads=spreads, fees=3) - (aum[-1] - 10000)
+        )
+        < 1e-8
+    )
+
+
+def test_transaction_costs_zero(portfolio):
+    assert np.all(np.abs(portfolio.net_returns() - portfolio.returns) < 1e-12)
+    assert np.all(portfolio.transaction_costs() == 0)
+    assert portfolio.net_return() == portfolio.final_aum - portfolio.initial_aum
+
+
+def test_transaction_costs_assumptions(portfolio):
+    bps = np.linspace(0, 100, 50)
+    net_returns = portfolio.net_returns(bps=bps, fees=1)
+    costs = portfolio.transaction_costs(bps=bps, fees=1)
+
+    assert net_returns.shape == (portfolio.returns.shape[0], 50)
+    assert costs.shape == (portfolio.prices.shape[0], 50)
+    for i in [0, 17, 49]:
+        assert np.all(
+            np.abs(
+                net_returns.iloc[:, i]
+                - portfolio.net_returns(bps[i], fees=1).iloc[:, 0]
+            )
+            < 1e-12
+        )
+    # Final AUM decreases with the proportional costs
+    net_return = portfolio.net_return(bps=bps, fees=1)
+    assert np.all(np.diff(net_return) < 0)
+    assert np.all(np.diff(costs.iloc[-1]) > 0)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"bps": -1},
+        {"spreads": [1, 2]},
+        {"bps": [1, 2], "fees": [1, 2, 3]},
+        {"fees": [[1]]},
+    ],
+)
+def test_transaction_costs_arguments(portfolio, kwargs):
+    with pytest.raises(ValueError):
+        portfolio.net_returns(**kwargs)
+
+
+def test_transaction_costs_without_rebalancing(prices):
+    portfolio = Analytics(prices=prices, weights=[0.5, 0.3, 0.2], fetch_info=False)
+
+    with pytest.raises(ValueError):
+        portfolio.net_returns(bps=10)
@@ -0,0 +1,58 @@
+import pytest
+import numpy as np
+from portan import Analytics
+
+
+@pytest.fixture
+def prices(make_prices):
+    prices = make_prices(1000, 3, 8)
+
+    return prices
+
+
+def analytics(prices, **kwargs):
+    return Analytics(
+        prices=prices,
+        weights=[0.2, 0.3, 0.5],
+        fetch_info=False,
+        chunk_size=100,
+        **kwargs
+    )
+
+
+@pytest.mark.parametrize("validate", ["full", "fast", "none"])
+def test_clean_prices(prices, validate):
+    reference = analytics(prices)
+    portfolio = analytics(prices, validate=validate)
+
+    assert portfolio.prices.shape == prices.shape
+    assert np.abs(portfolio.sharpe() - reference.sharpe()) < 1e-15
+
+
+@pytest.mark.parametrize("validate", ["full", "fast"])
+def test_dirty_prices(prices, validate):
+    leading = prices.copy()
+    leading.iloc[:250, 1] = np.nan
+    with pytest.warns(UserWarning):
+        portfolio = analytics(leading, validate=validate)
+    assert portfolio.prices.shape[0] == 750
+
+    trailing = prices.copy()
+    trailing.iloc[-1, 0] = np.nan
+    with pytest.raises(ValueError):
+        analytics(trailing, validate=validate)
+
+    infinite = prices.copy()
+    infinite.iloc[500, 2] = np.inf
+    with pytest.raises(ValueError):
+        analytics(infinite, validate=validate)
+
+
+def test_skip_validation(prices):
+    infinite = prices.copy()
+    infinite.iloc[500, 2] = np.inf
+    portfolio = analytics(infinite, validate="none")
+
+    assert portfolio.prices.shape == prices.shape
+    with pytest.raises(ValueError):
+        analytics(prices, validate="partial")